@@ -0,0 +1,421 @@
+"""Process-wide adaptive concurrency for Earth Engine downloads.
+
+One controller exists per (endpoint, account) pair and is shared by every
+``download_multiple_sits_async`` call in the process, including concurrent API
+jobs running on different event loops. The learned limit, 429 history and
+latency EWMA therefore survive between calls, and parallel jobs draw from a
+single budget instead of each assuming it owns the full limit.
+
+How the limit moves is delegated to a ``LimitAlgorithm``: ``AIMDLimit`` reacts
+to 429s and success counts, ``GradientLimit`` also backs off when chunk
+latency climbs above its long-term baseline. ``AGRIGEE_CONCURRENCY_LIMITER``
+selects the algorithm for new controllers.
+
+Set ``AGRIGEE_CONCURRENCY_STATE_PATH`` to persist the learned state as JSON so
+that a restarted process resumes from the last known safe concurrency.
+"""
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import json
+import logging
+import math
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+from agrigee_lite.config import (
+    ASYNC_AIMD_INITIAL_DOWNLOADS,
+    ASYNC_AIMD_SUCCESS_STRIDE,
+    ASYNC_CONCURRENCY_LIMITER,
+    ASYNC_CONCURRENCY_STATE_PATH,
+    ASYNC_GRADIENT_INITIAL_DOWNLOADS,
+)
+
+logger = logging.getLogger(__name__)
+
+_RATE_LIMIT_HISTORY_SECONDS = 3600.0
+_LATENCY_EWMA_ALPHA = 0.2
+# A burst of 429s from requests that were already in flight counts as one congestion signal.
+_MIN_DECREASE_INTERVAL_SECONDS = 1.0
+
+
+class LimitAlgorithm(abc.ABC):
+    """
+    Policy deciding how a controller's concurrency limit moves.
+
+    Implementations return the new (possibly fractional) limit; the controller
+    clamps it to its bounds. Calls are serialized by the controller's lock.
+    """
+
+    name = ""
+
+    @abc.abstractmethod
+    def on_success(self, limit: float, latency: float | None, inflight: int) -> float:
+        """Return the limit after a chunk finished in ``latency`` seconds with ``inflight`` requests running."""
+
+    def on_rate_limit(self, limit: float) -> float:
+        return limit / 2
+
+    def to_state(self) -> dict[str, Any]:
+        return {}
+
+    def restore_state(self, state: dict[str, Any]) -> None:  # noqa: B027 - optional hook, stateless by default
+        pass
+
+
+class AIMDLimit(LimitAlgorithm):
+    """Additive increase every ``success_stride`` successes, multiplicative decrease on 429."""
+
+    name = "aimd"
+
+    def __init__(self, success_stride: int = 1) -> None:
+        self._success_stride = success_stride
+        self._success_count = 0
+
+    def on_success(self, limit: float, latency: float | None, inflight: int) -> float:
+        self._success_count += 1
+        if self._success_count % self._success_stride == 0:
+            return math.floor(limit) + 1
+        return limit
+
+    def on_rate_limit(self, limit: float) -> float:
+        return math.floor(limit) // 2
+
+
+class GradientLimit(LimitAlgorithm):
+    """
+    Latency-gradient limiter in the style of Netflix's Gradient2.
+
+    Each chunk RTT feeds a short-term average that is compared with a slow
+    long-term baseline. While ``tolerance * long / short`` stays at or above 1
+    the limit grows by a queue allowance of ``sqrt(limit)`` per round trip; once
+    the backend slows down the gradient drops below 1 and the limit shrinks in
+    proportion, usually well before Earth Engine starts answering with 429s.
+
+    Parameters
+    ----------
+    tolerance : float, optional
+        Latency inflation accepted before backing off, by default 1.5.
+    smoothing : float, optional
+        Share of the step towards each new estimate taken per round trip, by default 1.0.
+    short_window : int, optional
+        Samples in the short-term RTT average, by default 5.
+    long_window : int, optional
+        Samples in the long-term RTT baseline, by default 100.
+    """
+
+    name = "gradient"
+
+    def __init__(
+        self,
+        tolerance: float = 1.5,
+        smoothing: float = 1.0,
+        short_window: int = 5,
+        long_window: int = 100,
+    ) -> None:
+        self._tolerance = tolerance
+        self._smoothing = smoothing
+        self._short_alpha = 2 / (short_window + 1)
+        self._long_alpha = 2 / (long_window + 1)
+        self._short_rtt: float | None = None
+        self._long_rtt: float | None = None
+
+    def on_success(self, limit: float, latency: float | None, inflight: int) -> float:
+        if latency is None or latency <= 0:
+            return limit
+        if self._short_rtt is None or self._long_rtt is None:
+            self._short_rtt = self._long_rtt = latency
+        else:
+            self._short_rtt += self._short_alpha * (latency - self._short_rtt)
+            # Queueing delay must not leak into the baseline, or the limit creeps up with it. A lone
+            # request cannot be queued behind our own traffic, so it always counts.
+            if self._short_rtt <= self._tolerance * self._long_rtt or inflight <= 1:
+                self._long_rtt += self._long_alpha * (latency - self._long_rtt)
+            # Let the baseline recover quickly after a period of congestion.
+            if self._long_rtt / self._short_rtt > 2:
+                self._long_rtt *= 0.95
+
+        # Too little traffic to judge whether more concurrency would help.
+        if inflight < limit / 2:
+            return limit
+
+        gradient = max(0.5, min(1.0, self._tolerance * self._long_rtt / self._short_rtt))
+        estimate = limit * gradient + math.sqrt(limit)
+        # About ``limit`` samples arrive per round trip, so each closes 1/limit of the step.
+        weight = min(1.0, self._smoothing / limit)
+        return limit * (1 - weight) + estimate * weight
+
+    def to_state(self) -> dict[str, Any]:
+        return {"long_rtt": self._long_rtt}
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        long_rtt = state.get("long_rtt")
+        if long_rtt is not None:
+            self._long_rtt = self._short_rtt = float(long_rtt)
+
+
+def make_limit_algorithm(name: str) -> LimitAlgorithm:
+    """Build the limit algorithm registered under ``name`` (``"aimd"`` or ``"gradient"``)."""
+    if name == GradientLimit.name:
+        return GradientLimit()
+    if name == AIMDLimit.name:
+        return AIMDLimit(ASYNC_AIMD_SUCCESS_STRIDE)
+    raise ValueError(f"Unknown concurrency limiter {name!r}; expected 'aimd' or 'gradient'.")
+
+
+class AdaptiveConcurrencyController:
+    """
+    Adaptive concurrency limiter shared across calls and event loops.
+
+    Slots are granted in FIFO order to waiters from any event loop; all
+    bookkeeping happens under a thread lock. ``algorithm`` decides how the
+    limit reacts to successes (with their latency) and rate-limit responses.
+
+    Parameters
+    ----------
+    key : str
+        Registry key, ``"<endpoint>|<account>"``.
+    initial : int
+        Starting limit when no learned state is available.
+    minimum : int
+        Lower bound for the limit.
+    maximum : int
+        Upper bound for the limit.
+    algorithm : LimitAlgorithm, optional
+        Limit policy, by default ``AIMDLimit()``.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        algorithm: LimitAlgorithm | None = None,
+    ) -> None:
+        self.key = key
+        self.algorithm = algorithm or AIMDLimit()
+        self._minimum = minimum
+        self._maximum = max(minimum, maximum)
+        self._limit = float(min(max(initial, minimum), self._maximum))
+        self._active = 0
+        self._waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = deque()
+        self._rate_limits: deque[float] = deque()
+        self._latency_ewma: float | None = None
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+
+    async def __aenter__(self) -> AdaptiveConcurrencyController:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._active < int(self._limit) and not self._waiters:
+                self._active += 1
+                return self
+            waiter: asyncio.Future[None] = loop.create_future()
+            self._waiters.append((loop, waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                if (loop, waiter) in self._waiters:
+                    self._waiters.remove((loop, waiter))
+                    raise
+            # The slot was granted before the cancellation landed; hand it back.
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            raise
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        self._release()
+
+    def _release(self) -> None:
+        with self._lock:
+            self._active -= 1
+            self._wake_locked()
+
+    def _wake_locked(self) -> None:
+        while self._waiters and self._active < int(self._limit):
+            loop, waiter = self._waiters.popleft()
+            if waiter.done() or loop.is_closed():
+                continue
+            self._active += 1
+            loop.call_soon_threadsafe(self._grant, waiter)
+
+    def _grant(self, waiter: asyncio.Future[None]) -> None:
+        if waiter.done():
+            # Cancelled between being popped and being granted.
+            self._release()
+        else:
+            waiter.set_result(None)
+
+    async def on_success(self, latency: float | None = None) -> None:
+        with self._lock:
+            if latency is not None:
+                self._latency_ewma = (
+                    latency
+                    if self._latency_ewma is None
+                    else (1 - _LATENCY_EWMA_ALPHA) * self._latency_ewma + _LATENCY_EWMA_ALPHA * latency
+                )
+            self._set_limit_locked(self.algorithm.on_success(self._limit, latency, self._active))
+
+    async def on_rate_limit(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._record_rate_limit_locked(time.time())
+            if now - self._last_decrease < max(_MIN_DECREASE_INTERVAL_SECONDS, self._latency_ewma or 0.0):
+                return
+            self._last_decrease = now
+            self._set_limit_locked(self.algorithm.on_rate_limit(self._limit))
+
+    def _set_limit_locked(self, limit: float) -> None:
+        previous = self._limit
+        self._limit = min(max(limit, self._minimum), self._maximum)
+        if int(self._limit) > int(previous):
+            self._wake_locked()
+
+    def _record_rate_limit_locked(self, at: float) -> None:
+        self._rate_limits.append(at)
+        while self._rate_limits and self._rate_limits[0] < at - _RATE_LIMIT_HISTORY_SECONDS:
+            self._rate_limits.popleft()
+
+    def ensure_maximum(self, maximum: int) -> None:
+        """Widen the upper bound so a call asking for more parallelism can ramp up to it."""
+        with self._lock:
+            if maximum > self._maximum:
+                self._maximum = maximum
+                self._wake_locked()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def latency_ewma(self) -> float | None:
+        return self._latency_ewma
+
+    def recent_rate_limits(self, window: float = _RATE_LIMIT_HISTORY_SECONDS) -> int:
+        """Number of rate-limit responses seen in the last ``window`` seconds."""
+        cutoff = time.time() - window
+        with self._lock:
+            return sum(1 for at in self._rate_limits if at >= cutoff)
+
+    def to_state(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "limit": self._limit,
+                "algorithm": self.algorithm.name,
+                "algorithm_state": self.algorithm.to_state(),
+                "latency_ewma": self._latency_ewma,
+                "rate_limits": list(self._rate_limits),
+                "updated_at": time.time(),
+            }
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        with self._lock:
+            self._limit = min(max(float(state.get("limit", self._limit)), self._minimum), self._maximum)
+            if state.get("algorithm") == self.algorithm.name:
+                self.algorithm.restore_state(state.get("algorithm_state") or {})
+            latency = state.get("latency_ewma")
+            self._latency_ewma = float(latency) if latency is not None else None
+            for at in sorted(float(t) for t in state.get("rate_limits", [])):
+                self._record_rate_limit_locked(at)
+            self._wake_locked()
+
+
+_controllers: dict[str, AdaptiveConcurrencyController] = {}
+_persisted_state: dict[str, dict[str, Any]] | None = None
+_registry_lock = threading.Lock()
+
+
+def _state_path() -> Path | None:
+    return Path(ASYNC_CONCURRENCY_STATE_PATH) if ASYNC_CONCURRENCY_STATE_PATH else None
+
+
+def _load_persisted_state_locked() -> dict[str, dict[str, Any]]:
+    global _persisted_state
+    if _persisted_state is None:
+        _persisted_state = {}
+        path = _state_path()
+        if path is not None and path.exists():
+            try:
+                _persisted_state = json.loads(path.read_text())
+            except (OSError, ValueError):
+                logger.warning("Ignoring unreadable concurrency state file %s.", path, exc_info=True)
+    return _persisted_state
+
+
+def get_concurrency_controller(endpoint: str, account: str, maximum: int) -> AdaptiveConcurrencyController:
+    """
+    Return the shared controller for ``endpoint`` and ``account``, creating it on first use.
+
+    Parameters
+    ----------
+    endpoint : str
+        Earth Engine API base URL the downloads are charged against.
+    account : str
+        Identifier of the credentials in use (service account e-mail or project).
+    maximum : int
+        Largest concurrency the caller wants; an existing controller is widened to it.
+
+    Returns
+    -------
+    AdaptiveConcurrencyController
+        Controller seeded from persisted state when ``AGRIGEE_CONCURRENCY_STATE_PATH`` is set.
+    """
+    key = f"{endpoint}|{account}"
+    with _registry_lock:
+        controller = _controllers.get(key)
+        if controller is None:
+            algorithm = make_limit_algorithm(ASYNC_CONCURRENCY_LIMITER)
+            initial = ASYNC_GRADIENT_INITIAL_DOWNLOADS if algorithm.name == "gradient" else ASYNC_AIMD_INITIAL_DOWNLOADS
+            controller = AdaptiveConcurrencyController(
+                key,
+                initial=min(initial, maximum),
+                minimum=1,
+                maximum=maximum,
+                algorithm=algorithm,
+            )
+            state = _load_persisted_state_locked().get(key)
+            if state is not None:
+                controller.restore_state(state)
+            _controllers[key] = controller
+            return controller
+    controller.ensure_maximum(maximum)
+    return controller
+
+
+def save_concurrency_state() -> None:
+    """Write every controller's learned state to ``AGRIGEE_CONCURRENCY_STATE_PATH``, if set."""
+    path = _state_path()
+    if path is None:
+        return
+    with _registry_lock:
+        state = _load_persisted_state_locked()
+        state.update({key: controller.to_state() for key, controller in _controllers.items()})
+        payload = json.dumps(state, indent=2)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(payload)
+        os.replace(tmp, path)
+    except OSError:
+        logger.warning("Could not persist concurrency state to %s.", path, exc_info=True)
+
+
+def reset_concurrency_controllers() -> None:
+    """Forget all in-memory controllers; persisted state is re-read on next use."""
+    global _persisted_state
+    with _registry_lock:
+        _controllers.clear()
+        _persisted_state = None
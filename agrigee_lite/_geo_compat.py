@@ -1,23 +1,37 @@
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
+import threading
+import weakref
+from collections import OrderedDict
 from typing import Any, cast
 
 import geopandas as gpd
 import geopolars as gpl
+import numpy as np
 import polars as pl
 import pyproj
+import shapely
 from shapely import from_wkb
 from shapely.geometry import mapping
 from shapely.geometry.base import BaseGeometry
-from shapely.ops import transform
 
 GeoDataFrameLike = gpd.GeoDataFrame | gpl.GeoDataFrame | pl.DataFrame
 NormalizedGeoDataFrame = gpl.GeoDataFrame
 
 _CRS_ATTR = "_agrigee_crs"
 
+# Reprojected GeoPolars frames, keyed by the identity of their source frame.
+# Frames can still be changed in place (replace_column, __setitem__), so an
+# entry also holds a digest of the source's row hashes, which costs a small
+# fraction of the reprojection it saves.
+_REPROJECTED_SIZE = 16
+_reprojected: OrderedDict[int, tuple[weakref.ref[gpl.GeoDataFrame], tuple[Any, ...], gpl.GeoDataFrame]] = OrderedDict()
+# Reentrant: a source collected while the lock is held runs its weakref callback, which takes it too.
+_reprojected_lock = threading.RLock()
+
 
 def _serialize_crs(crs: Any) -> str | None:
     if crs is None:
@@ -34,8 +48,9 @@ def _coerce_geopandas_to_crs(gdf: gpd.GeoDataFrame, crs: str | None) -> gpd.GeoD
     if gdf.crs is None and crs is None:
         raise ValueError("Input geodataframe must define a CRS or pass crs=... before conversion.")
 
-    if crs is None:
-        return gdf.copy()
+    # The frame is only read by the conversion, so it is not copied first.
+    if crs is None or gdf.crs == crs:
+        return gdf
 
     if gdf.crs is None:
         return gdf.set_crs(crs, allow_override=True)
@@ -43,6 +58,36 @@ def _coerce_geopandas_to_crs(gdf: gpd.GeoDataFrame, crs: str | None) -> gpd.GeoD
     return gdf.to_crs(crs)
 
 
+def _reprojection_fingerprint(gdf: gpl.GeoDataFrame, crs: str) -> tuple[Any, ...]:
+    rows = hashlib.blake2b(gdf.hash_rows().to_numpy().tobytes(), digest_size=16).digest()
+    return (get_crs(gdf), crs, gdf.height, tuple(gdf.schema.items()), rows)
+
+
+def _cached_reprojection(gdf: gpl.GeoDataFrame, crs: str) -> gpl.GeoDataFrame | None:
+    with _reprojected_lock:
+        entry = _reprojected.get(id(gdf))
+        if entry is None or entry[0]() is not gdf or entry[1] != _reprojection_fingerprint(gdf, crs):
+            return None
+        _reprojected.move_to_end(id(gdf))
+        return entry[2]
+
+
+def _remember_reprojection(gdf: gpl.GeoDataFrame, crs: str, out: gpl.GeoDataFrame) -> None:
+    key = id(gdf)
+
+    def forget(ref: weakref.ref[gpl.GeoDataFrame]) -> None:
+        with _reprojected_lock:
+            entry = _reprojected.get(key)
+            if entry is not None and entry[0] is ref:
+                del _reprojected[key]
+
+    with _reprojected_lock:
+        _reprojected[key] = (weakref.ref(gdf, forget), _reprojection_fingerprint(gdf, crs), out)
+        _reprojected.move_to_end(key)
+        while len(_reprojected) > _REPROJECTED_SIZE:
+            _reprojected.popitem(last=False)
+
+
 def _coerce_geopolars_to_crs(gdf: gpl.GeoDataFrame, crs: str | None) -> gpl.GeoDataFrame:
     source_crs = get_crs(gdf)
     if source_crs is None and crs is None:
@@ -52,14 +97,23 @@ def _coerce_geopolars_to_crs(gdf: gpl.GeoDataFrame, crs: str | None) -> gpl.GeoD
     if target_crs is None:
         raise ValueError("Input geodataframe must define a CRS or pass crs=... before conversion.")
 
-    if crs is None or source_crs is None or str(source_crs) == crs:
+    # A frame already tagged with the target CRS is normalized: hand it back as is.
+    if source_crs is not None and (crs is None or str(source_crs) == crs):
+        return gdf
+
+    if crs is None or source_crs is None:
         return _set_crs_metadata(cast(gpl.GeoDataFrame, gdf.clone()), target_crs)
 
-    intermediate = gdf.to_geopandas()
-    if source_crs is not None:
-        intermediate = intermediate.set_crs(source_crs, allow_override=True)
-    intermediate = intermediate.to_crs(crs)
-    return _set_crs_metadata(cast(gpl.GeoDataFrame, gpl.from_geopandas(intermediate)), crs)
+    cached = _cached_reprojection(gdf, crs)
+    if cached is not None:
+        return cached
+
+    projected = reproject_geometries(shapely.from_wkb(gdf.get_column("geometry").to_numpy()), source_crs, crs)
+    out = wrap_geopolars_frame(
+        gdf.with_columns(pl.Series("geometry", shapely.to_wkb(projected), dtype=pl.Binary)), crs=crs
+    )
+    _remember_reprojection(gdf, crs, out)
+    return out
 
 
 def _coerce_polars_to_geopolars(df: pl.DataFrame, *, crs: str | None, geometry_column: str) -> gpl.GeoDataFrame:
@@ -71,9 +125,9 @@ def _coerce_polars_to_geopolars(df: pl.DataFrame, *, crs: str | None, geometry_c
 def get_crs(gdf: GeoDataFrameLike) -> Any | None:
     if isinstance(gdf, gpd.GeoDataFrame):
         return gdf.crs
-    if isinstance(gdf, pl.DataFrame):
-        return None
-    return getattr(gdf, _CRS_ATTR, None)
+    if isinstance(gdf, gpl.GeoDataFrame):
+        return getattr(gdf, _CRS_ATTR, None)
+    return None
 
 
 def normalize_geodataframe(
@@ -166,6 +220,22 @@ def iter_shapely_geometries(gdf: GeoDataFrameLike) -> list[BaseGeometry]:
     return [geometry_value_to_shapely(geometry) for geometry in cast(gpl.GeoDataFrame, normalized).geometry.to_list()]
 
 
+def shapely_geometry_array(gdf: GeoDataFrameLike) -> np.ndarray:
+    """Decode every geometry of a compatible geo frame into a NumPy array of Shapely objects.
+
+    Unlike ``iter_shapely_geometries`` this decodes the whole WKB column in a
+    single vectorized call, so the result can be fed to Shapely's array API.
+    """
+    if isinstance(gdf, gpd.GeoDataFrame):
+        return np.asarray(gdf.geometry.array, dtype=object)
+
+    if isinstance(gdf, gpl.GeoDataFrame):
+        return shapely.from_wkb(gdf.get_column("geometry").to_numpy())
+
+    normalized = normalize_geodataframe(gdf, crs=get_crs(gdf))
+    return shapely.from_wkb(normalized.get_column("geometry").to_numpy())
+
+
 def geometry_to_geojson(geometry: BaseGeometry | bytes | bytearray | memoryview) -> dict[str, Any]:
     """Convert a geometry scalar into a GeoJSON-ready mapping."""
     return cast(dict[str, Any], mapping(geometry_value_to_shapely(geometry)))
@@ -180,8 +250,40 @@ def transform_geometry(
     if source_crs is None or source_crs == target_crs:
         return geometry
 
-    transformer = pyproj.Transformer.from_crs(source_crs, target_crs, always_xy=True)
-    return cast(BaseGeometry, transform(transformer.transform, geometry))
+    return cast(BaseGeometry, reproject_geometries(np.asarray([geometry], dtype=object), source_crs, target_crs)[0])
+
+
+@functools.lru_cache(maxsize=32)
+def _transformer(source_crs: str, target_crs: str) -> pyproj.Transformer:
+    return pyproj.Transformer.from_crs(source_crs, target_crs, always_xy=True)
+
+
+def reproject_geometries(
+    geometries: np.ndarray,
+    source_crs: Any | None,
+    target_crs: str = "EPSG:4326",
+) -> np.ndarray:
+    """Reproject an array of Shapely geometries with one transform over all of their coordinates."""
+    if source_crs is None or str(source_crs) == target_crs:
+        return geometries
+
+    transformer = _transformer(str(source_crs), target_crs)
+
+    def project(coords: np.ndarray) -> np.ndarray:
+        return np.column_stack(transformer.transform(coords[:, 0], coords[:, 1]))
+
+    def project_z(coords: np.ndarray) -> np.ndarray:
+        return np.column_stack(transformer.transform(coords[:, 0], coords[:, 1], coords[:, 2]))
+
+    # Geometries with Z go through a 3D transform of their own, so heights
+    # survive and 2D geometries never see a NaN height.
+    has_z = shapely.has_z(geometries)
+    if not has_z.any():
+        return shapely.transform(geometries, project)
+    out = np.empty(len(geometries), dtype=object)
+    out[~has_z] = shapely.transform(geometries[~has_z], project)
+    out[has_z] = shapely.transform(geometries[has_z], project_z, include_z=True)
+    return out
 
 
 def to_geojson_features(gdf: GeoDataFrameLike, property_columns: list[str] | None = None) -> list[dict[str, Any]]:
@@ -228,9 +330,11 @@ __all__ = [
     "hash_geometry_row",
     "iter_shapely_geometries",
     "normalize_geodataframe",
+    "reproject_geometries",
     "restore_geodataframe_type",
-    "transform_geometry",
+    "shapely_geometry_array",
     "to_geojson_features",
     "to_geopandas_geodataframe",
+    "transform_geometry",
     "wrap_geopolars_frame",
 ]
@@ -36,6 +36,9 @@ and run multiple uvicorn workers or deploy behind a load balancer.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import logging
 from contextlib import asynccontextmanager
 from typing import AsyncIterator
 
@@ -49,8 +52,26 @@ from fastapi import FastAPI
 
 from agrigee_lite.api._satellites import REGISTRY
 from agrigee_lite.api.routes import router
+from agrigee_lite.config import CACHE_EVICTION_INTERVAL_SECONDS
 from agrigee_lite.ee_utils import _install_uvloop, ee_quick_start
 
+logger = logging.getLogger(__name__)
+
+
+async def _maintain_cache() -> None:
+    """Persist read tracking and evict over-budget cache jobs every CACHE_EVICTION_INTERVAL_SECONDS."""
+    from agrigee_lite.cache import evict_cache
+
+    while True:
+        await asyncio.sleep(CACHE_EVICTION_INTERVAL_SECONDS)
+        try:
+            stats = await asyncio.to_thread(evict_cache)
+        except Exception:
+            logger.exception("Cache eviction pass failed")
+            continue
+        if stats["jobs_evicted"]:
+            logger.info("Evicted %d cache jobs (%d observations)", stats["jobs_evicted"], stats["observations_evicted"])
+
 
 @asynccontextmanager
 async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
@@ -59,7 +80,13 @@ async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
     ee_quick_start()
     init_cache()
     job_store.load_from_db()
-    yield
+    maintenance = asyncio.create_task(_maintain_cache())
+    try:
+        yield
+    finally:
+        maintenance.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await maintenance
 
 
 def create_app() -> FastAPI:
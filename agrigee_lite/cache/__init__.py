@@ -1,12 +1,22 @@
 from agrigee_lite.cache.backend import (
     DEFAULT_DB_PATH,
     clear_cache,
+    compact_cache,
+    compute_sits_run_hash,
     create_api_job,
+    create_sits_run_manifest,
     delete_api_job,
+    delete_sits_run_manifest,
     ensure_api_jobs_table,
+    evict_cache,
+    geometry_index_stats,
     init_cache,
     list_api_jobs,
+    load_sits_run_manifest,
+    migrate_observations_to_parquet,
     print_cache_status,
+    save_sits_run_progress,
+    store_sits_batch_polars,
     store_sits_polars,
     update_api_job,
 )
@@ -14,12 +24,22 @@ from agrigee_lite.cache.backend import (
 __all__ = [
     "DEFAULT_DB_PATH",
     "clear_cache",
+    "compact_cache",
+    "compute_sits_run_hash",
     "create_api_job",
+    "create_sits_run_manifest",
     "delete_api_job",
+    "delete_sits_run_manifest",
     "ensure_api_jobs_table",
+    "evict_cache",
+    "geometry_index_stats",
     "init_cache",
     "list_api_jobs",
+    "load_sits_run_manifest",
+    "migrate_observations_to_parquet",
     "print_cache_status",
+    "save_sits_run_progress",
+    "store_sits_batch_polars",
     "store_sits_polars",
     "update_api_job",
 ]
@@ -1,31 +1,53 @@
 from __future__ import annotations
 
+import bisect
 import contextlib
+import gc
 import hashlib
+import io
 import json
 import logging
+import math
 import os
 import pathlib
+import queue
+import shutil
 import threading
-from collections.abc import Sequence
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future
+from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
-from typing import Any, cast
+from typing import Any, TypeVar, cast
 
 import duckdb
 import h3
+import numpy as np
 import pandas as pd
 import polars as pl
+import shapely
 import sqlalchemy as sa
-from shapely.geometry import Point
 from sqlalchemy.pool import NullPool
 
 from agrigee_lite._geo_compat import (
     GeoDataFrameLike,
-    NormalizedGeoDataFrame,
-    geometry_value_to_shapely,
     normalize_geodataframe,
+    shapely_geometry_array,
 )
-from agrigee_lite.sat.abstract_satellite import AbstractSatellite
+from agrigee_lite.config import (
+    CACHE_BAND_PRECISION,
+    CACHE_EVICTION_BATCH,
+    CACHE_LOOKUP_SIZE,
+    CACHE_LOOKUP_TTL_SECONDS,
+    CACHE_MAX_BYTES,
+    CACHE_MAX_ROWS,
+    CACHE_OBSERVATION_STORE,
+)
+from agrigee_lite.misc import compute_h3_cells
+from agrigee_lite.sat.abstract_satellite import AbstractSatellite, OpticalSatellite
 
 logger = logging.getLogger(__name__)
 
@@ -35,11 +57,24 @@ _PG_DB_NAME = "agrigeelite"
 _duck_conn: duckdb.DuckDBPyConnection | None = None
 _pg_engine: sa.Engine | None = None
 _duck_write_lock = threading.Lock()
+# Set when the DuckDB cache keeps observations as Parquet files instead of tables.
+_duck_observation_root: pathlib.Path | None = None
+_duck_writer: _DuckWriter | None = None
 
 CacheEngine = duckdb.DuckDBPyConnection | sa.Engine
+_T = TypeVar("_T")
 
-_DUCK_SYSTEM = {"geometries", "sits_jobs", "api_jobs"}
-_PG_SYSTEM = {"geometries", "sits_jobs", "api_jobs", "spatial_ref_sys", "geometry_columns"}
+_DUCK_SYSTEM = {"geometries", "sits_jobs", "api_jobs", "sits_run_chunks", "sits_run_rows", "sits_band_storage"}
+_PG_SYSTEM = {
+    "geometries",
+    "sits_jobs",
+    "api_jobs",
+    "sits_run_chunks",
+    "sits_run_rows",
+    "sits_band_storage",
+    "spatial_ref_sys",
+    "geometry_columns",
+}
 
 
 # ---------------------------------------------------------------------------
@@ -53,10 +88,232 @@ def get_engine() -> CacheEngine | None:
     return _pg_engine
 
 
+class _DuckWriter:
+    """Run every write to a DuckDB cache on one thread, in submission order.
+
+    Readers use their own cursors, so a long ingest queued here does not
+    block them; only other writers wait for it.
+    """
+
+    def __init__(self, conn: duckdb.DuckDBPyConnection) -> None:
+        self.conn = conn
+        self._cursor = conn.cursor()
+        self._queue: queue.SimpleQueue[tuple[Future[Any], Callable[[duckdb.DuckDBPyConnection], Any]] | None] = (
+            queue.SimpleQueue()
+        )
+        self._thread = threading.Thread(target=self._run, name="agrigee-duckdb-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, fn: Callable[[duckdb.DuckDBPyConnection], _T]) -> _T:
+        if threading.current_thread() is self._thread:
+            return fn(self._cursor)
+        future: Future[_T] = Future()
+        self._queue.put((future, fn))
+        return future.result()
+
+    def _run(self) -> None:
+        while (item := self._queue.get()) is not None:
+            future, fn = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                with _duck_write_lock:
+                    result = fn(self._cursor)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+        self._cursor.close()
+
+
+def _duck_write(conn: duckdb.DuckDBPyConnection, fn: Callable[[duckdb.DuckDBPyConnection], _T]) -> _T:
+    if _duck_writer is not None and _duck_writer.conn is conn:
+        return _duck_writer.submit(fn)
+    with _duck_write_lock:
+        return fn(conn)
+
+
+@contextlib.contextmanager
+def _duck_reader(conn: duckdb.DuckDBPyConnection) -> Iterator[duckdb.DuckDBPyConnection]:
+    # DuckDB connections are not safe to share between threads. Each read runs
+    # on its own short-lived cursor, so it neither waits for the writer nor
+    # keeps an old snapshot pinned once it is done.
+    cursor = conn.cursor()
+    try:
+        yield cursor
+    finally:
+        cursor.close()
+
+
+def _close_duck_engine() -> None:
+    global _duck_conn, _duck_writer
+    if _duck_writer is not None:
+        _duck_writer.close()
+        _duck_writer = None
+    if _duck_conn is not None:
+        _duck_conn.close()
+        _duck_conn = None
+
+
 def _pg_env_set() -> bool:
     return all(k in os.environ for k in ("AGRIGEE_PG_HOST", "AGRIGEE_PG_USER", "AGRIGEE_PG_PASSWORD"))
 
 
+# ---------------------------------------------------------------------------
+# Geometry index cache
+# ---------------------------------------------------------------------------
+# Single-geometry reads resolve geometry -> geometry id -> covering jobs
+# before touching observations. Hot geometries keep that answer in process,
+# keyed by how the lookup finds the geometry (point coordinates or WKB hash),
+# until a store touches them or the entry outlives its TTL.
+
+_GeometryJobs = tuple[tuple[int, str, str], ...] | None
+
+
+class _GeometryIndexCache:
+    """Bounded LRU, with a TTL, of each geometry's jobs per (satellite, params hash)."""
+
+    def __init__(self, maxsize: int = CACHE_LOOKUP_SIZE, ttl: float = CACHE_LOOKUP_TTL_SECONDS) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[Any, ...], tuple[float, dict[tuple[str, str], _GeometryJobs]]] = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get_or_load(
+        self,
+        geometry_key: tuple[Any, ...],
+        scope: tuple[str, str],
+        load: Callable[[], _GeometryJobs],
+    ) -> _GeometryJobs:
+        if self.maxsize <= 0:
+            return load()
+        with self._lock:
+            entry = self._entries.get(geometry_key)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl and scope in entry[1]:
+                self._entries.move_to_end(geometry_key)
+                self.hits += 1
+                return entry[1][scope]
+            self.misses += 1
+            generation = self._generation
+
+        value = load()
+        with self._lock:
+            # A store that landed while loading may have made the value stale.
+            if generation == self._generation:
+                entry = self._entries.get(geometry_key)
+                if entry is None or time.monotonic() - entry[0] >= self.ttl:
+                    entry = (time.monotonic(), {})
+                    self._entries[geometry_key] = entry
+                entry[1][scope] = value
+                self._entries.move_to_end(geometry_key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, geometry_keys: list[tuple[Any, ...]] | None = None) -> None:
+        """Drop the given geometries, or everything when no keys are given."""
+        with self._lock:
+            self._generation += 1
+            if geometry_keys is None:
+                self._entries.clear()
+            else:
+                for key in geometry_keys:
+                    self._entries.pop(key, None)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+_geometry_indexes: weakref.WeakKeyDictionary[Any, _GeometryIndexCache] = weakref.WeakKeyDictionary()
+_geometry_indexes_lock = threading.Lock()
+
+
+def _geometry_index(engine: CacheEngine) -> _GeometryIndexCache:
+    with _geometry_indexes_lock:
+        index = _geometry_indexes.get(engine)
+        if index is None:
+            index = _geometry_indexes[engine] = _GeometryIndexCache()
+        return index
+
+
+def _geometry_lookup_key(geometry: Any) -> tuple[Any, ...]:
+    if geometry.geom_type == "Point":
+        return ("point", *_repr_point(geometry))
+    return ("hash", _compute_geom_hash(geometry))
+
+
+def _stored_geometry_keys(geometry: Any) -> list[tuple[Any, ...]]:
+    # A stored shape is found by its WKB hash, and also by point lookups on its representative point.
+    return [("point", *_repr_point(geometry)), ("hash", _compute_geom_hash(geometry))]
+
+
+def geometry_index_stats(engine: CacheEngine | None = None) -> dict[str, int]:
+    """Hit/miss counters and size of the in-process geometry index cache of ``engine``."""
+    eng = engine or get_engine()
+    if eng is None:
+        return {"hits": 0, "misses": 0, "entries": 0}
+    return _geometry_index(eng).stats()
+
+
+# ---------------------------------------------------------------------------
+# Job read tracking
+# ---------------------------------------------------------------------------
+# Reads note the jobs they served in process. The notes reach sits_jobs
+# (last_read_at, read_count) in one UPDATE when the log is flushed, which
+# evict_cache does first, so a read never waits on a write.
+
+
+class _AccessLog:
+    """Reads since the last flush: job id -> (last read, read count)."""
+
+    def __init__(self) -> None:
+        self._reads: dict[int, tuple[datetime, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, job_ids: Iterable[int]) -> None:
+        now = datetime.now(UTC)
+        with self._lock:
+            for job_id in job_ids:
+                entry = self._reads.get(job_id)
+                self._reads[job_id] = (now, entry[1] + 1 if entry else 1)
+
+    def drain(self) -> pl.DataFrame:
+        with self._lock:
+            reads, self._reads = self._reads, {}
+        return pl.DataFrame(
+            [(job_id, read_at, count) for job_id, (read_at, count) in reads.items()],
+            schema={"job_id": pl.Int64, "last_read_at": pl.Datetime("us", "UTC"), "reads": pl.Int64},
+            orient="row",
+        )
+
+    def restore(self, frame: pl.DataFrame) -> None:
+        """Put back reads whose flush failed."""
+        with self._lock:
+            for job_id, read_at, count in frame.iter_rows():
+                entry = self._reads.get(job_id)
+                self._reads[job_id] = (max(read_at, entry[0]), entry[1] + count) if entry else (read_at, count)
+
+
+_access_logs: weakref.WeakKeyDictionary[Any, _AccessLog] = weakref.WeakKeyDictionary()
+_access_logs_lock = threading.Lock()
+
+
+def _access_log(engine: CacheEngine) -> _AccessLog:
+    with _access_logs_lock:
+        log = _access_logs.get(engine)
+        if log is None:
+            log = _access_logs[engine] = _AccessLog()
+        return log
+
+
 # ---------------------------------------------------------------------------
 # Shared helpers
 # ---------------------------------------------------------------------------
@@ -73,7 +330,7 @@ def _compute_job_hash(geom_hash: str, params_hash: str, start_date: str, end_dat
     return hashlib.sha1(f"{geom_hash}|{params_hash}|{start_date}|{end_date}".encode()).hexdigest()  # noqa: S324
 
 
-def _compute_params_hash(
+def compute_params_hash(
     satellite: AbstractSatellite,
     reducers: set[str] | None,
     subsampling_max_pixels: float,
@@ -151,6 +408,109 @@ def _get_band_columns(satellite: AbstractSatellite) -> list[str]:
     return []
 
 
+_INT16_LIMIT = 32767
+
+
+@dataclass(frozen=True)
+class _BandStorage:
+    """How the band columns of one satellite table are stored.
+
+    ``int16`` keeps ``round((value - add_offset) / scale_factor)``; values are
+    decoded back to doubles when read. A value outside the SMALLINT range
+    raises instead of being clipped.
+    """
+
+    kind: str = "float64"
+    scale_factor: float = 1.0
+    add_offset: float = 0.0
+
+    def sql_type(self, postgres: bool = False) -> str:
+        if self.kind == "int16":
+            return "SMALLINT"
+        if self.kind == "float32":
+            return "REAL"
+        return "DOUBLE PRECISION" if postgres else "DOUBLE"
+
+    def decode_sql(self, column: str, alias: str) -> str:
+        if self.kind == "int16":
+            return f'CAST({column} AS DOUBLE PRECISION) * {self.scale_factor!r} + {self.add_offset!r} AS "{alias}"'
+        if self.kind == "float32":
+            return f'CAST({column} AS DOUBLE PRECISION) AS "{alias}"'
+        return f'{column} AS "{alias}"'
+
+    def encode_value(self, value: float) -> float | int:
+        if self.kind != "int16":
+            return value
+        scaled = (value - self.add_offset) / self.scale_factor
+        if not abs(scaled) <= _INT16_LIMIT:
+            raise self._overflow_error()
+        return round(scaled)
+
+    def encode(self, df: pl.DataFrame, band_cols: list[str]) -> pl.DataFrame:
+        if self.kind == "int16":
+            scaled = df.select(
+                ((pl.col(c).cast(pl.Float64).fill_nan(None) - self.add_offset) / self.scale_factor).round()
+                for c in band_cols
+            )
+            if band_cols and scaled.select(pl.any_horizontal(pl.all().abs() > _INT16_LIMIT).any()).item():
+                raise self._overflow_error()
+            return df.with_columns(scaled.cast(pl.Int16).get_columns())
+        if self.kind == "float32":
+            return df.with_columns(pl.col(c).cast(pl.Float32) for c in band_cols)
+        return df
+
+    def _overflow_error(self) -> ValueError:
+        lo = -_INT16_LIMIT * self.scale_factor + self.add_offset
+        hi = _INT16_LIMIT * self.scale_factor + self.add_offset
+        return ValueError(
+            f"Band value outside the int16 storage range [{lo:g}, {hi:g}] "
+            f"(scale {self.scale_factor!r}, offset {self.add_offset!r}); store this satellite as float32 instead."
+        )
+
+
+def _band_select_sql(storage: _BandStorage, band_cols: list[str], alias: str = "") -> str:
+    return ", ".join(storage.decode_sql(f'{alias}"{c}"', c) for c in band_cols)
+
+
+def _parse_band_storage(spec: str) -> _BandStorage:
+    kind, *scaling = spec.strip().lower().split(":")
+    if kind in {"float64", "float32"} and not scaling:
+        return _BandStorage(kind)
+    if kind == "int16" and len(scaling) <= 2:
+        scale_factor = float(scaling[0]) if scaling else 1e-4
+        add_offset = float(scaling[1]) if len(scaling) > 1 else 0.0
+        if scale_factor <= 0:
+            raise ValueError(f"int16 band storage needs a positive scale factor, got {spec!r}.")
+        return _BandStorage("int16", scale_factor, add_offset)
+    raise ValueError(f"Unknown band storage {spec!r}; expected float64, float32 or int16[:scale[:offset]].")
+
+
+def _configured_band_storage(
+    table_name: str, spec: str = CACHE_BAND_PRECISION, reflectance: bool = False
+) -> _BandStorage | None:
+    # "float32" applies to every satellite; "s2sr=int16,s1a=float32" picks per table.
+    # An int16 spec for every satellite only covers reflectance tables: backscatter,
+    # elevations and class codes would not fit its scale.
+    default: _BandStorage | None = None
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        name, sep, value = entry.rpartition("=")
+        if not sep:
+            default = _parse_band_storage(value)
+        elif name.strip() == table_name:
+            return _parse_band_storage(value)
+    if default is not None and default.kind == "int16" and not reflectance:
+        logger.debug("AgriGEE cache: %s is not a reflectance table, ignoring the global int16 storage", table_name)
+        return None
+    return default
+
+
+def _stores_reflectance(satellite: AbstractSatellite) -> bool:
+    """Whether a satellite's bands are surface reflectance, the range the default int16 scale is made for."""
+    from agrigee_lite.sat.naip import NAIP
+
+    return isinstance(satellite, OpticalSatellite) and not isinstance(satellite, NAIP)
+
+
 def _chunked(values: list[Any], size: int) -> list[list[Any]]:
     return [values[i : i + size] for i in range(0, len(values), size)]
 
@@ -161,95 +521,315 @@ def _normalize_timestamp_pl(df: pl.DataFrame) -> pl.DataFrame:
     return df.with_columns(pl.col("timestamp").cast(pl.Datetime, strict=False))
 
 
-def _prepare_batch_lookup_rows(
+_ISO_DATE = "%Y-%m-%d"
+
+
+@contextlib.contextmanager
+def _gc_paused() -> Iterator[None]:
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _prepare_batch_lookup_frame(
     gdf: GeoDataFrameLike,
     start_date_col: str,
     end_date_col: str,
     crs: str | None = None,
-) -> tuple[NormalizedGeoDataFrame, list[str], list[str], list[tuple[int, Any, str, str]]]:
+) -> pl.DataFrame:
     normalized = normalize_geodataframe(gdf, crs=crs)
-    row_frame = normalized.select(["geometry", "h3_coarse", "h3_fine", start_date_col, end_date_col])
-
-    rows: list[tuple[int, Any, str, str]] = []
-    h3_coarse_vals: list[str] = []
-    h3_fine_vals: list[str] = []
+    geometries = shapely_geometry_array(normalized)
+    is_point = shapely.get_type_id(geometries) == 0
+    # Points are matched on their coordinates, so only the other shapes need their WKB hashed.
+    geom_hashes = np.full(len(geometries), None, dtype=object)
+    geom_hashes[~is_point] = [
+        hashlib.sha1(wkb).hexdigest()  # noqa: S324
+        for wkb in shapely.to_wkb(geometries[~is_point])
+    ]
+    return pl.DataFrame({
+        "position": pl.int_range(normalized.height, dtype=pl.Int64, eager=True),
+        "geom_hash": pl.Series(geom_hashes.tolist(), dtype=pl.String),
+        "is_point": is_point,
+        "repr_x": shapely.get_x(geometries),
+        "repr_y": shapely.get_y(geometries),
+        "h3_fine": normalized.get_column("h3_fine").cast(pl.String),
+        "q_start": _iso_dates(normalized.get_column(start_date_col)),
+        "q_end": _iso_dates(normalized.get_column(end_date_col)),
+    })
+
+
+def _as_dates(values: pl.Series) -> pl.Series:
+    if values.dtype.is_temporal():
+        return values.cast(pl.Date)
+    return values.cast(pl.String).str.slice(0, 10).str.to_date(_ISO_DATE)
+
+
+def _iso_dates(values: pl.Series) -> pl.Series:
+    if values.dtype.is_temporal():
+        return values.dt.to_string(_ISO_DATE)
+    return values.cast(pl.String).str.slice(0, 10)
+
+
+# Matches request rows to cached geometries (points by exact representative
+# point, everything else by WKB hash) and keeps the jobs overlapping each
+# row's query window. {rows} is the request relation, {sat}/{ph} the params.
+_BATCH_COVERAGE_SQL = """
+    WITH jobs AS (
+        SELECT id, geometry_id, start_date, end_date
+        FROM sits_jobs
+        WHERE satellite_short_name = {sat} AND params_hash = {ph}
+    ),
+    matched AS (
+        SELECT r.position, g.id AS geometry_id, r.q_start, r.q_end
+        FROM {rows}
+        JOIN geometries g
+          ON g.h3_fine = r.h3_fine AND g.geom_type = 'point'
+         AND g.repr_point_x = r.repr_x AND g.repr_point_y = r.repr_y
+        WHERE r.is_point
+        UNION ALL
+        SELECT r.position, g.id AS geometry_id, r.q_start, r.q_end
+        FROM {rows}
+        JOIN geometries g ON g.h3_fine = r.h3_fine AND g.geom_hash = r.geom_hash
+        WHERE NOT r.is_point
+    )
+    SELECT
+        m.position, j.id AS job_id,
+        CAST(j.start_date AS DATE) AS start_date, CAST(j.end_date AS DATE) AS end_date,
+        CAST(m.q_start AS DATE) AS q_start, CAST(m.q_end AS DATE) AS q_end
+    FROM matched m
+    JOIN jobs j ON j.geometry_id = m.geometry_id
+    WHERE j.start_date <= m.q_end AND j.end_date >= m.q_start
+"""
+
+_BATCH_COVERAGE_SCHEMA = {
+    "position": pl.Int64,
+    "job_id": pl.Int64,
+    "start_date": pl.Date,
+    "end_date": pl.Date,
+    "q_start": pl.Date,
+    "q_end": pl.Date,
+}
+
+
+def _finalize_batch_coverage(matches: pl.DataFrame) -> dict[int, tuple[list[int], list[tuple[str, str]]]]:
+    """Merge each row's overlapping job windows and derive the uncovered gaps, as ``_compute_gaps`` does per row."""
+    if matches.is_empty():
+        return {}
 
-    for pos, row in enumerate(row_frame.iter_rows(named=True)):
-        h3_coarse = str(row["h3_coarse"])
-        h3_fine = str(row["h3_fine"])
-        rows.append((pos, row["geometry"], h3_fine, h3_coarse))
-        h3_coarse_vals.append(h3_coarse)
-        h3_fine_vals.append(h3_fine)
+    # Dates become day numbers so all interval arithmetic stays in integer columns.
+    windows = matches.select(
+        "position",
+        pl.col("q_start").cast(pl.Int32).alias("qs"),
+        pl.col("q_end").cast(pl.Int32).alias("qe"),
+        pl.max_horizontal("start_date", "q_start").cast(pl.Int32).alias("s"),
+        pl.min_horizontal("end_date", "q_end").cast(pl.Int32).alias("e"),
+    ).sort("position", "s")
+    # Running furthest end per row. Rows are sorted by position, so one global cum_max over position-major keys
+    # gives every row's running max without a per-row window function.
+    e_min = int(cast(int, windows.get_column("e").min())) - 1
+    stride = int(cast(int, windows.get_column("e").max())) - e_min + 1
+    reached = (pl.col("position") * stride + (pl.col("e") - e_min)).cum_max()
+    before = reached.shift(1)
+    reach_before = pl.when(before // stride == pl.col("position")).then(before % stride + e_min)
+    windows = windows.with_columns(
+        (reach_before.is_null() | (pl.col("s") > reach_before + 1)).alias("opens"),
+        (reached % stride + e_min).alias("reach"),
+    )
+    # Windows are contiguous per merged run: a run starts where a window opens one and ends right before the next.
+    starts = windows.filter("opens")
+    ends = windows.filter(pl.col("opens").shift(-1, fill_value=True))
+    runs = starts.select("position", "s", "qs", "qe", ends.get_column("reach").cast(pl.Int32).alias("e"))
+    same_row_before = pl.col("position") == pl.col("position").shift(1)
+    same_row_after = pl.col("position") == pl.col("position").shift(-1)
+    leading = runs.select(
+        "position",
+        pl.when(same_row_before).then(pl.col("e").shift(1) + 1).otherwise(pl.col("qs")).alias("gap_start"),
+        (pl.col("s") - 1).alias("gap_end"),
+    ).filter(pl.col("gap_start") <= pl.col("gap_end"))
+    trailing = (
+        runs
+        .filter(~same_row_after.fill_null(value=False))
+        .select("position", (pl.col("e") + 1).alias("gap_start"), pl.col("qe").alias("gap_end"))
+        .filter(pl.col("gap_start") <= pl.col("gap_end"))
+    )
 
-    return normalized, list(dict.fromkeys(h3_coarse_vals)), list(dict.fromkeys(h3_fine_vals)), rows
+    # Only a few distinct days occur, so format each once instead of per gap.
+    gap_days = pl.concat(
+        [leading.get_column(c) for c in ("gap_start", "gap_end")]
+        + [trailing.get_column(c) for c in ("gap_start", "gap_end")]
+    ).unique()
+    iso = dict(zip(gap_days.to_list(), gap_days.cast(pl.Date).dt.to_string(_ISO_DATE).to_list(), strict=True))
+
+    jobs = matches.select("position", "job_id").sort("position", "job_id")
+    shared = jobs.get_column("position").is_duplicated()
+    result: dict[int, tuple[list[int], list[tuple[str, str]]]]
+    # Building one small list per row triggers repeated full collections on large batches.
+    with _gc_paused():
+        single = jobs.filter(~shared)
+        result = {
+            pos: ([job_id], [])
+            for pos, job_id in zip(*(single.get_column(c).to_list() for c in single.columns), strict=True)
+        }
+        multiple = jobs.filter(shared)
+        for pos, job_id in zip(*(multiple.get_column(c).to_list() for c in multiple.columns), strict=True):
+            entry = result.get(pos)
+            if entry is None:
+                result[pos] = ([job_id], [])
+            else:
+                entry[0].append(job_id)
+        # Leading gaps come out in run order, and each row's trailing gap is its last.
+        for gaps in (leading, trailing):
+            for pos, start, end in zip(*(gaps.get_column(c).to_list() for c in gaps.columns), strict=True):
+                result[pos][1].append((iso[start], iso[end]))
+    return result
 
 
-def _resolve_geometry_ids(
-    normalized: NormalizedGeoDataFrame,
-    rows: list[tuple[int, Any, str, str]],
-    candidate_rows: Sequence[Any],
+def _prepare_cached_requests_frame(
+    requests: pl.DataFrame,
     start_date_col: str,
     end_date_col: str,
-) -> list[tuple[int, int, str, str]]:
-    h3_fine_to_geoms: dict[str, dict[str, int]] = {}
-    point_to_geom: dict[tuple[float, float], int] = {}
-    for crow in candidate_rows:
-        geom_id, geom_hash, h3_fine, geom_type, rx, ry = crow
-        assert geom_id is not None
-        h3_fine_to_geoms.setdefault(str(h3_fine), {})[str(geom_hash)] = int(geom_id)
-        if geom_type == "point":
-            assert rx is not None
-            assert ry is not None
-            point_to_geom[(float(rx), float(ry))] = int(geom_id)
-
-    candidate_h3_fines = set(h3_fine_to_geoms)
-    resolved: list[tuple[int, int, str, str]] = []
-
-    for pos, geometry_value, h3_fine, _h3_coarse in rows:
-        if h3_fine not in candidate_h3_fines:
-            continue
+) -> pl.DataFrame:
+    # One row per (request, job); job_order keeps the caller's job order for timestamp deduplication. Windows are
+    # UTC epoch seconds, [start day, day after end), so they compare as instants whatever the session time zone.
+    start_days = _as_dates(requests.get_column(start_date_col)).cast(pl.Int64)
+    end_days = _as_dates(requests.get_column(end_date_col)).cast(pl.Int64) + 1
+    return (
+        requests
+        .select(
+            pl.int_range(pl.len(), dtype=pl.Int64).alias("request"),
+            pl.col("job_ids").alias("job_id"),
+            pl.col("job_ids").list.len().alias("job_count"),
+            (start_days * 86_400).cast(pl.Float64).alias("window_start"),
+            (end_days * 86_400).cast(pl.Float64).alias("window_end"),
+        )
+        .explode("job_id")
+        .with_row_index("job_order")
+    )
 
-        geometry = geometry_value_to_shapely(cast(bytes | bytearray | memoryview, geometry_value))
-        geom_id: int | None
-        if geometry.geom_type == "Point":
-            point_geometry = cast(Point, geometry)
-            geom_id = point_to_geom.get((float(point_geometry.x), float(point_geometry.y)))
-        else:
-            geom_id = h3_fine_to_geoms.get(h3_fine, {}).get(_compute_geom_hash(geometry))
 
-        if geom_id is None:
-            continue
+# Every cached observation of every request in one pass: the join picks each
+# request's jobs and the window keeps its dates. Only requests spanning several
+# jobs can see a timestamp twice; there the earliest listed job wins, so the
+# anti-join runs on that (usually small) subset alone.
+_CACHED_REQUESTS_SQL = """
+    WITH hits AS (
+        SELECT m.request, m.job_order, m.job_count, t.timestamp, {cols}
+        FROM {requests}
+        JOIN {table} t ON t.job_id = m.job_id
+        WHERE t.timestamp >= to_timestamp(m.window_start) AND t.timestamp < to_timestamp(m.window_end)
+    ),
+    shared AS (
+        SELECT * FROM hits WHERE job_count > 1
+    )
+    SELECT request, timestamp, {names} FROM hits WHERE job_count = 1
+    UNION ALL
+    SELECT h.request, h.timestamp, {shared_names}
+    FROM shared h
+    WHERE NOT EXISTS (
+        SELECT 1 FROM shared e
+        WHERE e.request = h.request AND e.timestamp = h.timestamp AND e.job_order < h.job_order
+    )
+"""
 
-        row = normalized.select([start_date_col, end_date_col]).row(pos, named=True)
-        resolved.append((pos, geom_id, str(row[start_date_col])[:10], str(row[end_date_col])[:10]))
 
-    return resolved
+def _finalize_cached_requests(
+    rows: pl.DataFrame,
+    requests: pl.DataFrame,
+    key_col: str,
+    band_cols: list[str],
+) -> pl.DataFrame:
+    if rows.is_empty():
+        return pl.DataFrame()
+    keys = requests.get_column(key_col).gather(rows.get_column("request"))
+    frame = _normalize_timestamp_pl(rows).select("timestamp", *band_cols, keys.alias(key_col))
+    return frame.sort([key_col, "timestamp"])
 
 
-def _build_jobs_by_geom(job_rows: Sequence[Any]) -> dict[int, list[tuple[int, str, str]]]:
-    jobs_by_geom: dict[int, list[tuple[int, str, str]]] = {}
-    for jrow in job_rows:
-        gid = int(jrow[0])
-        jobs_by_geom.setdefault(gid, []).append((int(jrow[1]), str(jrow[2]), str(jrow[3])))
-    return jobs_by_geom
+_GEOM_TYPE_BY_ID = {0: "point", 3: "polygon", 4: "multipolygon", 5: "multipolygon", 6: "multipolygon"}
 
 
-def _finalize_batch_coverage(
-    resolved_rows: list[tuple[int, int, str, str]],
-    jobs_by_geom: dict[int, list[tuple[int, str, str]]],
-) -> dict[int, tuple[list[int], list[tuple[str, str]]]]:
-    result: dict[int, tuple[list[int], list[tuple[str, str]]]] = {}
-    for pos, geom_id, q_start, q_end in resolved_rows:
-        geom_jobs = jobs_by_geom.get(geom_id)
-        if not geom_jobs:
-            continue
-        overlapping = [(jid, js, je) for jid, js, je in geom_jobs if js <= q_end and je >= q_start]
-        if not overlapping:
-            continue
-        job_ids = [jid for jid, _, _ in overlapping]
-        covered = [(js, je) for _, js, je in overlapping]
-        result[pos] = (job_ids, _compute_gaps(q_start, q_end, covered))
-    return result
+def _prepare_batch_store_frames(
+    df: pl.DataFrame,
+    features: pl.DataFrame,
+    key_col: str,
+    params_hash: str,
+) -> tuple[pl.DataFrame, pl.DataFrame]:
+    stored_keys = df.get_column(key_col).cast(features.schema[key_col]).unique()
+    missing = stored_keys.filter(~stored_keys.is_in(features.get_column(key_col).implode()))
+    if not missing.is_empty():
+        raise KeyError(f"Could not match chunk row for {key_col}={missing[0]!r}.")
+
+    features = features.filter(pl.col(key_col).is_in(stored_keys.implode())).unique(
+        subset=[key_col], keep="first", maintain_order=True
+    )
+    geometries = shapely.from_wkb(features.get_column("geometry").to_numpy())
+    centroids = shapely.centroid(geometries)
+    repr_x = shapely.get_x(centroids)
+    repr_y = shapely.get_y(centroids)
+    h3_coarse, h3_fine = compute_h3_cells(repr_x, repr_y)
+    wkbs = shapely.to_wkb(geometries)
+    geom_hashes = [hashlib.sha1(wkb).hexdigest() for wkb in wkbs]  # noqa: S324
+
+    jobs = features.select(
+        key_col,
+        pl.Series("geom_hash", geom_hashes),
+        pl.col("start_date").cast(pl.String).str.slice(0, 10),
+        pl.col("end_date").cast(pl.String).str.slice(0, 10),
+    )
+    jobs = jobs.with_columns(
+        pl.Series(
+            "job_hash",
+            [
+                _compute_job_hash(geom_hash, params_hash, start_date, end_date)
+                for geom_hash, start_date, end_date in jobs.select("geom_hash", "start_date", "end_date").iter_rows()
+            ],
+            dtype=pl.String,
+        )
+    )
+
+    geoms = pl.DataFrame({
+        "geom_hash": geom_hashes,
+        "geometry": pl.Series(list(wkbs), dtype=pl.Binary),
+        "repr_point_x": repr_x,
+        "repr_point_y": repr_y,
+        "geom_type": pl.Series(shapely.get_type_id(geometries)).replace_strict(
+            _GEOM_TYPE_BY_ID, default="geometry", return_dtype=pl.String
+        ),
+        "h3_coarse": h3_coarse,
+        "h3_fine": h3_fine,
+    }).unique(subset=["geom_hash"], keep="first", maintain_order=True)
+    return geoms, jobs
+
+
+def _batch_observations(
+    df: pl.DataFrame,
+    jobs: pl.DataFrame,
+    job_rows: pl.DataFrame,
+    key_col: str,
+    band_cols: list[str],
+) -> tuple[dict[Any, int], pl.DataFrame]:
+    resolved = jobs.join(job_rows, on="job_hash", how="inner", maintain_order="left")
+    job_ids = dict(zip(resolved.get_column(key_col).to_list(), resolved.get_column("job_id").to_list(), strict=True))
+
+    to_fill = (
+        resolved
+        .filter(~pl.col("already"))
+        .unique(subset=["job_id"], keep="first", maintain_order=True)
+        .select(key_col, "job_id")
+    )
+    present_band_cols = [c for c in band_cols if c in df.columns]
+    obs = (
+        df
+        .with_columns(pl.col(key_col).cast(to_fill.schema[key_col]))
+        .join(to_fill, on=key_col, how="inner", maintain_order="left")
+        .select(["job_id", "timestamp", *present_band_cols])
+        .cast({"timestamp": pl.Utf8})
+    )
+    return job_ids, obs
 
 
 # ---------------------------------------------------------------------------
@@ -294,9 +874,12 @@ def _ensure_schema_duck(conn: duckdb.DuckDBPyConnection) -> None:
             start_date             TEXT   NOT NULL,
             end_date               TEXT   NOT NULL,
             fetched_at             TIMESTAMPTZ NOT NULL,
+            last_read_at           TIMESTAMPTZ,
+            read_count             BIGINT NOT NULL DEFAULT 0,
             UNIQUE (geometry_id, satellite_short_name, params_hash, start_date, end_date)
         )
     """)
+    _ensure_job_access_columns(conn)
     conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_hash ON sits_jobs(job_hash)")
     conn.execute(
         "CREATE INDEX IF NOT EXISTS idx_jobs_geom ON sits_jobs(geometry_id, satellite_short_name, params_hash)"
@@ -313,14 +896,133 @@ def _ensure_schema_duck(conn: duckdb.DuckDBPyConnection) -> None:
         )
     """)
     conn.execute("CREATE INDEX IF NOT EXISTS idx_api_jobs_status ON api_jobs(status)")
+    _ensure_sits_run_tables(conn)
+    _ensure_band_storage_table(conn)
+
+
+def _ensure_sits_run_tables(conn: duckdb.DuckDBPyConnection | sa.Connection) -> None:
+    statements = [
+        """
+        CREATE TABLE IF NOT EXISTS sits_run_chunks (
+            run_hash   TEXT    NOT NULL,
+            chunk_id   INTEGER NOT NULL,
+            state      TEXT    NOT NULL,
+            error      TEXT,
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (run_hash, chunk_id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS sits_run_rows (
+            run_hash TEXT    NOT NULL,
+            position INTEGER NOT NULL,
+            chunk_id INTEGER,
+            job_id   BIGINT
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_run_rows_run ON sits_run_rows (run_hash, position)",
+    ]
+    for statement in statements:
+        if isinstance(conn, duckdb.DuckDBPyConnection):
+            conn.execute(statement)
+        else:
+            conn.execute(sa.text(statement))
+
+
+def _ensure_job_access_columns(conn: duckdb.DuckDBPyConnection | sa.Connection) -> None:
+    # Caches created before reads were tracked get the columns on open. DuckDB
+    # cannot add a column with a constraint, so there read_count stays nullable.
+    statements = [
+        "ALTER TABLE sits_jobs ADD COLUMN IF NOT EXISTS last_read_at TIMESTAMPTZ",
+        "ALTER TABLE sits_jobs ADD COLUMN IF NOT EXISTS read_count BIGINT DEFAULT 0",
+    ]
+    for statement in statements:
+        if isinstance(conn, duckdb.DuckDBPyConnection):
+            conn.execute(statement)
+        else:
+            conn.execute(sa.text(statement))
+
+
+def _ensure_band_storage_table(conn: duckdb.DuckDBPyConnection | sa.Connection) -> None:
+    statement = """
+        CREATE TABLE IF NOT EXISTS sits_band_storage (
+            table_name   TEXT             PRIMARY KEY,
+            storage      TEXT             NOT NULL,
+            scale_factor DOUBLE PRECISION NOT NULL,
+            add_offset   DOUBLE PRECISION NOT NULL
+        )
+    """
+    if isinstance(conn, duckdb.DuckDBPyConnection):
+        conn.execute(statement)
+    else:
+        conn.execute(sa.text(statement))
+
+
+def _native_band_storage(conn: duckdb.DuckDBPyConnection | sa.Connection) -> _BandStorage:
+    # Tables created before sits_band_storage existed use the original column types.
+    return _BandStorage() if isinstance(conn, duckdb.DuckDBPyConnection) else _BandStorage("float32")
+
 
+def _band_storage(conn: duckdb.DuckDBPyConnection | sa.Connection, table_name: str) -> _BandStorage:
+    query = "SELECT storage, scale_factor, add_offset FROM sits_band_storage WHERE table_name = "
+    if isinstance(conn, duckdb.DuckDBPyConnection):
+        row = conn.execute(query + "?", [table_name]).fetchone()
+    else:
+        row = conn.execute(sa.text(query + ":t"), {"t": table_name}).fetchone()
+    return _BandStorage(row[0], float(row[1]), float(row[2])) if row else _native_band_storage(conn)
+
+
+def _register_band_storage(
+    conn: duckdb.DuckDBPyConnection | sa.Connection,
+    table_name: str,
+    requested: _BandStorage | None,
+) -> _BandStorage:
+    """Record the storage of a satellite table on creation; existing tables keep theirs."""
+    is_duck = isinstance(conn, duckdb.DuckDBPyConnection)
+    if is_duck:
+        registered = conn.execute("SELECT 1 FROM sits_band_storage WHERE table_name = ?", [table_name]).fetchone()
+        exists = conn.execute(
+            "SELECT 1 FROM information_schema.tables WHERE table_schema = 'main' AND table_name = ?", [table_name]
+        ).fetchone()
+    else:
+        registered = conn.execute(
+            sa.text("SELECT 1 FROM sits_band_storage WHERE table_name = :t"), {"t": table_name}
+        ).fetchone()
+        exists = conn.execute(
+            sa.text("SELECT 1 FROM information_schema.tables WHERE table_schema = 'public' AND table_name = :t"),
+            {"t": table_name},
+        ).fetchone()
+    if registered:
+        storage = _band_storage(conn, table_name)
+        if requested is not None and requested != storage:
+            logger.info("AgriGEE cache: %s keeps its %s band storage", table_name, storage.kind)
+        return storage
+
+    storage = _native_band_storage(conn) if exists or requested is None else requested
+    params = {"t": table_name, "k": storage.kind, "s": storage.scale_factor, "o": storage.add_offset}
+    if is_duck:
+        conn.execute("INSERT INTO sits_band_storage VALUES (?, ?, ?, ?)", list(params.values()))
+    else:
+        conn.execute(sa.text("INSERT INTO sits_band_storage VALUES (:t, :k, :s, :o)"), params)
+    return storage
 
-def _ensure_sat_table_duck(conn: duckdb.DuckDBPyConnection, table_name: str, band_cols: list[str]) -> None:
+
+def _ensure_sat_table_duck(
+    conn: duckdb.DuckDBPyConnection,
+    table_name: str,
+    band_cols: list[str],
+    observation_root: pathlib.Path | None = None,
+    storage: _BandStorage | None = None,
+) -> None:
     if not band_cols:
         return
+    storage = _register_band_storage(conn, table_name, storage or _configured_band_storage(table_name))
+    if observation_root is not None:
+        _ensure_sat_view_duck(conn, observation_root, table_name, band_cols, storage)
+        return
     seq_name = f"{table_name}_id_seq"
     conn.execute(f'CREATE SEQUENCE IF NOT EXISTS "{seq_name}"')
-    band_defs = ",\n    ".join(f'"{c}" DOUBLE' for c in band_cols)
+    band_defs = ",\n    ".join(f'"{c}" {storage.sql_type()}' for c in band_cols)
     conn.execute(f"""
         CREATE TABLE IF NOT EXISTS "{table_name}" (
             id        BIGINT PRIMARY KEY DEFAULT nextval('"{seq_name}"'),
@@ -332,55 +1034,144 @@ def _ensure_sat_table_duck(conn: duckdb.DuckDBPyConnection, table_name: str, ban
     conn.execute(f'CREATE INDEX IF NOT EXISTS "idx_{table_name}_jid" ON "{table_name}"(job_id)')
 
 
+def _observation_root(db_path: pathlib.Path) -> pathlib.Path:
+    return db_path.with_name(f"{db_path.stem}_observations")
+
+
+def _duck_db_path(conn: duckdb.DuckDBPyConnection) -> pathlib.Path | None:
+    row = conn.execute("SELECT path FROM duckdb_databases() WHERE database_name = current_database()").fetchone()
+    return pathlib.Path(row[0]).resolve() if row and row[0] else None
+
+
+def _sql_path(path: pathlib.Path) -> str:
+    return str(path).replace("'", "''")
+
+
+def _ensure_sat_view_duck(
+    conn: duckdb.DuckDBPyConnection,
+    observation_root: pathlib.Path,
+    table_name: str,
+    band_cols: list[str],
+    storage: _BandStorage,
+) -> None:
+    # An empty file carrying the full schema keeps the view valid before any
+    # observation lands and pins the column types when files disagree.
+    schema_dir = observation_root / table_name / "h3_coarse=_"
+    schema_dir.mkdir(parents=True, exist_ok=True)
+    band_defs = "".join(f', CAST(NULL AS {storage.sql_type()}) AS "{c}"' for c in band_cols)
+    tmp_path = schema_dir / f".schema-{uuid.uuid4().hex}.tmp"
+    conn.execute(
+        f"COPY (SELECT CAST(NULL AS BIGINT) AS job_id, CAST(NULL AS TIMESTAMPTZ) AS timestamp{band_defs} LIMIT 0) "
+        f"TO '{_sql_path(tmp_path)}' (FORMAT parquet)"
+    )
+    os.replace(tmp_path, schema_dir / "schema.parquet")
+
+    cols_sql = "".join(f', "{c}"' for c in band_cols)
+    glob = _sql_path(observation_root / table_name / "*" / "*.parquet")
+    conn.execute(f"""
+        CREATE OR REPLACE VIEW "{table_name}" AS
+        SELECT job_id, timestamp{cols_sql}, h3_coarse
+        FROM read_parquet('{glob}', hive_partitioning = true, union_by_name = true,
+                          hive_types = {{'h3_coarse': VARCHAR}})
+    """)
+
+
+def _resolve_observation_root(
+    conn: duckdb.DuckDBPyConnection,
+    db_path: pathlib.Path,
+    observation_store: str,
+    table_names: list[str],
+) -> pathlib.Path | None:
+    if observation_store not in {"table", "parquet"}:
+        raise ValueError(f"Unknown observation store {observation_store!r}; expected 'table' or 'parquet'.")
+
+    kinds = dict(
+        conn.execute(
+            "SELECT table_name, table_type FROM information_schema.tables "
+            "WHERE table_schema = 'main' AND list_contains(?, table_name)",
+            [table_names],
+        ).fetchall()
+    )
+    # A cache that was already moved to Parquet stays there whatever the default says.
+    if "VIEW" in kinds.values():
+        return _observation_root(db_path)
+    if observation_store == "table":
+        return None
+
+    tables = [name for name, kind in kinds.items() if kind == "BASE TABLE"]
+    if any(conn.execute(f'SELECT 1 FROM "{name}" LIMIT 1').fetchone() for name in tables):
+        raise ValueError(
+            f"{db_path} keeps observations in tables; run migrate_observations_to_parquet() "
+            "before opening it with the Parquet store."
+        )
+    for name in tables:
+        conn.execute(f'DROP TABLE "{name}"')
+        conn.execute(f'DROP SEQUENCE IF EXISTS "{name}_id_seq"')
+    return _observation_root(db_path)
+
+
 # ---------------------------------------------------------------------------
 # DuckDB — reads
 # ---------------------------------------------------------------------------
 
 
-def _fetch_sits_with_gaps_duck(
+def _geometry_jobs_duck(
     conn: duckdb.DuckDBPyConnection,
-    geometry: Any,
-    start_date: str,
-    end_date: str,
-    satellite: AbstractSatellite,
-    reducers: set[str] | None,
-    subsampling_max_pixels: float,
-) -> tuple[pl.DataFrame, list[tuple[str, str]]]:
-    params_hash = _compute_params_hash(satellite, reducers, subsampling_max_pixels)
-    band_cols = _get_band_columns(satellite)
-    table_name = satellite.shortName
-
-    if geometry.geom_type == "Point":
-        rx, ry = _repr_point(geometry)
+    geometry_key: tuple[Any, ...],
+    satellite_short_name: str,
+    params_hash: str,
+) -> _GeometryJobs:
+    if geometry_key[0] == "point":
         geom_row = conn.execute(
-            "SELECT id FROM geometries WHERE repr_point_x = ? AND repr_point_y = ?", [rx, ry]
+            "SELECT id FROM geometries WHERE repr_point_x = ? AND repr_point_y = ?", list(geometry_key[1:])
         ).fetchone()
     else:
-        geom_hash = _compute_geom_hash(geometry)
-        geom_row = conn.execute("SELECT id FROM geometries WHERE geom_hash = ?", [geom_hash]).fetchone()
+        geom_row = conn.execute("SELECT id FROM geometries WHERE geom_hash = ?", [geometry_key[1]]).fetchone()
 
     if geom_row is None:
-        return pl.DataFrame(), [(start_date, end_date)]
-
-    geom_id = int(geom_row[0])
+        return None
 
     job_rows = conn.execute(
         """
         SELECT id, start_date, end_date FROM sits_jobs
         WHERE geometry_id = ? AND satellite_short_name = ? AND params_hash = ?
-          AND start_date <= ? AND end_date >= ?
         """,
-        [geom_id, satellite.shortName, params_hash, end_date, start_date],
+        [int(geom_row[0]), satellite_short_name, params_hash],
     ).fetchall()
+    return tuple((int(r[0]), str(r[1]), str(r[2])) for r in job_rows)
+
+
+def _fetch_sits_with_gaps_duck(
+    conn: duckdb.DuckDBPyConnection,
+    geometry: Any,
+    start_date: str,
+    end_date: str,
+    satellite: AbstractSatellite,
+    reducers: set[str] | None,
+    subsampling_max_pixels: float,
+    index: _GeometryIndexCache,
+    access: _AccessLog,
+) -> tuple[pl.DataFrame, list[tuple[str, str]]]:
+    params_hash = compute_params_hash(satellite, reducers, subsampling_max_pixels)
+    band_cols = _get_band_columns(satellite)
+    table_name = satellite.shortName
 
+    geometry_key = _geometry_lookup_key(geometry)
+    jobs = index.get_or_load(
+        geometry_key,
+        (table_name, params_hash),
+        lambda: _geometry_jobs_duck(conn, geometry_key, table_name, params_hash),
+    )
+    job_rows = [job for job in jobs or () if job[1] <= end_date and job[2] >= start_date]
     if not job_rows:
         return pl.DataFrame(), [(start_date, end_date)]
 
-    covered = [(str(r[1]), str(r[2])) for r in job_rows]
-    job_ids = [int(r[0]) for r in job_rows]
+    covered = [(job_start, job_end) for _, job_start, job_end in job_rows]
+    job_ids = [job_id for job_id, _, _ in job_rows]
     gaps = _compute_gaps(start_date, end_date, covered)
+    access.record(job_ids)
 
-    cols_sql = ", ".join(f'"{c}"' for c in band_cols)
+    cols_sql = _band_select_sql(_band_storage(conn, table_name), band_cols)
     ph = ", ".join("?" * len(job_ids))
     pl_df = conn.execute(
         f'SELECT timestamp, {cols_sql} FROM "{table_name}" '
@@ -405,7 +1196,7 @@ def _fetch_sits_by_jids_duck(
 
     table_name = satellite.shortName
     band_cols = _get_band_columns(satellite)
-    cols_sql = ", ".join(f'"{c}"' for c in band_cols)
+    cols_sql = _band_select_sql(_band_storage(conn, table_name), band_cols)
     result: dict[int, pl.DataFrame] = {}
 
     for chunk in _chunked(list(dict.fromkeys(job_ids)), 400):
@@ -423,6 +1214,76 @@ def _fetch_sits_by_jids_duck(
     return result
 
 
+def _observation_files(sat_dir: pathlib.Path, cell: str, job_ids: list[int]) -> list[pathlib.Path]:
+    files = []
+    for path in (sat_dir / f"h3_coarse={cell}").glob("*.parquet"):
+        lo, _, rest = path.stem.removeprefix("part-").partition("-")
+        hi = rest.partition("-")[0]
+        if lo.isdigit() and hi.isdigit():
+            first = bisect.bisect_left(job_ids, int(lo))
+            if first == len(job_ids) or job_ids[first] > int(hi):
+                continue
+        files.append(path)
+    return files
+
+
+def _observation_scan_duck(
+    conn: duckdb.DuckDBPyConnection,
+    observation_root: pathlib.Path,
+    table_name: str,
+    jobs_relation: str,
+) -> str:
+    # Only files whose H3 partition and job id range can hold the requested jobs are opened.
+    cells = conn.execute(f"""
+        SELECT g.h3_coarse, list(DISTINCT s.id ORDER BY s.id)
+        FROM {jobs_relation} r
+        JOIN sits_jobs s ON s.id = r.job_id
+        JOIN geometries g ON g.id = s.geometry_id
+        GROUP BY g.h3_coarse
+    """).fetchall()
+    sat_dir = observation_root / table_name
+    paths = [sat_dir / "h3_coarse=_" / "schema.parquet"]
+    for cell, job_ids in cells:
+        paths.extend(_observation_files(sat_dir, cell, job_ids))
+    files_sql = ", ".join(f"'{_sql_path(path)}'" for path in paths)
+    return (
+        f"read_parquet([{files_sql}], hive_partitioning = true, union_by_name = true, "
+        "hive_types = {'h3_coarse': VARCHAR})"
+    )
+
+
+def _fetch_sits_by_requests_duck(
+    conn: duckdb.DuckDBPyConnection,
+    satellite: AbstractSatellite,
+    requests: pl.DataFrame,
+    key_col: str,
+    start_date_col: str,
+    end_date_col: str,
+) -> pl.DataFrame:
+    band_cols = _get_band_columns(satellite)
+    mapping = _prepare_cached_requests_frame(requests, start_date_col, end_date_col)
+    observation_root = _duck_observation_root
+    cursor = conn.cursor()
+    try:
+        cursor.register("_cached_requests", mapping.to_arrow())
+        table = (
+            f'"{satellite.shortName}"'
+            if observation_root is None
+            else _observation_scan_duck(cursor, observation_root, satellite.shortName, "_cached_requests")
+        )
+        sql = _CACHED_REQUESTS_SQL.format(
+            cols=_band_select_sql(_band_storage(cursor, satellite.shortName), band_cols, "t."),
+            names=", ".join(f'"{c}"' for c in band_cols),
+            shared_names=", ".join(f'h."{c}"' for c in band_cols),
+            requests="_cached_requests m",
+            table=table,
+        )
+        rows = cursor.execute(sql).pl()
+    finally:
+        cursor.close()
+    return _finalize_cached_requests(rows, requests, key_col, band_cols)
+
+
 def _fetch_sits_batch_coverage_duck(
     conn: duckdb.DuckDBPyConnection,
     gdf: GeoDataFrameLike,
@@ -433,41 +1294,22 @@ def _fetch_sits_batch_coverage_duck(
     end_date_col: str,
     crs: str | None = None,
 ) -> dict[int, tuple[list[int], list[tuple[str, str]]]]:
-    params_hash = _compute_params_hash(satellite, reducers, subsampling_max_pixels)
-    normalized, h3_coarse_vals, h3_fine_vals, rows = _prepare_batch_lookup_rows(gdf, start_date_col, end_date_col, crs)
-    if not h3_coarse_vals:
-        return {}
-
-    c_ph = ", ".join("?" * len(h3_coarse_vals))
-    f_ph = ", ".join("?" * len(h3_fine_vals))
-    candidate_rows = conn.execute(
-        f"""
-        SELECT id, geom_hash, h3_fine, geom_type, repr_point_x, repr_point_y
-        FROM geometries
-        WHERE h3_coarse IN ({c_ph}) AND h3_fine IN ({f_ph})
-        """,
-        [*h3_coarse_vals, *h3_fine_vals],
-    ).fetchall()
-
-    if not candidate_rows:
-        return {}
-
-    resolved_rows = _resolve_geometry_ids(normalized, rows, candidate_rows, start_date_col, end_date_col)
-    if not resolved_rows:
+    params_hash = compute_params_hash(satellite, reducers, subsampling_max_pixels)
+    lookup = _prepare_batch_lookup_frame(gdf, start_date_col, end_date_col, crs)
+    if lookup.is_empty():
         return {}
 
-    unique_geom_ids = list(dict.fromkeys(geom_id for _, geom_id, _, _ in resolved_rows))
-    gid_ph = ", ".join("?" * len(unique_geom_ids))
-    job_rows = conn.execute(
-        f"""
-        SELECT geometry_id, id, start_date, end_date
-        FROM sits_jobs
-        WHERE geometry_id IN ({gid_ph})
-          AND satellite_short_name = ? AND params_hash = ?
-        """,
-        [*unique_geom_ids, satellite.shortName, params_hash],
-    ).fetchall()
-    return _finalize_batch_coverage(resolved_rows, _build_jobs_by_geom(job_rows))
+    # A dedicated cursor keeps the registered relation private to this call.
+    cursor = conn.cursor()
+    try:
+        cursor.register("_coverage_rows", lookup.to_arrow())
+        matches = cursor.execute(
+            _BATCH_COVERAGE_SQL.format(rows="_coverage_rows r", sat="?", ph="?"),
+            [satellite.shortName, params_hash],
+        ).pl()
+    finally:
+        cursor.close()
+    return _finalize_batch_coverage(matches)
 
 
 # ---------------------------------------------------------------------------
@@ -475,6 +1317,186 @@ def _fetch_sits_batch_coverage_duck(
 # ---------------------------------------------------------------------------
 
 
+def _copy_observations_sql(source: str, band_cols: list[str], storage: _BandStorage, target: pathlib.Path) -> str:
+    band_sql = "".join(f', CAST("{c}" AS {storage.sql_type()}) AS "{c}"' for c in band_cols)
+    return (
+        f"COPY (SELECT CAST(job_id AS BIGINT) AS job_id, CAST(timestamp AS TIMESTAMPTZ) AS timestamp{band_sql}, "
+        f"h3_coarse FROM {source} ORDER BY job_id, timestamp) "
+        f"TO '{_sql_path(target)}' (FORMAT parquet, PARTITION_BY (h3_coarse), FILENAME_PATTERN 'part-{{uuid}}')"
+    )
+
+
+def _staging_dir(observation_root: pathlib.Path) -> pathlib.Path:
+    parent = observation_root / ".staging"
+    parent.mkdir(parents=True, exist_ok=True)
+    return parent / uuid.uuid4().hex
+
+
+def _stage_observations(
+    conn: duckdb.DuckDBPyConnection,
+    observation_root: pathlib.Path,
+    table_name: str,
+    source: str,
+    band_cols: list[str],
+    storage: _BandStorage,
+) -> list[pathlib.Path]:
+    """Write ``source`` as observation files and return the files placed."""
+    staging = _staging_dir(observation_root)
+    ranges = {
+        f"h3_coarse={cell}": (lo, hi)
+        for cell, lo, hi in conn.execute(
+            f"SELECT h3_coarse, MIN(job_id), MAX(job_id) FROM {source} GROUP BY h3_coarse"
+        ).fetchall()
+    }
+    conn.execute(_copy_observations_sql(source, band_cols, storage, staging))
+
+    # Files are renamed into place one by one, so a reader globbing the
+    # partitions never sees a half-written file. The job id range in the
+    # name lets reads skip files without opening them.
+    sat_dir = observation_root / table_name
+    placed: list[pathlib.Path] = []
+    try:
+        for path in sorted(staging.rglob("*.parquet")):
+            lo, hi = ranges[path.parent.name]
+            target = sat_dir / path.parent.name / f"part-{lo}-{hi}-{path.stem.removeprefix('part-')}.parquet"
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(path, target)
+            placed.append(target)
+    except BaseException:
+        _discard_observation_files(placed)
+        raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return placed
+
+
+def _discard_observation_files(paths: list[pathlib.Path]) -> None:
+    for path in paths:
+        path.unlink(missing_ok=True)
+
+
+def _write_observations_parquet(
+    conn: duckdb.DuckDBPyConnection,
+    observation_root: pathlib.Path,
+    table_name: str,
+    obs: pl.DataFrame,
+    storage: _BandStorage,
+) -> list[pathlib.Path]:
+    band_cols = [c for c in obs.columns if c not in {"job_id", "timestamp", "h3_coarse"}]
+    cursor = conn.cursor()
+    try:
+        cursor.register("_obs_parquet", obs.to_arrow())
+        return _stage_observations(cursor, observation_root, table_name, "_obs_parquet", band_cols, storage)
+    finally:
+        cursor.close()
+
+
+def _commit_with_observations_duck(
+    cursor: duckdb.DuckDBPyConnection,
+    observation_root: pathlib.Path | None,
+    table_name: str,
+    obs: pl.DataFrame | None,
+    storage: _BandStorage,
+) -> None:
+    """Commit a store, placing its Parquet observations first.
+
+    The files are in place before the jobs that own them are committed, so
+    no reader sees a job without its observations. If the commit fails the
+    files are removed again; a crash before the commit leaves files whose
+    job ids were never committed, which ``_discard_orphaned_observations_duck``
+    removes on the next start.
+    """
+    placed = (
+        _write_observations_parquet(cursor, observation_root, table_name, obs, storage)
+        if observation_root is not None and obs is not None and not obs.is_empty()
+        else []
+    )
+    try:
+        cursor.commit()
+    except BaseException:
+        _discard_observation_files(placed)
+        raise
+
+
+def _discard_orphaned_observations_duck(conn: duckdb.DuckDBPyConnection, observation_root: pathlib.Path) -> int:
+    """Remove observation files left behind by stores that never committed; returns the files removed."""
+    shutil.rmtree(observation_root / ".staging", ignore_errors=True)
+    # Writes are serialised, so an uncommitted store only ever held job ids
+    # above every committed one. Its files are the ones starting past them.
+    last_job_id = _last_job_id_duck(conn)
+    orphans = [
+        path
+        for path in observation_root.glob("*/h3_coarse=*/part-*-*-*.parquet")
+        if int(path.name.split("-")[1]) > last_job_id
+    ]
+    _discard_observation_files(orphans)
+    if orphans:
+        logger.warning("AgriGEE cache: removed %d observation files of uncommitted stores", len(orphans))
+    return len(orphans)
+
+
+def _last_job_id_duck(conn: duckdb.DuckDBPyConnection) -> int:
+    # Parquet-backed jobs are committed only after their files are in place,
+    # so every job older than this write already has observations.
+    row = conn.execute("SELECT COALESCE(MAX(id), 0) FROM sits_jobs").fetchone()
+    assert row is not None
+    return int(row[0])
+
+
+def _resolve_job_duck(
+    cursor: duckdb.DuckDBPyConnection,
+    table_name: str,
+    geom_values: list[Any],
+    job_values: list[Any],
+    check_observations: bool,
+) -> tuple[int, bool]:
+    """Return a feature's job id, inserting missing rows, and whether the job already has observations."""
+    job_hash, satellite_short_name, params_hash, _, _, start_date, end_date, _ = job_values
+    # DuckDB cannot DO UPDATE rows that a foreign key references, so one probe
+    # resolves the geometry, the job and its observations before inserting
+    # only what is missing. Writes are serialised, so nothing can slip in
+    # between the probe and the inserts.
+    already_sql = (
+        f'EXISTS (SELECT 1 FROM "{table_name}" o WHERE o.job_id = s.id)' if check_observations else "s.id IS NOT NULL"
+    )
+    row = cursor.execute(
+        f"""
+        SELECT g.id, s.id, {already_sql}
+        FROM geometries g
+        LEFT JOIN sits_jobs s
+          ON s.geometry_id = g.id AND s.satellite_short_name = ? AND s.params_hash = ?
+         AND s.start_date = ? AND s.end_date = ?
+        WHERE g.geom_hash = ?
+        """,
+        [satellite_short_name, params_hash, start_date, end_date, geom_values[0]],
+    ).fetchone()
+    if row is not None and row[1] is not None:
+        return int(row[1]), bool(row[2])
+
+    if row is None:
+        row = cursor.execute(
+            """
+            INSERT INTO geometries (geom_hash, geometry, repr_point_x, repr_point_y, geom_type, h3_coarse, h3_fine)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            RETURNING id
+            """,
+            geom_values,
+        ).fetchone()
+        assert row is not None
+    job_row = cursor.execute(
+        """
+        INSERT INTO sits_jobs
+          (job_hash, geometry_id, satellite_short_name, params_hash, reducers,
+           subsampling_max_pixels, start_date, end_date, fetched_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        RETURNING id
+        """,
+        [job_hash, row[0], *job_values[1:]],
+    ).fetchone()
+    assert job_row is not None
+    return int(job_row[0]), False
+
+
 def _store_sits_duck(
     conn: duckdb.DuckDBPyConnection,
     df: pd.DataFrame,
@@ -489,7 +1511,7 @@ def _store_sits_duck(
         return None
 
     geom_hash = _compute_geom_hash(geometry)
-    params_hash = _compute_params_hash(satellite, reducers, subsampling_max_pixels)
+    params_hash = compute_params_hash(satellite, reducers, subsampling_max_pixels)
     job_hash = _compute_job_hash(geom_hash, params_hash, start_date, end_date)
     table_name = satellite.shortName
     band_cols = _get_band_columns(satellite)
@@ -497,33 +1519,20 @@ def _store_sits_duck(
     rx, ry = _repr_point(geometry)
     gtype = _geom_type_str(geometry)
     h3_coarse, h3_fine = _compute_h3_for_point(rx, ry)
+    observation_root = _duck_observation_root
+    with _duck_reader(conn) as cursor:
+        storage = _band_storage(cursor, table_name)
 
-    with _duck_write_lock:
-        conn.begin()
+    def write(cursor: duckdb.DuckDBPyConnection) -> int:
+        pending: pl.DataFrame | None = None
+        cursor.begin()
         try:
-            conn.execute(
-                """
-                INSERT INTO geometries (geom_hash, geometry, repr_point_x, repr_point_y, geom_type, h3_coarse, h3_fine)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT (geom_hash) DO NOTHING
-                """,
+            job_id, already = _resolve_job_duck(
+                cursor,
+                table_name,
                 [geom_hash, geometry.wkb, rx, ry, gtype, h3_coarse, h3_fine],
-            )
-            geom_id_row = conn.execute("SELECT id FROM geometries WHERE geom_hash = ?", [geom_hash]).fetchone()
-            assert geom_id_row is not None
-            geom_id: int = int(geom_id_row[0])
-
-            conn.execute(
-                """
-                INSERT INTO sits_jobs
-                  (job_hash, geometry_id, satellite_short_name, params_hash, reducers,
-                   subsampling_max_pixels, start_date, end_date, fetched_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT (geometry_id, satellite_short_name, params_hash, start_date, end_date) DO NOTHING
-                """,
                 [
                     job_hash,
-                    geom_id,
                     satellite.shortName,
                     params_hash,
                     json.dumps(sorted(reducers)) if reducers else None,
@@ -532,18 +1541,10 @@ def _store_sits_duck(
                     end_date,
                     datetime.now(UTC).isoformat(),
                 ],
+                check_observations=observation_root is None,
             )
-            job_id_row = conn.execute(
-                """SELECT id FROM sits_jobs WHERE geometry_id = ? AND satellite_short_name = ?
-                   AND params_hash = ? AND start_date = ? AND end_date = ?""",
-                [geom_id, satellite.shortName, params_hash, start_date, end_date],
-            ).fetchone()
-            assert job_id_row is not None
-            job_id: int = int(job_id_row[0])
-
-            already = conn.execute(f'SELECT 1 FROM "{table_name}" WHERE job_id = ? LIMIT 1', [job_id]).fetchone()
             if already:
-                conn.commit()
+                cursor.commit()
                 return job_id
 
             present_band_cols = [c for c in band_cols if c in df.columns]
@@ -554,17 +1555,26 @@ def _store_sits_duck(
             rows: list[list[Any]] = []
             for raw in df.to_dict("records"):
                 ts_val = str(raw[ts_col]) if ts_col and pd.notna(raw[ts_col]) else None
-                rows.append([job_id, ts_val, *[None if pd.isna(raw[c]) else float(raw[c]) for c in present_band_cols]])
-
-            if rows:
-                conn.executemany(f'INSERT INTO "{table_name}" ({col_names}) VALUES ({ph})', rows)
-
-            conn.commit()
+                rows.append([
+                    job_id,
+                    ts_val,
+                    *[None if pd.isna(raw[c]) else storage.encode_value(float(raw[c])) for c in present_band_cols],
+                ])
+
+            if observation_root is None:
+                if rows:
+                    cursor.executemany(f'INSERT INTO "{table_name}" ({col_names}) VALUES ({ph})', rows)
+            elif rows:
+                schema = {"job_id": pl.Int64, "timestamp": pl.Utf8, **dict.fromkeys(present_band_cols, pl.Float64)}
+                pending = pl.DataFrame(rows, schema=schema, orient="row").with_columns(h3_coarse=pl.lit(h3_coarse))
+
+            _commit_with_observations_duck(cursor, observation_root, table_name, pending, storage)
         except Exception:
-            conn.rollback()
+            cursor.rollback()
             raise
+        return job_id
 
-    return job_id
+    return _duck_write(conn, write)
 
 
 def _store_sits_duck_polars(
@@ -581,7 +1591,7 @@ def _store_sits_duck_polars(
         return None
 
     geom_hash = _compute_geom_hash(geometry)
-    params_hash = _compute_params_hash(satellite, reducers, subsampling_max_pixels)
+    params_hash = compute_params_hash(satellite, reducers, subsampling_max_pixels)
     job_hash = _compute_job_hash(geom_hash, params_hash, start_date, end_date)
     table_name = satellite.shortName
     band_cols = _get_band_columns(satellite)
@@ -589,33 +1599,20 @@ def _store_sits_duck_polars(
     rx, ry = _repr_point(geometry)
     gtype = _geom_type_str(geometry)
     h3_coarse, h3_fine = _compute_h3_for_point(rx, ry)
+    observation_root = _duck_observation_root
+    with _duck_reader(conn) as cursor:
+        storage = _band_storage(cursor, table_name)
 
-    with _duck_write_lock:
-        conn.begin()
+    def write(cursor: duckdb.DuckDBPyConnection) -> int:
+        pending: pl.DataFrame | None = None
+        cursor.begin()
         try:
-            conn.execute(
-                """
-                INSERT INTO geometries (geom_hash, geometry, repr_point_x, repr_point_y, geom_type, h3_coarse, h3_fine)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT (geom_hash) DO NOTHING
-                """,
+            job_id, already = _resolve_job_duck(
+                cursor,
+                table_name,
                 [geom_hash, geometry.wkb, rx, ry, gtype, h3_coarse, h3_fine],
-            )
-            geom_id_row = conn.execute("SELECT id FROM geometries WHERE geom_hash = ?", [geom_hash]).fetchone()
-            assert geom_id_row is not None
-            geom_id: int = int(geom_id_row[0])
-
-            conn.execute(
-                """
-                INSERT INTO sits_jobs
-                  (job_hash, geometry_id, satellite_short_name, params_hash, reducers,
-                   subsampling_max_pixels, start_date, end_date, fetched_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT (geometry_id, satellite_short_name, params_hash, start_date, end_date) DO NOTHING
-                """,
                 [
                     job_hash,
-                    geom_id,
                     satellite.shortName,
                     params_hash,
                     json.dumps(sorted(reducers)) if reducers else None,
@@ -624,18 +1621,10 @@ def _store_sits_duck_polars(
                     end_date,
                     datetime.now(UTC).isoformat(),
                 ],
+                check_observations=observation_root is None,
             )
-            job_id_row = conn.execute(
-                """SELECT id FROM sits_jobs WHERE geometry_id = ? AND satellite_short_name = ?
-                   AND params_hash = ? AND start_date = ? AND end_date = ?""",
-                [geom_id, satellite.shortName, params_hash, start_date, end_date],
-            ).fetchone()
-            assert job_id_row is not None
-            job_id: int = int(job_id_row[0])
-
-            already = conn.execute(f'SELECT 1 FROM "{table_name}" WHERE job_id = ? LIMIT 1', [job_id]).fetchone()
             if already:
-                conn.commit()
+                cursor.commit()
                 return job_id
 
             present_band_cols = [c for c in band_cols if c in df.columns]
@@ -646,21 +1635,114 @@ def _store_sits_duck_polars(
                 .cast({"timestamp": pl.Utf8})
             )
             col_order = ["job_id", "timestamp", *present_band_cols]
-            obs_pl = obs_pl.select(col_order)
+            obs_pl = storage.encode(obs_pl.select(col_order), present_band_cols)
             col_sql = ", ".join(f'"{column}"' for column in col_order)
 
-            conn.register("_obs_tmp", obs_pl.to_arrow())
+            if observation_root is not None:
+                pending = obs_pl.with_columns(h3_coarse=pl.lit(h3_coarse))
+            else:
+                cursor.register("_obs_tmp", obs_pl.to_arrow())
+                try:
+                    cursor.execute(f'INSERT INTO "{table_name}" ({col_sql}) SELECT {col_sql} FROM _obs_tmp')
+                finally:
+                    cursor.unregister("_obs_tmp")
+
+            _commit_with_observations_duck(cursor, observation_root, table_name, pending, storage)
+        except Exception:
+            cursor.rollback()
+            raise
+        return job_id
+
+    return _duck_write(conn, write)
+
+
+def _store_sits_batch_duck(
+    conn: duckdb.DuckDBPyConnection,
+    df: pl.DataFrame,
+    features: pl.DataFrame,
+    key_col: str,
+    satellite: AbstractSatellite,
+    reducers: set[str] | None,
+    subsampling_max_pixels: float,
+) -> dict[Any, int]:
+    params_hash = compute_params_hash(satellite, reducers, subsampling_max_pixels)
+    geoms, jobs = _prepare_batch_store_frames(df, features, key_col, params_hash)
+    table_name = satellite.shortName
+    band_cols = _get_band_columns(satellite)
+    observation_root = _duck_observation_root
+    with _duck_reader(conn) as cursor:
+        storage = _band_storage(cursor, table_name)
+
+    def write(cursor: duckdb.DuckDBPyConnection) -> dict[Any, int]:
+        pending: pl.DataFrame | None = None
+        cursor.begin()
+        try:
+            cursor.register("_geom_batch", geoms.to_arrow())
+            cursor.register("_job_batch", jobs.unique(subset=["job_hash"], maintain_order=True).to_arrow())
             try:
-                conn.execute(f'INSERT INTO "{table_name}" ({col_sql}) SELECT {col_sql} FROM _obs_tmp')
+                cursor.execute("""
+                    INSERT INTO geometries (geom_hash, geometry, repr_point_x, repr_point_y, geom_type, h3_coarse, h3_fine)
+                    SELECT geom_hash, geometry, repr_point_x, repr_point_y, geom_type, h3_coarse, h3_fine
+                    FROM _geom_batch
+                    ON CONFLICT (geom_hash) DO NOTHING
+                """)
+                already_sql = (
+                    f'EXISTS (SELECT 1 FROM "{table_name}" o WHERE o.job_id = s.id)'
+                    if observation_root is None
+                    else f"s.id <= {_last_job_id_duck(cursor)}"
+                )
+                cursor.execute(
+                    """
+                    INSERT INTO sits_jobs
+                      (job_hash, geometry_id, satellite_short_name, params_hash, reducers,
+                       subsampling_max_pixels, start_date, end_date, fetched_at)
+                    SELECT j.job_hash, g.id, ?, ?, ?, ?, j.start_date, j.end_date, ?
+                    FROM _job_batch j JOIN geometries g ON g.geom_hash = j.geom_hash
+                    ON CONFLICT (geometry_id, satellite_short_name, params_hash, start_date, end_date) DO NOTHING
+                    """,
+                    [
+                        satellite.shortName,
+                        params_hash,
+                        json.dumps(sorted(reducers)) if reducers else None,
+                        subsampling_max_pixels,
+                        datetime.now(UTC).isoformat(),
+                    ],
+                )
+                job_rows = cursor.execute(f"""
+                    SELECT s.job_hash, s.id AS job_id, {already_sql} AS already
+                    FROM sits_jobs s JOIN _job_batch j ON s.job_hash = j.job_hash
+                """).pl()
             finally:
-                conn.unregister("_obs_tmp")
-
-            conn.commit()
+                cursor.unregister("_geom_batch")
+                cursor.unregister("_job_batch")
+
+            job_ids, obs_pl = _batch_observations(df, jobs, job_rows, key_col, band_cols)
+            obs_pl = storage.encode(obs_pl, obs_pl.columns[2:])
+            if not obs_pl.is_empty() and observation_root is not None:
+                cells = (
+                    jobs
+                    .select("job_hash", "geom_hash")
+                    .join(geoms.select("geom_hash", "h3_coarse"), on="geom_hash")
+                    .join(job_rows.select("job_hash", "job_id"), on="job_hash")
+                    .select("job_id", "h3_coarse")
+                    .unique(subset=["job_id"])
+                )
+                pending = obs_pl.join(cells, on="job_id", how="left", maintain_order="left")
+            elif not obs_pl.is_empty():
+                col_sql = ", ".join(f'"{column}"' for column in obs_pl.columns)
+                cursor.register("_obs_tmp", obs_pl.to_arrow())
+                try:
+                    cursor.execute(f'INSERT INTO "{table_name}" ({col_sql}) SELECT {col_sql} FROM _obs_tmp')
+                finally:
+                    cursor.unregister("_obs_tmp")
+
+            _commit_with_observations_duck(cursor, observation_root, table_name, pending, storage)
         except Exception:
-            conn.rollback()
+            cursor.rollback()
             raise
+        return job_ids
 
-    return job_id
+    return _duck_write(conn, write)
 
 
 # ---------------------------------------------------------------------------
@@ -694,6 +1776,26 @@ def _ensure_postgis_extension(conn: sa.Connection) -> None:
     conn.execute(sa.text("CREATE EXTENSION IF NOT EXISTS postgis"))
 
 
+def _copy_rows_pg(conn: sa.Connection, target: str, frame: pl.DataFrame) -> None:
+    # One COPY stream instead of a bound INSERT per row. In CSV, an unquoted
+    # empty field is NULL and a quoted one an empty string, which is exactly
+    # how Polars writes them. NaN becomes NULL too, as it always did when
+    # rows went through pandas; Postgres would otherwise keep it as NaN.
+    if frame.is_empty():
+        return
+    buffer = io.BytesIO()
+    frame.with_columns(pl.col(pl.Float32, pl.Float64).fill_nan(None)).write_csv(buffer, include_header=False)
+    buffer.seek(0)
+    columns = ", ".join(f'"{c}"' for c in frame.columns)
+    driver = conn.connection.driver_connection
+    assert driver is not None
+    cursor = driver.cursor()
+    try:
+        cursor.copy_expert(f"COPY {target} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+    finally:
+        cursor.close()
+
+
 def _ensure_geometries_table_pg(conn: sa.Connection) -> None:
     conn.execute(
         sa.text("""
@@ -730,10 +1832,13 @@ def _ensure_sits_jobs_table_pg(conn: sa.Connection) -> None:
             start_date             TEXT   NOT NULL,
             end_date               TEXT   NOT NULL,
             fetched_at             TIMESTAMPTZ NOT NULL,
+            last_read_at           TIMESTAMPTZ,
+            read_count             BIGINT NOT NULL DEFAULT 0,
             UNIQUE (geometry_id, satellite_short_name, params_hash, start_date, end_date)
         )
     """)
     )
+    _ensure_job_access_columns(conn)
     conn.execute(sa.text("CREATE INDEX IF NOT EXISTS idx_jobs_hash ON sits_jobs (job_hash)"))
     conn.execute(
         sa.text(
@@ -758,10 +1863,16 @@ def _ensure_api_jobs_table_pg(conn: sa.Connection) -> None:
     conn.execute(sa.text("CREATE INDEX IF NOT EXISTS idx_api_jobs_status ON api_jobs (status)"))
 
 
-def _ensure_satellite_table_pg(conn: sa.Connection, table_name: str, band_columns: list[str]) -> None:
+def _ensure_satellite_table_pg(
+    conn: sa.Connection,
+    table_name: str,
+    band_columns: list[str],
+    storage: _BandStorage | None = None,
+) -> None:
     if not band_columns:
         return
-    band_cols_sql = ",\n    ".join(f'"{col}" REAL' for col in band_columns)
+    storage = _register_band_storage(conn, table_name, storage or _configured_band_storage(table_name))
+    band_cols_sql = ",\n    ".join(f'"{col}" {storage.sql_type(postgres=True)}' for col in band_columns)
     conn.execute(
         sa.text(f"""
         CREATE TABLE IF NOT EXISTS "{table_name}" (
@@ -781,6 +1892,35 @@ def _ensure_satellite_table_pg(conn: sa.Connection, table_name: str, band_column
 # ---------------------------------------------------------------------------
 
 
+def _geometry_jobs_pg(
+    conn: sa.Connection,
+    geometry_key: tuple[Any, ...],
+    satellite_short_name: str,
+    params_hash: str,
+) -> _GeometryJobs:
+    if geometry_key[0] == "point":
+        geom_row = conn.execute(
+            sa.text("SELECT id FROM geometries WHERE repr_point_x = :rx AND repr_point_y = :ry"),
+            {"rx": geometry_key[1], "ry": geometry_key[2]},
+        ).fetchone()
+    else:
+        geom_row = conn.execute(
+            sa.text("SELECT id FROM geometries WHERE geom_hash = :h"), {"h": geometry_key[1]}
+        ).fetchone()
+
+    if geom_row is None:
+        return None
+
+    job_rows = conn.execute(
+        sa.text("""
+            SELECT id, start_date, end_date FROM sits_jobs
+            WHERE geometry_id = :gid AND satellite_short_name = :sat AND params_hash = :ph
+        """),
+        {"gid": int(geom_row[0]), "sat": satellite_short_name, "ph": params_hash},
+    ).fetchall()
+    return tuple((int(r[0]), str(r[1]), str(r[2])) for r in job_rows)
+
+
 def _fetch_sits_with_gaps_pg(
     engine: sa.Engine,
     geometry: Any,
@@ -790,45 +1930,27 @@ def _fetch_sits_with_gaps_pg(
     reducers: set[str] | None,
     subsampling_max_pixels: float,
 ) -> tuple[pl.DataFrame, list[tuple[str, str]]]:
-    params_hash = _compute_params_hash(satellite, reducers, subsampling_max_pixels)
+    params_hash = compute_params_hash(satellite, reducers, subsampling_max_pixels)
     band_cols = _get_band_columns(satellite)
     table_name = satellite.shortName
 
     with engine.connect() as conn:
-        if geometry.geom_type == "Point":
-            rx, ry = _repr_point(geometry)
-            geom_row = conn.execute(
-                sa.text("SELECT id FROM geometries WHERE repr_point_x = :rx AND repr_point_y = :ry"),
-                {"rx": rx, "ry": ry},
-            ).fetchone()
-        else:
-            geom_hash = _compute_geom_hash(geometry)
-            geom_row = conn.execute(
-                sa.text("SELECT id FROM geometries WHERE geom_hash = :h"), {"h": geom_hash}
-            ).fetchone()
-
-        if geom_row is None:
-            return pl.DataFrame(), [(start_date, end_date)]
-
-        geom_id = int(geom_row[0])
-
-        job_rows = conn.execute(
-            sa.text("""
-                SELECT id, start_date, end_date FROM sits_jobs
-                WHERE geometry_id = :gid AND satellite_short_name = :sat AND params_hash = :ph
-                  AND start_date <= :ed AND end_date >= :sd
-            """),
-            {"gid": geom_id, "sat": satellite.shortName, "ph": params_hash, "sd": start_date, "ed": end_date},
-        ).fetchall()
-
+        geometry_key = _geometry_lookup_key(geometry)
+        jobs = _geometry_index(engine).get_or_load(
+            geometry_key,
+            (table_name, params_hash),
+            lambda: _geometry_jobs_pg(conn, geometry_key, table_name, params_hash),
+        )
+        job_rows = [job for job in jobs or () if job[1] <= end_date and job[2] >= start_date]
         if not job_rows:
             return pl.DataFrame(), [(start_date, end_date)]
 
-        covered = [(str(r[1]), str(r[2])) for r in job_rows]
-        job_ids = [int(r[0]) for r in job_rows]
+        covered = [(job_start, job_end) for _, job_start, job_end in job_rows]
+        job_ids = [job_id for job_id, _, _ in job_rows]
         gaps = _compute_gaps(start_date, end_date, covered)
+        _access_log(engine).record(job_ids)
 
-        cols_sql = ", ".join(f'"{c}"' for c in band_cols)
+        cols_sql = _band_select_sql(_band_storage(conn, table_name), band_cols)
         placeholders = ", ".join(f":id{i}" for i in range(len(job_ids)))
         params: dict[str, Any] = {f"id{i}": jid for i, jid in enumerate(job_ids)}
         params["sd"] = start_date
@@ -860,11 +1982,11 @@ def _fetch_sits_by_jids_pg(
 
     table_name = satellite.shortName
     band_cols = _get_band_columns(satellite)
-    cols_sql = ", ".join(f'"{c}"' for c in band_cols)
     result: dict[int, pl.DataFrame] = {}
     unique_job_ids = list(dict.fromkeys(job_ids))
 
     with engine.connect() as conn:
+        cols_sql = _band_select_sql(_band_storage(conn, table_name), band_cols)
         for chunk in _chunked(unique_job_ids, 400):
             placeholders = ", ".join(f":id{i}" for i in range(len(chunk)))
             params: dict[str, int] = {f"id{i}": jid for i, jid in enumerate(chunk)}
@@ -895,6 +2017,35 @@ def _fetch_sits_by_jids_pg(
     return result
 
 
+def _fetch_sits_by_requests_pg(
+    engine: sa.Engine,
+    satellite: AbstractSatellite,
+    requests: pl.DataFrame,
+    key_col: str,
+    start_date_col: str,
+    end_date_col: str,
+) -> pl.DataFrame:
+    band_cols = _get_band_columns(satellite)
+    mapping = _prepare_cached_requests_frame(requests, start_date_col, end_date_col)
+    with engine.connect() as conn:
+        sql = _CACHED_REQUESTS_SQL.format(
+            cols=_band_select_sql(_band_storage(conn, satellite.shortName), band_cols, "t."),
+            names=", ".join(f'"{c}"' for c in band_cols),
+            shared_names=", ".join(f'h."{c}"' for c in band_cols),
+            requests="""
+                unnest(
+                    CAST(:job_order AS BIGINT[]), CAST(:request AS BIGINT[]), CAST(:job_id AS BIGINT[]),
+                    CAST(:job_count AS INTEGER[]), CAST(:window_start AS DOUBLE PRECISION[]),
+                    CAST(:window_end AS DOUBLE PRECISION[])
+                ) AS m(job_order, request, job_id, job_count, window_start, window_end)
+            """,
+            table=f'"{satellite.shortName}"',
+        )
+        fetched = conn.execute(sa.text(sql), mapping.to_dict(as_series=False)).fetchall()
+    rows = pl.DataFrame(fetched, schema=["request", "timestamp", *band_cols], orient="row")
+    return _finalize_cached_requests(rows, requests, key_col, band_cols)
+
+
 def _fetch_sits_batch_coverage_pg(
     engine: sa.Engine,
     gdf: GeoDataFrameLike,
@@ -905,38 +2056,31 @@ def _fetch_sits_batch_coverage_pg(
     end_date_col: str,
     crs: str | None = None,
 ) -> dict[int, tuple[list[int], list[tuple[str, str]]]]:
-    params_hash = _compute_params_hash(satellite, reducers, subsampling_max_pixels)
-    normalized, h3_coarse_vals, h3_fine_vals, rows = _prepare_batch_lookup_rows(gdf, start_date_col, end_date_col, crs)
-    if not h3_coarse_vals:
+    params_hash = compute_params_hash(satellite, reducers, subsampling_max_pixels)
+    lookup = _prepare_batch_lookup_frame(gdf, start_date_col, end_date_col, crs)
+    if lookup.is_empty():
         return {}
 
-    with engine.connect() as conn:
-        candidate_rows = conn.execute(
-            sa.text("""
-                SELECT id, geom_hash, h3_fine, geom_type, repr_point_x, repr_point_y
-                FROM geometries
-                WHERE h3_coarse = ANY(:coarse) AND h3_fine = ANY(:fine)
-            """),
-            {"coarse": h3_coarse_vals, "fine": h3_fine_vals},
-        ).fetchall()
-
-        if not candidate_rows:
-            return {}
-
-        resolved_rows = _resolve_geometry_ids(normalized, rows, candidate_rows, start_date_col, end_date_col)
-        if not resolved_rows:
-            return {}
-
-        unique_geom_ids = list(dict.fromkeys(geom_id for _, geom_id, _, _ in resolved_rows))
-        job_rows = conn.execute(
+    # The lookup rows are staged server-side, so only matching (position, job)
+    # pairs come back over the wire, however many geometries share their cells.
+    with engine.begin() as conn:
+        conn.execute(
             sa.text("""
-                SELECT geometry_id, id, start_date, end_date FROM sits_jobs
-                WHERE geometry_id = ANY(:gids)
-                  AND satellite_short_name = :sat AND params_hash = :ph
-            """),
-            {"gids": unique_geom_ids, "sat": satellite.shortName, "ph": params_hash},
+            CREATE TEMP TABLE _coverage_rows (
+                position BIGINT, geom_hash TEXT, is_point BOOLEAN,
+                repr_x DOUBLE PRECISION, repr_y DOUBLE PRECISION,
+                h3_fine TEXT, q_start TEXT, q_end TEXT
+            ) ON COMMIT DROP
+        """)
+        )
+        _copy_rows_pg(conn, "_coverage_rows", lookup)
+        conn.execute(sa.text("ANALYZE _coverage_rows"))
+        match_rows = conn.execute(
+            sa.text(_BATCH_COVERAGE_SQL.format(rows="_coverage_rows r", sat=":sat", ph=":ph")),
+            {"sat": satellite.shortName, "ph": params_hash},
         ).fetchall()
-    return _finalize_batch_coverage(resolved_rows, _build_jobs_by_geom(job_rows))
+    matches = pl.DataFrame(match_rows, schema=_BATCH_COVERAGE_SCHEMA, orient="row")
+    return _finalize_batch_coverage(matches)
 
 
 # ---------------------------------------------------------------------------
@@ -946,7 +2090,7 @@ def _fetch_sits_batch_coverage_pg(
 
 def _store_sits_pg(
     engine: sa.Engine,
-    df: pd.DataFrame,
+    df: pl.DataFrame,
     geometry: Any,
     start_date: str,
     end_date: str,
@@ -954,11 +2098,11 @@ def _store_sits_pg(
     reducers: set[str] | None,
     subsampling_max_pixels: float,
 ) -> int | None:
-    if df.empty:
+    if df.is_empty():
         return None
 
     geom_hash = _compute_geom_hash(geometry)
-    params_hash = _compute_params_hash(satellite, reducers, subsampling_max_pixels)
+    params_hash = compute_params_hash(satellite, reducers, subsampling_max_pixels)
     job_hash = _compute_job_hash(geom_hash, params_hash, start_date, end_date)
     table_name = satellite.shortName
     band_cols = _get_band_columns(satellite)
@@ -967,82 +2111,143 @@ def _store_sits_pg(
     gtype = _geom_type_str(geometry)
     h3_coarse, h3_fine = _compute_h3_for_point(rx, ry)
 
+    with engine.begin() as conn:
+        # One statement upserts the geometry and the job and probes for
+        # observations. DO UPDATE of a column the conflict leaves unchanged
+        # makes RETURNING yield the id of an existing row as well.
+        job_row = conn.execute(
+            sa.text(f"""
+            WITH g AS (
+                INSERT INTO geometries (geom_hash, geometry, repr_point_x, repr_point_y, geom_type, h3_coarse, h3_fine)
+                VALUES (:h, ST_GeomFromWKB(:wkb, 4326), :rx, :ry, :gt, :hc, :hf)
+                ON CONFLICT (geom_hash) DO UPDATE SET geom_type = excluded.geom_type
+                RETURNING id
+            ), j AS (
+                INSERT INTO sits_jobs
+                  (job_hash, geometry_id, satellite_short_name, params_hash, reducers,
+                   subsampling_max_pixels, start_date, end_date, fetched_at)
+                SELECT :jh, g.id, :sat, :ph, :red, :sub, :sd, :ed, :now FROM g
+                ON CONFLICT (geometry_id, satellite_short_name, params_hash, start_date, end_date)
+                DO UPDATE SET subsampling_max_pixels = excluded.subsampling_max_pixels
+                RETURNING id
+            )
+            SELECT j.id, EXISTS (SELECT 1 FROM "{table_name}" o WHERE o.job_id = j.id) FROM j
+        """),
+            {
+                "h": geom_hash,
+                "wkb": geometry.wkb,
+                "rx": rx,
+                "ry": ry,
+                "gt": gtype,
+                "hc": h3_coarse,
+                "hf": h3_fine,
+                "jh": job_hash,
+                "sat": satellite.shortName,
+                "ph": params_hash,
+                "red": json.dumps(sorted(reducers)) if reducers else None,
+                "sub": subsampling_max_pixels,
+                "sd": start_date,
+                "ed": end_date,
+                "now": datetime.now(UTC).isoformat(),
+            },
+        ).fetchone()
+        assert job_row is not None
+        job_id: int = job_row[0]
+        if job_row[1]:
+            return job_id
+
+        storage = _band_storage(conn, table_name)
+        present_band_cols = [c for c in band_cols if c in df.columns]
+        if "timestamp" not in df.columns:
+            df = df.with_columns(timestamp=pl.lit(None, dtype=pl.Utf8))
+        obs_pl = (
+            df
+            .select(["timestamp", *present_band_cols])
+            .with_columns(pl.lit(job_id).alias("job_id"))
+            .cast({"timestamp": pl.Utf8})
+            .select(["job_id", "timestamp", *present_band_cols])
+        )
+        _copy_rows_pg(conn, f'"{table_name}"', storage.encode(obs_pl, present_band_cols))
+
+    return job_id
+
+
+def _store_sits_batch_pg(
+    engine: sa.Engine,
+    df: pl.DataFrame,
+    features: pl.DataFrame,
+    key_col: str,
+    satellite: AbstractSatellite,
+    reducers: set[str] | None,
+    subsampling_max_pixels: float,
+) -> dict[Any, int]:
+    params_hash = compute_params_hash(satellite, reducers, subsampling_max_pixels)
+    geoms, jobs = _prepare_batch_store_frames(df, features, key_col, params_hash)
+    table_name = satellite.shortName
+    band_cols = _get_band_columns(satellite)
+    unique_jobs = jobs.unique(subset=["job_hash"], maintain_order=True)
+
     with engine.begin() as conn:
+        conn.execute(
+            sa.text("""
+            CREATE TEMP TABLE _geom_batch (
+                geom_hash TEXT, geometry TEXT, repr_point_x DOUBLE PRECISION, repr_point_y DOUBLE PRECISION,
+                geom_type TEXT, h3_coarse TEXT, h3_fine TEXT
+            ) ON COMMIT DROP
+        """)
+        )
         conn.execute(
             sa.text(
-                "INSERT INTO geometries "
-                "(geom_hash, geometry, repr_point_x, repr_point_y, geom_type, h3_coarse, h3_fine) "
-                "VALUES (:h, ST_GeomFromWKB(:wkb, 4326), :rx, :ry, :gt, :hc, :hf) "
-                "ON CONFLICT (geom_hash) DO NOTHING"
-            ),
-            {"h": geom_hash, "wkb": geometry.wkb, "rx": rx, "ry": ry, "gt": gtype, "hc": h3_coarse, "hf": h3_fine},
+                "CREATE TEMP TABLE _job_batch (job_hash TEXT, geom_hash TEXT, start_date TEXT, end_date TEXT) "
+                "ON COMMIT DROP"
+            )
         )
-
-        _geom_row = conn.execute(sa.text("SELECT id FROM geometries WHERE geom_hash = :h"), {"h": geom_hash}).fetchone()
-        assert _geom_row is not None
-        geom_id: int = _geom_row[0]
+        _copy_rows_pg(conn, "_geom_batch", geoms.with_columns(pl.col("geometry").bin.encode("hex")))
+        _copy_rows_pg(conn, "_job_batch", unique_jobs.select("job_hash", "geom_hash", "start_date", "end_date"))
 
+        conn.execute(
+            sa.text("""
+            INSERT INTO geometries (geom_hash, geometry, repr_point_x, repr_point_y, geom_type, h3_coarse, h3_fine)
+            SELECT geom_hash, ST_GeomFromWKB(decode(geometry, 'hex'), 4326), repr_point_x, repr_point_y,
+                   geom_type, h3_coarse, h3_fine
+            FROM _geom_batch
+            ON CONFLICT (geom_hash) DO NOTHING
+        """)
+        )
         conn.execute(
             sa.text("""
             INSERT INTO sits_jobs
               (job_hash, geometry_id, satellite_short_name, params_hash, reducers,
                subsampling_max_pixels, start_date, end_date, fetched_at)
-            VALUES (:jh, :gid, :sat, :ph, :red, :sub, :sd, :ed, :now)
+            SELECT j.job_hash, g.id, :sat, :ph, :red, :sub, j.start_date, j.end_date, :now
+            FROM _job_batch j JOIN geometries g ON g.geom_hash = j.geom_hash
             ON CONFLICT (geometry_id, satellite_short_name, params_hash, start_date, end_date) DO NOTHING
         """),
             {
-                "jh": job_hash,
-                "gid": geom_id,
                 "sat": satellite.shortName,
                 "ph": params_hash,
                 "red": json.dumps(sorted(reducers)) if reducers else None,
                 "sub": subsampling_max_pixels,
-                "sd": start_date,
-                "ed": end_date,
                 "now": datetime.now(UTC).isoformat(),
             },
         )
+        rows = conn.execute(
+            sa.text(f"""
+            SELECT s.job_hash, s.id, EXISTS (SELECT 1 FROM "{table_name}" o WHERE o.job_id = s.id)
+            FROM sits_jobs s JOIN _job_batch j ON s.job_hash = j.job_hash
+        """)
+        ).fetchall()
+        job_rows = pl.DataFrame(
+            [tuple(row) for row in rows],
+            schema={"job_hash": pl.String, "job_id": pl.Int64, "already": pl.Boolean},
+            orient="row",
+        )
 
-        _job_row = conn.execute(
-            sa.text("""
-            SELECT id FROM sits_jobs
-            WHERE geometry_id = :gid AND satellite_short_name = :sat
-              AND params_hash = :ph AND start_date = :sd AND end_date = :ed
-        """),
-            {"gid": geom_id, "sat": satellite.shortName, "ph": params_hash, "sd": start_date, "ed": end_date},
-        ).fetchone()
-        assert _job_row is not None
-        job_id: int = _job_row[0]
-
-        already_exists = conn.execute(
-            sa.text(f'SELECT 1 FROM "{table_name}" WHERE job_id = :jid LIMIT 1'), {"jid": job_id}
-        ).fetchone()
-        if already_exists:
-            return job_id
-
-        present_band_cols = [c for c in band_cols if c in df.columns]
-        col_names_sql = ", ".join(['"job_id"', '"timestamp"', *[f'"{c}"' for c in present_band_cols]])
-        placeholders_sql = ", ".join([":job_id", ":timestamp", *[f":band_{i}" for i in range(len(present_band_cols))]])
-        ts_col = "timestamp" if "timestamp" in df.columns else None
-
-        rows_to_insert = []
-        for raw in df.to_dict("records"):
-            record: dict[str, Any] = {
-                "job_id": job_id,
-                "timestamp": str(raw[ts_col]) if ts_col and pd.notna(raw[ts_col]) else None,
-            }
-            for i, c in enumerate(present_band_cols):
-                v = raw[c]
-                record[f"band_{i}"] = None if pd.isna(v) else float(v)
-            rows_to_insert.append(record)
-
-        if rows_to_insert:
-            conn.execute(
-                sa.text(f'INSERT INTO "{table_name}" ({col_names_sql}) VALUES ({placeholders_sql})'),
-                rows_to_insert,
-            )
+        job_ids, obs_pl = _batch_observations(df, jobs, job_rows, key_col, band_cols)
+        obs_pl = _band_storage(conn, table_name).encode(obs_pl, obs_pl.columns[2:])
+        _copy_rows_pg(conn, f'"{table_name}"', obs_pl)
 
-    return job_id
+    return job_ids
 
 
 # ---------------------------------------------------------------------------
@@ -1060,9 +2265,18 @@ def fetch_sits_with_gaps(
     subsampling_max_pixels: float,
 ) -> tuple[pl.DataFrame, list[tuple[str, str]]]:
     if isinstance(engine, duckdb.DuckDBPyConnection):
-        return _fetch_sits_with_gaps_duck(
-            engine, geometry, start_date, end_date, satellite, reducers, subsampling_max_pixels
-        )
+        with _duck_reader(engine) as cursor:
+            return _fetch_sits_with_gaps_duck(
+                cursor,
+                geometry,
+                start_date,
+                end_date,
+                satellite,
+                reducers,
+                subsampling_max_pixels,
+                _geometry_index(engine),
+                _access_log(engine),
+            )
     return _fetch_sits_with_gaps_pg(engine, geometry, start_date, end_date, satellite, reducers, subsampling_max_pixels)
 
 
@@ -1086,11 +2300,37 @@ def fetch_sits_by_job_ids(
     satellite: AbstractSatellite,
     job_ids: list[int],
 ) -> dict[int, pl.DataFrame]:
+    _access_log(engine).record(job_ids)
     if isinstance(engine, duckdb.DuckDBPyConnection):
-        return _fetch_sits_by_jids_duck(engine, satellite, job_ids)
+        with _duck_reader(engine) as cursor:
+            return _fetch_sits_by_jids_duck(cursor, satellite, job_ids)
     return _fetch_sits_by_jids_pg(engine, satellite, job_ids)
 
 
+def fetch_sits_by_requests(
+    engine: CacheEngine,
+    satellite: AbstractSatellite,
+    requests: pl.DataFrame,
+    key_col: str,
+    start_date_col: str = "start_date",
+    end_date_col: str = "end_date",
+) -> pl.DataFrame:
+    """Materialize fully cached requests as one long-format frame.
+
+    ``requests`` has one row per request with its key, query window and a
+    ``job_ids`` list column (as returned by ``fetch_sits_batch_coverage``).
+    Returns ``timestamp``, the band columns and ``key_col``, sorted by key and
+    timestamp; timestamps covered by several jobs come from the first listed.
+    """
+    if requests.is_empty():
+        return pl.DataFrame()
+    _access_log(engine).record(requests.get_column("job_ids").explode().drop_nulls().unique())
+    if isinstance(engine, duckdb.DuckDBPyConnection):
+        with _duck_reader(engine) as cursor:
+            return _fetch_sits_by_requests_duck(cursor, satellite, requests, key_col, start_date_col, end_date_col)
+    return _fetch_sits_by_requests_pg(engine, satellite, requests, key_col, start_date_col, end_date_col)
+
+
 def fetch_sits_batch_coverage(
     engine: CacheEngine,
     gdf: GeoDataFrameLike,
@@ -1102,16 +2342,17 @@ def fetch_sits_batch_coverage(
     crs: str | None = None,
 ) -> dict[int, tuple[list[int], list[tuple[str, str]]]]:
     if isinstance(engine, duckdb.DuckDBPyConnection):
-        return _fetch_sits_batch_coverage_duck(
-            engine,
-            gdf,
-            satellite,
-            reducers,
-            subsampling_max_pixels,
-            start_date_col,
-            end_date_col,
-            crs,
-        )
+        with _duck_reader(engine) as cursor:
+            return _fetch_sits_batch_coverage_duck(
+                cursor,
+                gdf,
+                satellite,
+                reducers,
+                subsampling_max_pixels,
+                start_date_col,
+                end_date_col,
+                crs,
+            )
     return _fetch_sits_batch_coverage_pg(
         engine,
         gdf,
@@ -1136,9 +2377,16 @@ def store_sits(
 ) -> int | None:
     if df.empty:
         return None
-    if isinstance(engine, duckdb.DuckDBPyConnection):
-        return _store_sits_duck(engine, df, geometry, start_date, end_date, satellite, reducers, subsampling_max_pixels)
-    return _store_sits_pg(engine, df, geometry, start_date, end_date, satellite, reducers, subsampling_max_pixels)
+    try:
+        if isinstance(engine, duckdb.DuckDBPyConnection):
+            return _store_sits_duck(
+                engine, df, geometry, start_date, end_date, satellite, reducers, subsampling_max_pixels
+            )
+        return _store_sits_pg(
+            engine, pl.from_pandas(df), geometry, start_date, end_date, satellite, reducers, subsampling_max_pixels
+        )
+    finally:
+        _geometry_index(engine).invalidate(_stored_geometry_keys(geometry))
 
 
 def store_sits_polars(
@@ -1153,13 +2401,33 @@ def store_sits_polars(
 ) -> int | None:
     if df.is_empty():
         return None
-    if isinstance(engine, duckdb.DuckDBPyConnection):
-        return _store_sits_duck_polars(
-            engine, df, geometry, start_date, end_date, satellite, reducers, subsampling_max_pixels
-        )
-    return _store_sits_pg(
-        engine, df.to_pandas(), geometry, start_date, end_date, satellite, reducers, subsampling_max_pixels
-    )
+    try:
+        if isinstance(engine, duckdb.DuckDBPyConnection):
+            return _store_sits_duck_polars(
+                engine, df, geometry, start_date, end_date, satellite, reducers, subsampling_max_pixels
+            )
+        return _store_sits_pg(engine, df, geometry, start_date, end_date, satellite, reducers, subsampling_max_pixels)
+    finally:
+        _geometry_index(engine).invalidate(_stored_geometry_keys(geometry))
+
+
+def store_sits_batch_polars(
+    engine: CacheEngine,
+    df: pl.DataFrame,
+    features: pl.DataFrame,
+    key_col: str,
+    satellite: AbstractSatellite,
+    reducers: set[str] | None,
+    subsampling_max_pixels: float,
+) -> dict[Any, int]:
+    if df.is_empty():
+        return {}
+    try:
+        if isinstance(engine, duckdb.DuckDBPyConnection):
+            return _store_sits_batch_duck(engine, df, features, key_col, satellite, reducers, subsampling_max_pixels)
+        return _store_sits_batch_pg(engine, df, features, key_col, satellite, reducers, subsampling_max_pixels)
+    finally:
+        _geometry_index(engine).invalidate()
 
 
 # ---------------------------------------------------------------------------
@@ -1169,19 +2437,22 @@ def store_sits_polars(
 
 def ensure_api_jobs_table(engine: CacheEngine) -> None:
     """Create api_jobs table if it does not exist. Idempotent."""
+
+    def write(cursor: duckdb.DuckDBPyConnection) -> None:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS api_jobs (
+                id         TEXT PRIMARY KEY,
+                type       TEXT,
+                status     TEXT NOT NULL,
+                error      TEXT,
+                created_at TIMESTAMPTZ NOT NULL,
+                updated_at TIMESTAMPTZ NOT NULL
+            )
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_api_jobs_status ON api_jobs(status)")
+
     if isinstance(engine, duckdb.DuckDBPyConnection):
-        with _duck_write_lock:
-            engine.execute("""
-                CREATE TABLE IF NOT EXISTS api_jobs (
-                    id         TEXT PRIMARY KEY,
-                    type       TEXT,
-                    status     TEXT NOT NULL,
-                    error      TEXT,
-                    created_at TIMESTAMPTZ NOT NULL,
-                    updated_at TIMESTAMPTZ NOT NULL
-                )
-            """)
-            engine.execute("CREATE INDEX IF NOT EXISTS idx_api_jobs_status ON api_jobs(status)")
+        _duck_write(engine, write)
     else:
         with engine.begin() as conn:
             _ensure_api_jobs_table_pg(conn)
@@ -1189,11 +2460,13 @@ def ensure_api_jobs_table(engine: CacheEngine) -> None:
 
 def create_api_job(engine: CacheEngine, job_id: str, job_type: str | None, status: str, now: str) -> None:
     if isinstance(engine, duckdb.DuckDBPyConnection):
-        with _duck_write_lock:
-            engine.execute(
+        _duck_write(
+            engine,
+            lambda cursor: cursor.execute(
                 "INSERT INTO api_jobs (id, type, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
                 [job_id, job_type, status, now, now],
-            )
+            ),
+        )
     else:
         with engine.begin() as conn:
             conn.execute(
@@ -1207,11 +2480,13 @@ def create_api_job(engine: CacheEngine, job_id: str, job_type: str | None, statu
 
 def update_api_job(engine: CacheEngine, job_id: str, status: str, error: str | None, now: str) -> None:
     if isinstance(engine, duckdb.DuckDBPyConnection):
-        with _duck_write_lock:
-            engine.execute(
+        _duck_write(
+            engine,
+            lambda cursor: cursor.execute(
                 "UPDATE api_jobs SET status = ?, error = ?, updated_at = ? WHERE id = ?",
                 [status, error, now, job_id],
-            )
+            ),
+        )
     else:
         with engine.begin() as conn:
             conn.execute(
@@ -1224,8 +2499,7 @@ def update_api_job(engine: CacheEngine, job_id: str, status: str, error: str | N
 
 def delete_api_job(engine: CacheEngine, job_id: str) -> None:
     if isinstance(engine, duckdb.DuckDBPyConnection):
-        with _duck_write_lock:
-            engine.execute("DELETE FROM api_jobs WHERE id = ?", [job_id])
+        _duck_write(engine, lambda cursor: cursor.execute("DELETE FROM api_jobs WHERE id = ?", [job_id]))
     else:
         with engine.begin() as conn:
             conn.execute(sa.text("DELETE FROM api_jobs WHERE id = :id"), {"id": job_id})
@@ -1233,7 +2507,8 @@ def delete_api_job(engine: CacheEngine, job_id: str) -> None:
 
 def list_api_jobs(engine: CacheEngine) -> list[dict[str, Any]]:
     if isinstance(engine, duckdb.DuckDBPyConnection):
-        rows = engine.execute("SELECT id, type, status, error FROM api_jobs").fetchall()
+        with _duck_reader(engine) as cursor:
+            rows = cursor.execute("SELECT id, type, status, error FROM api_jobs").fetchall()
     else:
         with engine.connect() as conn:
             rows = conn.execute(sa.text("SELECT id, type, status, error FROM api_jobs")).fetchall()
@@ -1241,33 +2516,1074 @@ def list_api_jobs(engine: CacheEngine) -> list[dict[str, Any]]:
 
 
 # ---------------------------------------------------------------------------
-# Initialisation
+# SITS run manifests
 # ---------------------------------------------------------------------------
+# One manifest per download run, keyed by run_hash. sits_run_chunks holds each
+# chunk's state (pending/minted/downloaded/stored/failed/split); sits_run_rows
+# maps every input row position to its chunk and, once stored, to its cache
+# job. Rows that were fully cached when the run was planned have no chunk and
+# one entry per covering job.
 
 
-def print_cache_status(engine: CacheEngine | None = None) -> None:
+def compute_sits_run_hash(
+    input_hash: str,
+    satellite: AbstractSatellite,
+    reducers: set[str] | None,
+    subsampling_max_pixels: float,
+    original_index_column_name: str,
+) -> str:
+    """Key a download run by its input rows and the parameters that decide what gets stored."""
+    params_hash = compute_params_hash(satellite, reducers, subsampling_max_pixels)
+    return hashlib.sha1(f"{input_hash}|{params_hash}|{original_index_column_name}".encode()).hexdigest()  # noqa: S324
+
+
+def create_sits_run_manifest(
+    engine: CacheEngine,
+    run_hash: str,
+    chunks: list[list[int]],
+    cached_rows: dict[int, list[int]],
+) -> None:
+    chunk_frame = pl.DataFrame(
+        {"chunk_id": list(range(len(chunks))), "state": ["pending"] * len(chunks)},
+        schema={"chunk_id": pl.Int32, "state": pl.String},
+    )
+    rows_frame = pl.concat([
+        pl.DataFrame(
+            {
+                "position": [pos for positions in chunks for pos in positions],
+                "chunk_id": [cid for cid, positions in enumerate(chunks) for _ in positions],
+                "job_id": [None] * sum(len(positions) for positions in chunks),
+            },
+            schema={"position": pl.Int32, "chunk_id": pl.Int32, "job_id": pl.Int64},
+        ),
+        pl.DataFrame(
+            {
+                "position": [pos for pos, jids in cached_rows.items() for _ in jids],
+                "chunk_id": [None] * sum(len(jids) for jids in cached_rows.values()),
+                "job_id": [jid for jids in cached_rows.values() for jid in jids],
+            },
+            schema={"position": pl.Int32, "chunk_id": pl.Int32, "job_id": pl.Int64},
+        ),
+    ])
+
+    def write(cursor: duckdb.DuckDBPyConnection) -> None:
+        cursor.begin()
+        try:
+            cursor.execute("DELETE FROM sits_run_chunks WHERE run_hash = ?", [run_hash])
+            cursor.execute("DELETE FROM sits_run_rows WHERE run_hash = ?", [run_hash])
+            cursor.register("_run_chunks", chunk_frame.to_arrow())
+            cursor.register("_run_rows", rows_frame.to_arrow())
+            try:
+                cursor.execute(
+                    "INSERT INTO sits_run_chunks (run_hash, chunk_id, state) SELECT ?, chunk_id, state FROM _run_chunks",
+                    [run_hash],
+                )
+                cursor.execute(
+                    "INSERT INTO sits_run_rows (run_hash, position, chunk_id, job_id) "
+                    "SELECT ?, position, chunk_id, job_id FROM _run_rows",
+                    [run_hash],
+                )
+            finally:
+                cursor.unregister("_run_chunks")
+                cursor.unregister("_run_rows")
+            cursor.commit()
+        except Exception:
+            cursor.rollback()
+            raise
+
+    if isinstance(engine, duckdb.DuckDBPyConnection):
+        _duck_write(engine, write)
+    else:
+        with engine.begin() as conn:
+            conn.execute(sa.text("DELETE FROM sits_run_chunks WHERE run_hash = :rh"), {"rh": run_hash})
+            conn.execute(sa.text("DELETE FROM sits_run_rows WHERE run_hash = :rh"), {"rh": run_hash})
+            if not chunk_frame.is_empty():
+                conn.execute(
+                    sa.text("INSERT INTO sits_run_chunks (run_hash, chunk_id, state) VALUES (:rh, :chunk_id, :state)"),
+                    [{"rh": run_hash, **row} for row in chunk_frame.to_dicts()],
+                )
+            if not rows_frame.is_empty():
+                conn.execute(
+                    sa.text(
+                        "INSERT INTO sits_run_rows (run_hash, position, chunk_id, job_id) "
+                        "VALUES (:rh, :position, :chunk_id, :job_id)"
+                    ),
+                    [{"rh": run_hash, **row} for row in rows_frame.to_dicts()],
+                )
+
+
+def load_sits_run_manifest(engine: CacheEngine, run_hash: str) -> tuple[dict[int, str], pl.DataFrame] | None:
+    chunk_sql = "SELECT chunk_id, state FROM sits_run_chunks WHERE run_hash = {p}"
+    rows_sql = "SELECT position, chunk_id, job_id FROM sits_run_rows WHERE run_hash = {p} ORDER BY position"
+    if isinstance(engine, duckdb.DuckDBPyConnection):
+        with _duck_reader(engine) as cursor:
+            chunk_rows = cursor.execute(chunk_sql.format(p="?"), [run_hash]).fetchall()
+            row_rows = cursor.execute(rows_sql.format(p="?"), [run_hash]).fetchall()
+    else:
+        with engine.connect() as conn:
+            chunk_rows = conn.execute(sa.text(chunk_sql.format(p=":rh")), {"rh": run_hash}).fetchall()
+            row_rows = conn.execute(sa.text(rows_sql.format(p=":rh")), {"rh": run_hash}).fetchall()
+
+    if not chunk_rows and not row_rows:
+        return None
+    rows = pl.DataFrame(
+        [tuple(row) for row in row_rows],
+        schema={"position": pl.Int32, "chunk_id": pl.Int32, "job_id": pl.Int64},
+        orient="row",
+    )
+    return {int(cid): str(state) for cid, state in chunk_rows}, rows
+
+
+def save_sits_run_progress(
+    engine: CacheEngine,
+    run_hash: str,
+    states: dict[int, tuple[str, str | None]],
+    row_chunks: dict[int, int],
+    row_jobs: dict[int, int],
+) -> None:
+    if not states and not row_chunks and not row_jobs:
+        return
+    state_frame = pl.DataFrame(
+        [(cid, state, error) for cid, (state, error) in states.items()],
+        schema={"chunk_id": pl.Int32, "state": pl.String, "error": pl.String},
+        orient="row",
+    )
+    chunk_frame = pl.DataFrame(
+        list(row_chunks.items()), schema={"position": pl.Int32, "chunk_id": pl.Int32}, orient="row"
+    )
+    job_frame = pl.DataFrame(list(row_jobs.items()), schema={"position": pl.Int32, "job_id": pl.Int64}, orient="row")
+    upsert_sql = """
+        INSERT INTO sits_run_chunks (run_hash, chunk_id, state, error)
+        {source}
+        ON CONFLICT (run_hash, chunk_id)
+        DO UPDATE SET state = excluded.state, error = excluded.error, updated_at = now()
+    """
+
+    def write(cursor: duckdb.DuckDBPyConnection) -> None:
+        cursor.begin()
+        try:
+            cursor.register("_run_states", state_frame.to_arrow())
+            cursor.register("_run_row_chunks", chunk_frame.to_arrow())
+            cursor.register("_run_row_jobs", job_frame.to_arrow())
+            try:
+                cursor.execute(
+                    upsert_sql.format(source="SELECT ?, chunk_id, state, error FROM _run_states"), [run_hash]
+                )
+                cursor.execute(
+                    "UPDATE sits_run_rows SET chunk_id = c.chunk_id FROM _run_row_chunks c "
+                    "WHERE sits_run_rows.run_hash = ? AND sits_run_rows.position = c.position "
+                    "AND sits_run_rows.chunk_id IS NOT NULL",
+                    [run_hash],
+                )
+                cursor.execute(
+                    "UPDATE sits_run_rows SET job_id = j.job_id FROM _run_row_jobs j "
+                    "WHERE sits_run_rows.run_hash = ? AND sits_run_rows.position = j.position "
+                    "AND sits_run_rows.chunk_id IS NOT NULL",
+                    [run_hash],
+                )
+            finally:
+                cursor.unregister("_run_states")
+                cursor.unregister("_run_row_chunks")
+                cursor.unregister("_run_row_jobs")
+            cursor.commit()
+        except Exception:
+            cursor.rollback()
+            raise
+
+    if isinstance(engine, duckdb.DuckDBPyConnection):
+        _duck_write(engine, write)
+    else:
+        with engine.begin() as conn:
+            if states:
+                conn.execute(
+                    sa.text(upsert_sql.format(source="VALUES (:rh, :chunk_id, :state, :error)")),
+                    [{"rh": run_hash, **row} for row in state_frame.to_dicts()],
+                )
+            if row_chunks:
+                conn.execute(
+                    sa.text(
+                        "UPDATE sits_run_rows SET chunk_id = :chunk_id "
+                        "WHERE run_hash = :rh AND position = :position AND chunk_id IS NOT NULL"
+                    ),
+                    [{"rh": run_hash, **row} for row in chunk_frame.to_dicts()],
+                )
+            if row_jobs:
+                conn.execute(
+                    sa.text(
+                        "UPDATE sits_run_rows SET job_id = :job_id "
+                        "WHERE run_hash = :rh AND position = :position AND chunk_id IS NOT NULL"
+                    ),
+                    [{"rh": run_hash, **row} for row in job_frame.to_dicts()],
+                )
+
+
+def delete_sits_run_manifest(engine: CacheEngine, run_hash: str) -> None:
+    def write(cursor: duckdb.DuckDBPyConnection) -> None:
+        cursor.execute("DELETE FROM sits_run_chunks WHERE run_hash = ?", [run_hash])
+        cursor.execute("DELETE FROM sits_run_rows WHERE run_hash = ?", [run_hash])
+
+    if isinstance(engine, duckdb.DuckDBPyConnection):
+        _duck_write(engine, write)
+    else:
+        with engine.begin() as conn:
+            conn.execute(sa.text("DELETE FROM sits_run_chunks WHERE run_hash = :rh"), {"rh": run_hash})
+            conn.execute(sa.text("DELETE FROM sits_run_rows WHERE run_hash = :rh"), {"rh": run_hash})
+
+
+# ---------------------------------------------------------------------------
+# Compaction
+# ---------------------------------------------------------------------------
+# Each gap download stores its own job, so a geometry refreshed month by month
+# ends up spread over many small, overlapping jobs. Compaction folds every run
+# of overlapping or adjacent jobs of one (geometry, satellite, params hash)
+# into a single job. The merged job keeps the id of a job that already spans
+# the whole run when there is one; otherwise a new job is created.
+
+_COMPACT_JOBS_SQL = """
+    SELECT s.id, s.geometry_id, g.geom_hash, g.h3_coarse, s.satellite_short_name, s.params_hash,
+           s.reducers, s.subsampling_max_pixels, s.start_date, s.end_date, s.fetched_at,
+           s.last_read_at, COALESCE(s.read_count, 0) AS read_count
+    FROM sits_jobs s JOIN geometries g ON g.id = s.geometry_id
+"""
+
+_COMPACT_INSERT_SQL = """
+    INSERT INTO sits_jobs
+      (job_hash, geometry_id, satellite_short_name, params_hash, reducers,
+       subsampling_max_pixels, start_date, end_date, fetched_at, last_read_at, read_count)
+    SELECT job_hash, geometry_id, satellite_short_name, params_hash, reducers,
+           subsampling_max_pixels, start_date, end_date, fetched_at, last_read_at, read_count
+    FROM _compact_targets
+    RETURNING job_hash, id
+"""
+
+# A job that already spanned its interval takes over the reads of the jobs it absorbs.
+_COMPACT_SURVIVORS_SQL = """
+    UPDATE sits_jobs SET last_read_at = t.last_read_at, read_count = t.read_count
+    FROM _compact_survivors t WHERE sits_jobs.id = t.target_id
+"""
+
+# Moves the rows of absorbed jobs to their merged job. A timestamp the merged
+# job already has is dropped; among absorbed jobs the oldest one wins.
+_COMPACT_MOVE_SQL = """
+    INSERT INTO "{table}" (job_id, timestamp{cols})
+    SELECT moved.new_id, moved.timestamp{moved_cols}
+    FROM (
+        SELECT m.new_id, o.timestamp{o_cols},
+               row_number() OVER (PARTITION BY m.new_id, o.timestamp ORDER BY o.job_id) AS rn
+        FROM "{table}" o JOIN _compact_map m ON m.old_id = o.job_id
+    ) moved
+    WHERE moved.rn = 1 AND NOT EXISTS (
+        SELECT 1 FROM "{table}" kept
+        WHERE kept.job_id = moved.new_id AND kept.timestamp IS NOT DISTINCT FROM moved.timestamp
+    )
+"""
+
+# A cached manifest row lists every job covering it, so several absorbed jobs
+# collapse into one entry for their merged job.
+_COMPACT_RUN_ROWS_SQL = (
+    """
+    INSERT INTO sits_run_rows (run_hash, position, chunk_id, job_id)
+    SELECT DISTINCT r.run_hash, r.position, r.chunk_id, m.new_id
+    FROM sits_run_rows r JOIN _compact_map m ON m.old_id = r.job_id
+    WHERE NOT EXISTS (
+        SELECT 1 FROM sits_run_rows k
+        WHERE k.run_hash = r.run_hash AND k.position = r.position AND k.job_id = m.new_id
+    )
+    """,
+    "DELETE FROM sits_run_rows WHERE job_id IN (SELECT old_id FROM _compact_map)",
+)
+
+_COMPACT_MAP_SCHEMA = {
+    "old_id": pl.Int64,
+    "new_id": pl.Int64,
+    "satellite_short_name": pl.String,
+    "h3_coarse": pl.String,
+}
+
+
+def _plan_compaction(jobs: pl.DataFrame) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Group jobs into merged intervals.
+
+    Returns the merged jobs (``target_id`` is null for those still to be
+    created) and the ``(old_id, cluster)`` pairs of the jobs they absorb.
+    """
+    key = ["geometry_id", "satellite_short_name", "params_hash"]
+    dated = jobs.with_columns(
+        start=_as_dates(jobs.get_column("start_date")),
+        end=_as_dates(jobs.get_column("end_date")),
+    ).sort([*key, "start", "id"])
+    # A job opens a new interval unless it starts at most a day after the
+    # furthest end seen so far, which is the rule _compute_gaps merges by.
+    reach = pl.col("end").cum_max().shift(1).over(key)
+    dated = dated.with_columns(cluster=(reach.is_null() | (pl.col("start") > reach + pl.duration(days=1))).cum_sum())
+
+    spans_cluster = (pl.col("start") == pl.col("start").min()) & (pl.col("end") == pl.col("end").max())
+    targets = (
+        dated
+        .group_by("cluster")
+        .agg(
+            pl.len().alias("jobs"),
+            pl.col("id").filter(spans_cluster).min().alias("target_id"),
+            pl.col("start").min(),
+            pl.col("end").max(),
+            pl.col("fetched_at").max(),
+            pl.col("last_read_at").max(),
+            pl.col("read_count").sum(),
+            pl.first("geometry_id", "geom_hash", "h3_coarse", *key[1:], "reducers", "subsampling_max_pixels"),
+        )
+        .filter(pl.col("jobs") > 1)
+        .with_columns(
+            start_date=pl.col("start").dt.to_string(_ISO_DATE),
+            end_date=pl.col("end").dt.to_string(_ISO_DATE),
+        )
+    )
+    hash_inputs = targets.select("target_id", "geom_hash", "params_hash", "start_date", "end_date")
+    job_hashes = [
+        None if target_id is not None else _compute_job_hash(geom_hash, params_hash, start_date, end_date)
+        for target_id, geom_hash, params_hash, start_date, end_date in hash_inputs.iter_rows()
+    ]
+    targets = targets.with_columns(job_hash=pl.Series(job_hashes, dtype=pl.String))
+    members = (
+        dated
+        .join(targets.select("cluster", "target_id"), on="cluster")
+        .filter(pl.col("target_id").is_null() | (pl.col("id") != pl.col("target_id")))
+        .select(pl.col("id").alias("old_id"), "cluster")
+    )
+    return targets, members
+
+
+def _compaction_map(targets: pl.DataFrame, members: pl.DataFrame, inserted: pl.DataFrame) -> pl.DataFrame:
+    resolved = targets.join(inserted, on="job_hash", how="left").select(
+        "cluster", pl.coalesce("target_id", "id").alias("new_id"), "satellite_short_name", "h3_coarse"
+    )
+    return members.join(resolved, on="cluster").select(*_COMPACT_MAP_SCHEMA).cast(_COMPACT_MAP_SCHEMA)
+
+
+def _new_compaction_targets(targets: pl.DataFrame) -> pl.DataFrame:
+    return targets.filter(pl.col("target_id").is_null()).select(
+        "job_hash",
+        "geometry_id",
+        "satellite_short_name",
+        "params_hash",
+        "reducers",
+        "subsampling_max_pixels",
+        "start_date",
+        "end_date",
+        "fetched_at",
+        "last_read_at",
+        "read_count",
+    )
+
+
+def _compaction_survivors(targets: pl.DataFrame) -> pl.DataFrame:
+    return targets.filter(pl.col("target_id").is_not_null()).select("target_id", "last_read_at", "read_count")
+
+
+def _compact_move_sql(table_name: str, band_cols: list[str]) -> str:
+    return _COMPACT_MOVE_SQL.format(
+        table=table_name,
+        cols="".join(f', "{c}"' for c in band_cols),
+        moved_cols="".join(f', moved."{c}"' for c in band_cols),
+        o_cols="".join(f', o."{c}"' for c in band_cols),
+    )
+
+
+def _observation_bytes(observation_root: pathlib.Path) -> int:
+    return sum(path.stat().st_size for path in observation_root.glob("*/*/*.parquet"))
+
+
+def _duck_used_bytes(conn: duckdb.DuckDBPyConnection) -> int:
+    row = conn.execute("SELECT block_size * used_blocks FROM pragma_database_size()").fetchone()
+    return int(row[0]) if row and row[0] is not None else 0
+
+
+def _checkpoint_duck(conn: duckdb.DuckDBPyConnection) -> None:
+    try:
+        conn.execute("CHECKPOINT")
+    except duckdb.TransactionException:
+        # Another transaction is still open; DuckDB checkpoints by itself once the WAL grows.
+        logger.info("AgriGEE cache: checkpoint deferred while other transactions are active")
+
+
+def _sat_band_columns_duck(conn: duckdb.DuckDBPyConnection, table_name: str) -> list[str]:
+    columns = [r[0] for r in conn.execute(f'DESCRIBE "{table_name}"').fetchall()]
+    return [c for c in columns if c not in {"id", "job_id", "timestamp", "h3_coarse"}]
+
+
+def _rebuild_sat_table_duck(conn: duckdb.DuckDBPyConnection, table_name: str, band_cols: list[str]) -> None:
+    # Deleted rows keep their space in row groups and indexes until the table
+    # is written anew; rows come back ordered so each job's rows sit together.
+    old_name = f"{table_name}_compacting"
+    cols_sql = ", ".join(f'"{c}"' for c in ["id", "job_id", "timestamp", *band_cols])
+    conn.execute(f'DROP INDEX IF EXISTS "idx_{table_name}_jid"')
+    conn.execute(f'ALTER TABLE "{table_name}" RENAME TO "{old_name}"')
+    _ensure_sat_table_duck(conn, table_name, band_cols)
+    conn.execute(
+        f'INSERT INTO "{table_name}" ({cols_sql}) SELECT {cols_sql} FROM "{old_name}" ORDER BY job_id, timestamp'
+    )
+    conn.execute(f'DROP TABLE "{old_name}"')
+
+
+def _rewrite_observation_cells_duck(
+    conn: duckdb.DuckDBPyConnection,
+    observation_root: pathlib.Path,
+    cells: pl.DataFrame,
+    job_map: pl.DataFrame,
+) -> int:
+    """Rewrite each (satellite_short_name, h3_coarse) cell as one file; returns the rows dropped.
+
+    Rows move to the job ``job_map`` maps them to, keeping one per timestamp,
+    and rows of jobs that no longer exist are dropped.
+    """
+    removed = 0
+    cells = cells.select("satellite_short_name", "h3_coarse").unique().sort("satellite_short_name", "h3_coarse")
+    with _duck_reader(conn) as cursor:
+        cursor.register("_compact_map", job_map.to_arrow())
+        for table_name, cell in cells.iter_rows():
+            files = sorted((observation_root / table_name / f"h3_coarse={cell}").glob("*.parquet"))
+            if not files:
+                continue
+            band_cols = _sat_band_columns_duck(cursor, table_name)
+            schema_path = observation_root / table_name / "h3_coarse=_" / "schema.parquet"
+            files_sql = ", ".join(f"'{_sql_path(path)}'" for path in [schema_path, *files])
+            scan = (
+                f"read_parquet([{files_sql}], hive_partitioning = true, union_by_name = true, "
+                "hive_types = {'h3_coarse': VARCHAR})"
+            )
+            band_sql = "".join(f', o."{c}"' for c in band_cols)
+            source = f"""(
+                SELECT COALESCE(m.new_id, o.job_id) AS job_id, o.timestamp{band_sql}, o.h3_coarse
+                FROM {scan} o
+                LEFT JOIN _compact_map m ON m.old_id = o.job_id
+                WHERE COALESCE(m.new_id, o.job_id) IN (SELECT id FROM sits_jobs)
+                QUALIFY row_number() OVER (
+                    PARTITION BY COALESCE(m.new_id, o.job_id), o.timestamp ORDER BY m.old_id IS NOT NULL, o.job_id
+                ) = 1
+            ) AS c"""
+            counts = cursor.execute(f"SELECT (SELECT COUNT(*) FROM {scan}), (SELECT COUNT(*) FROM {source})").fetchone()
+            assert counts is not None
+            removed += int(counts[0]) - int(counts[1])
+            storage = _band_storage(cursor, table_name)
+            _stage_observations(cursor, observation_root, table_name, source, band_cols, storage)
+            for path in files:
+                path.unlink(missing_ok=True)
+    return removed
+
+
+def _insert_compaction_targets_duck(cursor: duckdb.DuckDBPyConnection, new_targets: pl.DataFrame) -> pl.DataFrame:
+    inserted = pl.DataFrame(schema={"job_hash": pl.String, "id": pl.Int64})
+    if new_targets.is_empty():
+        return inserted
+    cursor.register("_compact_targets", new_targets.to_arrow())
+    try:
+        rows = cursor.execute(_COMPACT_INSERT_SQL).fetchall()
+    finally:
+        cursor.unregister("_compact_targets")
+    return pl.DataFrame(rows, schema=inserted.schema, orient="row")
+
+
+def _move_compacted_rows_duck(cursor: duckdb.DuckDBPyConnection, job_map: pl.DataFrame) -> int:
+    """Move table-stored observations along ``_compact_map``; returns the duplicate rows dropped."""
+    removed = 0
+    for table_name in job_map.get_column("satellite_short_name").unique().sort():
+        band_cols = _sat_band_columns_duck(cursor, table_name)
+        moved_row = cursor.execute(_compact_move_sql(table_name, band_cols)).fetchone()
+        deleted_row = cursor.execute(
+            f'DELETE FROM "{table_name}" WHERE job_id IN (SELECT old_id FROM _compact_map)'
+        ).fetchone()
+        assert moved_row is not None and deleted_row is not None
+        removed += int(deleted_row[0]) - int(moved_row[0])
+        _rebuild_sat_table_duck(cursor, table_name, band_cols)
+    return removed
+
+
+def _compact_cache_duck(conn: duckdb.DuckDBPyConnection) -> dict[str, int]:
+    observation_root = _duck_observation_root
+
+    def merge(cursor: duckdb.DuckDBPyConnection) -> tuple[pl.DataFrame, int, int, int]:
+        _checkpoint_duck(cursor)
+        used_bytes = _duck_used_bytes(cursor)
+        cursor.begin()
+        try:
+            targets, members = _plan_compaction(cursor.execute(_COMPACT_JOBS_SQL).pl())
+            if members.is_empty():
+                cursor.commit()
+                return pl.DataFrame(schema=_COMPACT_MAP_SCHEMA), 0, 0, used_bytes
+
+            new_targets = _new_compaction_targets(targets)
+            job_map = _compaction_map(targets, members, _insert_compaction_targets_duck(cursor, new_targets))
+            cursor.register("_compact_survivors", _compaction_survivors(targets).to_arrow())
+            try:
+                cursor.execute(_COMPACT_SURVIVORS_SQL)
+            finally:
+                cursor.unregister("_compact_survivors")
+            removed = 0
+            cursor.register("_compact_map", job_map.to_arrow())
+            try:
+                if observation_root is None:
+                    removed = _move_compacted_rows_duck(cursor, job_map)
+                for statement in _COMPACT_RUN_ROWS_SQL:
+                    cursor.execute(statement)
+            finally:
+                cursor.unregister("_compact_map")
+            cursor.commit()
+        except Exception:
+            cursor.rollback()
+            raise
+        return job_map, removed, len(new_targets), used_bytes
+
+    files_before = _observation_bytes(observation_root) if observation_root is not None else 0
+    job_map, removed, created, used_before = _duck_write(conn, merge)
+    if job_map.is_empty():
+        return {"jobs_merged": 0, "jobs_created": 0, "observations_removed": 0, "bytes_reclaimed": 0}
+
+    if observation_root is not None:
+        # Parquet files are immutable, so every H3 cell holding a merged job is rewritten.
+        removed = _rewrite_observation_cells_duck(conn, observation_root, job_map, job_map)
+
+    def finish(cursor: duckdb.DuckDBPyConnection) -> int:
+        # DuckDB refuses to delete a job in the transaction that deleted its
+        # rows, so the absorbed jobs go once the move above has committed.
+        old_ids = job_map.get_column("old_id").to_list()
+        cursor.execute("DELETE FROM sits_jobs WHERE list_contains(?, id)", [old_ids])
+        _checkpoint_duck(cursor)
+        return _duck_used_bytes(cursor)
+
+    used_after = _duck_write(conn, finish)
+    reclaimed = used_before - used_after
+    if observation_root is not None:
+        reclaimed += files_before - _observation_bytes(observation_root)
+    return {
+        "jobs_merged": job_map.height,
+        "jobs_created": created,
+        "observations_removed": removed,
+        "bytes_reclaimed": reclaimed,
+    }
+
+
+def _pg_relation_bytes(conn: sa.Connection, table_names: list[str]) -> int:
+    row = conn.execute(
+        sa.text(
+            "SELECT COALESCE(SUM(pg_total_relation_size(c.oid)), 0) FROM pg_class c "
+            "JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE n.nspname = 'public' AND c.relkind = 'r' AND c.relname = ANY(:names)"
+        ),
+        {"names": table_names},
+    ).fetchone()
+    return int(row[0]) if row else 0
+
+
+def _compact_cache_pg(engine: sa.Engine) -> dict[str, int]:
+    with engine.begin() as conn:
+        rows = conn.execute(sa.text(_COMPACT_JOBS_SQL)).fetchall()
+        jobs = pl.DataFrame(
+            [tuple(row) for row in rows],
+            schema={
+                "id": pl.Int64,
+                "geometry_id": pl.Int64,
+                "geom_hash": pl.String,
+                "h3_coarse": pl.String,
+                "satellite_short_name": pl.String,
+                "params_hash": pl.String,
+                "reducers": pl.String,
+                "subsampling_max_pixels": pl.Float64,
+                "start_date": pl.String,
+                "end_date": pl.String,
+                "fetched_at": pl.Datetime("us", "UTC"),
+                "last_read_at": pl.Datetime("us", "UTC"),
+                "read_count": pl.Int64,
+            },
+            orient="row",
+        )
+        targets, members = _plan_compaction(jobs)
+        if members.is_empty():
+            return {"jobs_merged": 0, "jobs_created": 0, "observations_removed": 0, "bytes_reclaimed": 0}
+
+        table_names = [*targets.get_column("satellite_short_name").unique().sort(), "sits_jobs"]
+        bytes_before = _pg_relation_bytes(conn, table_names)
+        conn.execute(
+            sa.text("""
+            CREATE TEMP TABLE _compact_targets (
+                job_hash TEXT, geometry_id INTEGER, satellite_short_name TEXT, params_hash TEXT, reducers TEXT,
+                subsampling_max_pixels REAL, start_date TEXT, end_date TEXT, fetched_at TIMESTAMPTZ,
+                last_read_at TIMESTAMPTZ, read_count BIGINT
+            ) ON COMMIT DROP
+        """)
+        )
+        conn.execute(
+            sa.text(
+                "CREATE TEMP TABLE _compact_survivors (target_id BIGINT, last_read_at TIMESTAMPTZ, read_count BIGINT) "
+                "ON COMMIT DROP"
+            )
+        )
+        conn.execute(
+            sa.text(
+                "CREATE TEMP TABLE _compact_map (old_id BIGINT, new_id BIGINT, satellite_short_name TEXT, "
+                "h3_coarse TEXT) ON COMMIT DROP"
+            )
+        )
+        new_targets = _new_compaction_targets(targets)
+        _copy_rows_pg(conn, "_compact_targets", new_targets)
+        inserted = pl.DataFrame(
+            [tuple(row) for row in conn.execute(sa.text(_COMPACT_INSERT_SQL)).fetchall()] if new_targets.height else [],
+            schema={"job_hash": pl.String, "id": pl.Int64},
+            orient="row",
+        )
+        job_map = _compaction_map(targets, members, inserted)
+        _copy_rows_pg(conn, "_compact_map", job_map)
+        _copy_rows_pg(conn, "_compact_survivors", _compaction_survivors(targets))
+        conn.execute(sa.text(_COMPACT_SURVIVORS_SQL))
+
+        removed = 0
+        for table_name in table_names[:-1]:
+            band_cols = [
+                r[0]
+                for r in conn.execute(
+                    sa.text(
+                        "SELECT column_name FROM information_schema.columns "
+                        "WHERE table_schema = 'public' AND table_name = :t ORDER BY ordinal_position"
+                    ),
+                    {"t": table_name},
+                ).fetchall()
+                if r[0] not in {"id", "job_id", "timestamp"}
+            ]
+            moved = conn.execute(sa.text(_compact_move_sql(table_name, band_cols))).rowcount
+            deleted = conn.execute(
+                sa.text(f'DELETE FROM "{table_name}" WHERE job_id IN (SELECT old_id FROM _compact_map)')
+            ).rowcount
+            removed += deleted - moved
+        for statement in _COMPACT_RUN_ROWS_SQL:
+            conn.execute(sa.text(statement))
+        conn.execute(sa.text("DELETE FROM sits_jobs WHERE id IN (SELECT old_id FROM _compact_map)"))
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for table_name in table_names:
+            conn.execute(sa.text(f'VACUUM ANALYZE "{table_name}"'))
+        bytes_after = _pg_relation_bytes(conn, table_names)
+    return {
+        "jobs_merged": job_map.height,
+        "jobs_created": new_targets.height,
+        "observations_removed": removed,
+        "bytes_reclaimed": bytes_before - bytes_after,
+    }
+
+
+def compact_cache(engine: CacheEngine | None = None) -> dict[str, int]:
+    """Merge overlapping or adjacent jobs and reclaim the space they held.
+
+    Jobs of one geometry, satellite and parameter set whose date ranges
+    overlap or touch become a single job spanning them all, holding one row
+    per timestamp. Run manifests follow the merged jobs. DuckDB is then
+    checkpointed and PostGIS tables vacuumed. On the Parquet store each
+    touched H3 cell is rewritten, and a read racing that rewrite can fail,
+    so run this while the cache is quiet.
+
+    Returns the jobs merged away, jobs created, duplicate observations
+    dropped and bytes reclaimed.
+    """
     eng = engine or get_engine()
     if eng is None:
-        print("[AgriGEE cache] Cache not initialised.")
+        raise RuntimeError("AgriGEE cache not initialised; call init_cache() first.")
+    try:
+        if isinstance(eng, duckdb.DuckDBPyConnection):
+            return _compact_cache_duck(eng)
+        return _compact_cache_pg(eng)
+    finally:
+        _geometry_index(eng).invalidate()
+
+
+# ---------------------------------------------------------------------------
+# Eviction
+# ---------------------------------------------------------------------------
+# Once the cache outgrows its byte or row budget, the least recently read jobs
+# go first (jobs never read by when they were fetched), together with the run
+# manifests pointing at them and the geometries left without jobs. A call
+# trims usage to _EVICTION_TARGET of the budget, so the table or file rewrite
+# that actually frees the space does not run on every call.
+
+_EVICTION_TARGET = 0.9
+
+_ACCESS_FLUSH_SQL = """
+    UPDATE sits_jobs
+    SET last_read_at = GREATEST(sits_jobs.last_read_at, r.last_read_at),
+        read_count = COALESCE(sits_jobs.read_count, 0) + r.reads
+    FROM _job_reads r WHERE sits_jobs.id = r.job_id
+"""
+
+_EVICTION_CANDIDATES_SQL = """
+    SELECT s.id AS job_id, s.satellite_short_name, g.h3_coarse
+    FROM sits_jobs s JOIN geometries g ON g.id = s.geometry_id
+    ORDER BY COALESCE(s.last_read_at, s.fetched_at), s.id
+    LIMIT {limit}
+"""
+
+# A run that planned on an evicted job would resume into missing rows, so it is planned again instead.
+_EVICT_RUNS_SQL = (
+    "DELETE FROM sits_run_chunks WHERE run_hash IN "
+    "(SELECT run_hash FROM sits_run_rows WHERE job_id IN (SELECT job_id FROM _evicted))",
+    "DELETE FROM sits_run_rows WHERE run_hash IN "
+    "(SELECT run_hash FROM sits_run_rows WHERE job_id IN (SELECT job_id FROM _evicted))",
+)
+
+_ORPHAN_GEOMETRIES_SQL = (
+    "DELETE FROM geometries WHERE NOT EXISTS (SELECT 1 FROM sits_jobs s WHERE s.geometry_id = geometries.id)"
+)
+
+
+def _flush_access_log(engine: CacheEngine) -> None:
+    log = _access_log(engine)
+    reads = log.drain()
+    if reads.is_empty():
         return
 
-    if isinstance(eng, duckdb.DuckDBPyConnection):
-        total_row = eng.execute("SELECT COUNT(*) FROM sits_jobs").fetchone()
-        assert total_row is not None
-        total_sits: int = int(total_row[0])
+    def write(cursor: duckdb.DuckDBPyConnection) -> None:
+        cursor.register("_job_reads", reads.to_arrow())
+        try:
+            cursor.execute(_ACCESS_FLUSH_SQL)
+        finally:
+            cursor.unregister("_job_reads")
 
-        sat_tables = sorted(
+    try:
+        if isinstance(engine, duckdb.DuckDBPyConnection):
+            _duck_write(engine, write)
+        else:
+            with engine.begin() as conn:
+                conn.execute(
+                    sa.text(
+                        "CREATE TEMP TABLE _job_reads (job_id BIGINT, last_read_at TIMESTAMPTZ, reads BIGINT) "
+                        "ON COMMIT DROP"
+                    )
+                )
+                _copy_rows_pg(conn, "_job_reads", reads)
+                conn.execute(sa.text(_ACCESS_FLUSH_SQL))
+    except Exception:
+        log.restore(reads)
+        raise
+
+
+def _excess_rows(used_bytes: int, rows: int, max_bytes: int, max_rows: int) -> int:
+    """Observation rows to evict to get back under _EVICTION_TARGET of the budget, zero when within it."""
+    excess = 0
+    if max_rows and rows > max_rows:
+        excess = rows - int(max_rows * _EVICTION_TARGET)
+    if max_bytes and used_bytes > max_bytes and rows:
+        excess = max(excess, math.ceil((used_bytes - max_bytes * _EVICTION_TARGET) * rows / used_bytes))
+    return min(excess, rows)
+
+
+def _select_evictions(candidates: pl.DataFrame, counts: pl.DataFrame, excess_rows: int) -> pl.DataFrame:
+    # Candidates come oldest first; take them until their rows cover the excess.
+    sized = candidates.join(counts, on="job_id", how="left", maintain_order="left").with_columns(
+        pl.col("rows").fill_null(0)
+    )
+    return sized.filter(pl.col("rows").cum_sum().shift(1, fill_value=0) < excess_rows)
+
+
+def _satellite_tables_duck(conn: duckdb.DuckDBPyConnection) -> list[str]:
+    rows = conn.execute("SELECT table_name FROM information_schema.tables WHERE table_schema = 'main'").fetchall()
+    return sorted(r[0] for r in rows if r[0] not in _DUCK_SYSTEM)
+
+
+def _cache_usage_duck(conn: duckdb.DuckDBPyConnection, observation_root: pathlib.Path | None) -> tuple[int, int]:
+    rows = 0
+    for table_name in _satellite_tables_duck(conn):
+        count_row = conn.execute(f'SELECT COUNT(*) FROM "{table_name}"').fetchone()
+        assert count_row is not None
+        rows += int(count_row[0])
+    used_bytes = _duck_used_bytes(conn)
+    if observation_root is not None:
+        used_bytes += _observation_bytes(observation_root)
+    return used_bytes, rows
+
+
+def _evict_cache_duck(
+    conn: duckdb.DuckDBPyConnection,
+    max_bytes: int,
+    max_rows: int,
+    max_jobs: int,
+) -> dict[str, int]:
+    observation_root = _duck_observation_root
+    with _duck_reader(conn) as cursor:
+        used_bytes, rows = _cache_usage_duck(cursor, observation_root)
+    # Deleted rows only give their blocks back once the table is rewritten, so
+    # usage is measured once and the run evicts against that figure.
+    excess = _excess_rows(used_bytes, rows, max_bytes, max_rows)
+    jobs = removed = 0
+    touched: set[str] = set()
+    while excess > 0:
+        evicted = _next_evictions_duck(conn, excess, max_jobs)
+        if evicted.is_empty():
+            break
+        removed += _drop_evicted_jobs_duck(conn, observation_root, evicted)
+        jobs += evicted.height
+        excess -= int(evicted.get_column("rows").sum())
+        touched.update(evicted.get_column("satellite_short_name").to_list())
+    if not jobs:
+        return {
+            "jobs_evicted": 0,
+            "geometries_evicted": 0,
+            "observations_evicted": 0,
+            "bytes": used_bytes,
+            "rows": rows,
+        }
+
+    if observation_root is None:
+        _rebuild_evicted_tables_duck(conn, sorted(touched), used_bytes, rows)
+
+    def drop_geometries(cursor: duckdb.DuckDBPyConnection) -> int:
+        deleted_row = cursor.execute(_ORPHAN_GEOMETRIES_SQL).fetchone()
+        assert deleted_row is not None
+        _checkpoint_duck(cursor)
+        return int(deleted_row[0])
+
+    geometries = _duck_write(conn, drop_geometries)
+    with _duck_reader(conn) as cursor:
+        used_bytes, rows = _cache_usage_duck(cursor, observation_root)
+    return {
+        "jobs_evicted": jobs,
+        "geometries_evicted": geometries,
+        "observations_evicted": removed,
+        "bytes": used_bytes,
+        "rows": rows,
+    }
+
+
+def _next_evictions_duck(conn: duckdb.DuckDBPyConnection, excess: int, max_jobs: int) -> pl.DataFrame:
+    with _duck_reader(conn) as cursor:
+        candidates = cursor.execute(_EVICTION_CANDIDATES_SQL.format(limit=int(max_jobs))).pl()
+        counts = pl.DataFrame(schema={"job_id": pl.Int64, "rows": pl.Int64})
+        for table_name, job_ids in candidates.group_by("satellite_short_name").agg("job_id").iter_rows():
+            table_counts = cursor.execute(
+                f'SELECT job_id, COUNT(*) AS rows FROM "{table_name}" WHERE list_contains(?, job_id) GROUP BY job_id',
+                [job_ids],
+            ).pl()
+            counts = pl.concat([counts, table_counts.cast(counts.schema)])
+    return _select_evictions(candidates, counts, excess)
+
+
+def _drop_evicted_jobs_duck(
+    conn: duckdb.DuckDBPyConnection,
+    observation_root: pathlib.Path | None,
+    evicted: pl.DataFrame,
+) -> int:
+    """Delete one batch of evicted jobs and their observations in place; returns the observation rows removed."""
+    job_ids = evicted.get_column("job_id").to_list()
+
+    def drop_rows(cursor: duckdb.DuckDBPyConnection) -> int:
+        removed = 0
+        cursor.begin()
+        try:
+            cursor.register("_evicted", evicted.select("job_id").to_arrow())
+            try:
+                for statement in _EVICT_RUNS_SQL:
+                    cursor.execute(statement)
+                if observation_root is None:
+                    for table_name in evicted.get_column("satellite_short_name").unique().sort():
+                        deleted_row = cursor.execute(
+                            f'DELETE FROM "{table_name}" WHERE job_id IN (SELECT job_id FROM _evicted)'
+                        ).fetchone()
+                        assert deleted_row is not None
+                        removed += int(deleted_row[0])
+            finally:
+                cursor.unregister("_evicted")
+            cursor.commit()
+        except Exception:
+            cursor.rollback()
+            raise
+        return removed
+
+    removed = _duck_write(conn, drop_rows)
+    # Jobs go in a transaction of their own, after the rows referencing them,
+    # for the same reason as in compaction.
+    _duck_write(conn, lambda cursor: cursor.execute("DELETE FROM sits_jobs WHERE list_contains(?, id)", [job_ids]))
+    _geometry_index(conn).invalidate()
+    if observation_root is not None:
+        removed = _rewrite_observation_cells_duck(
+            conn, observation_root, evicted, pl.DataFrame(schema=_COMPACT_MAP_SCHEMA)
+        )
+    return removed
+
+
+def _rebuild_evicted_tables_duck(
+    conn: duckdb.DuckDBPyConnection,
+    table_names: list[str],
+    used_bytes: int,
+    rows: int,
+) -> None:
+    # One rewrite per table and run, each in a write of its own. The copy sits
+    # next to the old table until it commits, so it only runs when the disk
+    # holds the table's share of the database again.
+    db_path = _duck_db_path(conn)
+    for table_name in table_names:
+
+        def rebuild(cursor: duckdb.DuckDBPyConnection, table_name: str = table_name) -> None:
+            count_row = cursor.execute(f'SELECT COUNT(*) FROM "{table_name}"').fetchone()
+            assert count_row is not None
+            needed = used_bytes * int(count_row[0]) // max(rows, 1)
+            if db_path is not None and shutil.disk_usage(db_path.parent).free < needed:
+                logger.warning(
+                    "AgriGEE cache: not rewriting %s after eviction, the copy needs ~%d bytes free; "
+                    "its deleted rows stay allocated until compact_cache() runs",
+                    table_name,
+                    needed,
+                )
+                return
+            cursor.begin()
+            try:
+                _rebuild_sat_table_duck(cursor, table_name, _sat_band_columns_duck(cursor, table_name))
+                cursor.commit()
+            except Exception:
+                cursor.rollback()
+                raise
+
+        _duck_write(conn, rebuild)
+
+
+def _evict_cache_pg(engine: sa.Engine, max_rows: int, max_jobs: int) -> dict[str, int]:
+    with engine.connect() as conn:
+        table_names = [
             r[0]
-            for r in eng.execute(
-                "SELECT table_name FROM information_schema.tables WHERE table_schema = 'main'"
+            for r in conn.execute(
+                sa.text(
+                    "SELECT table_name FROM information_schema.tables "
+                    "WHERE table_schema = 'public' AND table_type = 'BASE TABLE'"
+                )
             ).fetchall()
-            if r[0] not in _DUCK_SYSTEM
+            if r[0] not in _PG_SYSTEM
+        ]
+        rows = 0
+        for table_name in table_names:
+            count_row = conn.execute(sa.text(f'SELECT COUNT(*) FROM "{table_name}"')).fetchone()
+            assert count_row is not None
+            rows += int(count_row[0])
+    excess = _excess_rows(0, rows, 0, max_rows)
+    jobs = removed = geometries = 0
+    touched: set[str] = set()
+    while excess > 0:
+        evicted, batch_removed, batch_geometries = _evict_batch_pg(engine, excess, max_jobs)
+        if evicted.is_empty():
+            break
+        jobs += evicted.height
+        removed += batch_removed
+        geometries += batch_geometries
+        excess -= int(evicted.get_column("rows").sum())
+        touched.update(evicted.get_column("satellite_short_name").to_list())
+    if not jobs:
+        return {"jobs_evicted": 0, "geometries_evicted": 0, "observations_evicted": 0, "bytes": 0, "rows": rows}
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for table_name in [*sorted(touched), "sits_jobs", "geometries"]:
+            conn.execute(sa.text(f'VACUUM ANALYZE "{table_name}"'))
+        size_row = conn.execute(sa.text("SELECT pg_database_size(current_database())")).fetchone()
+    return {
+        "jobs_evicted": jobs,
+        "geometries_evicted": geometries,
+        "observations_evicted": removed,
+        "bytes": int(size_row[0]) if size_row else 0,
+        "rows": rows - removed,
+    }
+
+
+def _evict_batch_pg(engine: sa.Engine, excess: int, max_jobs: int) -> tuple[pl.DataFrame, int, int]:
+    """Evict up to ``max_jobs`` jobs in one transaction; returns them with the observations and geometries removed."""
+    with engine.begin() as conn:
+        candidates = pl.DataFrame(
+            [tuple(row) for row in conn.execute(sa.text(_EVICTION_CANDIDATES_SQL.format(limit=int(max_jobs))))],
+            schema={"job_id": pl.Int64, "satellite_short_name": pl.String, "h3_coarse": pl.String},
+            orient="row",
         )
-        images_by_sensor: dict[str, int] = {}
-        for tbl in sat_tables:
-            cnt_row = eng.execute(f'SELECT COUNT(*) FROM "{tbl}"').fetchone()
-            assert cnt_row is not None
-            images_by_sensor[tbl] = int(cnt_row[0])
+        counts = pl.DataFrame(schema={"job_id": pl.Int64, "rows": pl.Int64})
+        for table_name, job_ids in candidates.group_by("satellite_short_name").agg("job_id").iter_rows():
+            table_counts = conn.execute(
+                sa.text(f'SELECT job_id, COUNT(*) FROM "{table_name}" WHERE job_id = ANY(:ids) GROUP BY job_id'),
+                {"ids": job_ids},
+            ).fetchall()
+            counts = pl.concat([counts, pl.DataFrame(table_counts, schema=counts.schema, orient="row")])
+        evicted = _select_evictions(candidates, counts, excess)
+        if evicted.is_empty():
+            return evicted, 0, 0
+
+        conn.execute(sa.text("CREATE TEMP TABLE _evicted (job_id BIGINT) ON COMMIT DROP"))
+        _copy_rows_pg(conn, "_evicted", evicted.select("job_id"))
+        for statement in _EVICT_RUNS_SQL:
+            conn.execute(sa.text(statement))
+        removed = 0
+        for table_name in evicted.get_column("satellite_short_name").unique().sort().to_list():
+            removed += conn.execute(
+                sa.text(f'DELETE FROM "{table_name}" WHERE job_id IN (SELECT job_id FROM _evicted)')
+            ).rowcount
+        conn.execute(sa.text("DELETE FROM sits_jobs WHERE id IN (SELECT job_id FROM _evicted)"))
+        geometries = conn.execute(sa.text(_ORPHAN_GEOMETRIES_SQL)).rowcount
+    _geometry_index(engine).invalidate()
+    return evicted, removed, geometries
+
+
+def evict_cache(
+    engine: CacheEngine | None = None,
+    max_bytes: int | None = None,
+    max_rows: int | None = None,
+    max_jobs: int = CACHE_EVICTION_BATCH,
+) -> dict[str, int]:
+    """Record pending reads, then evict the least recently read jobs while the cache is over budget.
+
+    ``max_bytes`` and ``max_rows`` default to ``AGRIGEE_CACHE_MAX_BYTES`` and
+    ``AGRIGEE_CACHE_MAX_ROWS``; 0 leaves that dimension unbounded. Bytes are
+    the DuckDB blocks in use plus the observation files; the database file
+    keeps freed blocks for reuse rather than shrinking. PostGIS only shrinks
+    its files on ``VACUUM FULL``, so only the row budget applies there.
+
+    Usage is measured once per call, then jobs go in batches of at most
+    ``max_jobs``, each in a transaction of its own so stores interleave with
+    eviction. DuckDB tables lose their deleted rows in one rewrite per table at
+    the end of the call, skipped while the disk cannot hold the copy. Returns
+    the jobs, geometries and observation rows evicted and the bytes and rows in
+    use afterwards.
+    """
+    eng = engine or get_engine()
+    if eng is None:
+        raise RuntimeError("AgriGEE cache not initialised; call init_cache() first.")
+    max_bytes = CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    max_rows = CACHE_MAX_ROWS if max_rows is None else max_rows
+    _flush_access_log(eng)
+    try:
+        if isinstance(eng, duckdb.DuckDBPyConnection):
+            return _evict_cache_duck(eng, max_bytes, max_rows, max_jobs)
+        return _evict_cache_pg(eng, max_rows, max_jobs)
+    except Exception:
+        # A pass that failed halfway may already have dropped jobs the index still lists.
+        _geometry_index(eng).invalidate()
+        raise
+
+
+# ---------------------------------------------------------------------------
+# Initialisation
+# ---------------------------------------------------------------------------
+
+
+def print_cache_status(engine: CacheEngine | None = None) -> None:
+    eng = engine or get_engine()
+    if eng is None:
+        print("[AgriGEE cache] Cache not initialised.")
+        return
+
+    if isinstance(eng, duckdb.DuckDBPyConnection):
+        with _duck_reader(eng) as cursor:
+            total_row = cursor.execute("SELECT COUNT(*) FROM sits_jobs").fetchone()
+            assert total_row is not None
+            total_sits: int = int(total_row[0])
+
+            sat_tables = sorted(
+                r[0]
+                for r in cursor.execute(
+                    "SELECT table_name FROM information_schema.tables WHERE table_schema = 'main'"
+                ).fetchall()
+                if r[0] not in _DUCK_SYSTEM
+            )
+            images_by_sensor: dict[str, int] = {}
+            for tbl in sat_tables:
+                cnt_row = cursor.execute(f'SELECT COUNT(*) FROM "{tbl}"').fetchone()
+                assert cnt_row is not None
+                images_by_sensor[tbl] = int(cnt_row[0])
         backend = f"DuckDB ({DEFAULT_DB_PATH})"
     else:
         with eng.connect() as conn:
@@ -1299,11 +3615,12 @@ def print_cache_status(engine: CacheEngine | None = None) -> None:
     print("\n".join(lines))
 
 
-def init_cache(db_path: pathlib.Path = DEFAULT_DB_PATH) -> CacheEngine:
-    global _duck_conn, _pg_engine
+def init_cache(db_path: pathlib.Path = DEFAULT_DB_PATH, observation_store: str | None = None) -> CacheEngine:
+    global _duck_conn, _duck_observation_root, _duck_writer, _pg_engine
 
     from agrigee_lite.sat import (
         ANADEM,
+        NAIP,
         CopernicusDEM,
         HLSLandsat,
         HLSSentinel2,
@@ -1314,7 +3631,6 @@ def init_cache(db_path: pathlib.Path = DEFAULT_DB_PATH) -> CacheEngine:
         MapBiomas,
         Modis8Days,
         ModisDaily,
-        NAIP,
         PALSAR2ScanSAR,
         SatelliteEmbedding,
         Sentinel1GRD,
@@ -1352,20 +3668,128 @@ def init_cache(db_path: pathlib.Path = DEFAULT_DB_PATH) -> CacheEngine:
             _ensure_geometries_table_pg(conn)
             _ensure_sits_jobs_table_pg(conn)
             _ensure_api_jobs_table_pg(conn)
+            _ensure_sits_run_tables(conn)
+            _ensure_band_storage_table(conn)
             for sat in satellites:
-                _ensure_satellite_table_pg(conn, sat.shortName, _get_band_columns(sat))
+                _ensure_satellite_table_pg(
+                    conn,
+                    sat.shortName,
+                    _get_band_columns(sat),
+                    _configured_band_storage(sat.shortName, reflectance=_stores_reflectance(sat)),
+                )
         _pg_engine = engine_pg
         return engine_pg
     else:
         logger.info("AgriGEE cache: using DuckDB backend (%s)", db_path)
         conn = _make_duckdb_conn(db_path)
         _ensure_schema_duck(conn)
+        try:
+            observation_root = _resolve_observation_root(
+                conn,
+                db_path,
+                observation_store or CACHE_OBSERVATION_STORE,
+                [sat.shortName for sat in satellites],
+            )
+        except ValueError:
+            conn.close()
+            raise
+        if observation_root is not None:
+            _discard_orphaned_observations_duck(conn, observation_root)
+            # Observation files are immutable, so their footers can be cached for the session.
+            conn.execute("SET GLOBAL parquet_metadata_cache = true")
         for sat in satellites:
-            _ensure_sat_table_duck(conn, sat.shortName, _get_band_columns(sat))
+            _ensure_sat_table_duck(
+                conn,
+                sat.shortName,
+                _get_band_columns(sat),
+                observation_root,
+                _configured_band_storage(sat.shortName, reflectance=_stores_reflectance(sat)),
+            )
+        if _duck_writer is not None:
+            _duck_writer.close()
         _duck_conn = conn
+        _duck_observation_root = observation_root
+        _duck_writer = _DuckWriter(conn)
         return conn
 
 
+def _migrate_sat_table_duck(
+    conn: duckdb.DuckDBPyConnection,
+    observation_root: pathlib.Path,
+    table_name: str,
+) -> int:
+    columns = [r[0] for r in conn.execute(f'DESCRIBE "{table_name}"').fetchall()]
+    band_cols = [c for c in columns if c not in {"id", "job_id", "timestamp"}]
+    # The table is only dropped once its files are staged, so files found next
+    # to a table that still exists are from an interrupted migration. Start
+    # over instead of staging every row a second time.
+    shutil.rmtree(observation_root / table_name, ignore_errors=True)
+    count_row = conn.execute(f'SELECT COUNT(*) FROM "{table_name}"').fetchone()
+    assert count_row is not None
+    moved = int(count_row[0])
+
+    if moved:
+        band_sql = "".join(f', o."{c}"' for c in band_cols)
+        source = f"""(
+            SELECT o.job_id, o.timestamp{band_sql}, g.h3_coarse
+            FROM "{table_name}" o
+            JOIN sits_jobs s ON s.id = o.job_id
+            JOIN geometries g ON g.id = s.geometry_id
+        ) AS m"""
+        _stage_observations(conn, observation_root, table_name, source, band_cols, _band_storage(conn, table_name))
+
+    conn.begin()
+    try:
+        conn.execute(f'DROP TABLE "{table_name}"')
+        conn.execute(f'DROP SEQUENCE IF EXISTS "{table_name}_id_seq"')
+        _ensure_sat_view_duck(conn, observation_root, table_name, band_cols, _band_storage(conn, table_name))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return moved
+
+
+def migrate_observations_to_parquet(db_path: pathlib.Path = DEFAULT_DB_PATH) -> dict[str, int]:
+    """Move the observation tables of a DuckDB cache into the Parquet store.
+
+    Each satellite table is rewritten as Parquet files partitioned by H3 coarse
+    cell under ``<db stem>_observations/<satellite>/`` and replaced by a view of
+    the same name, so existing queries keep working. Later writes to this cache
+    go to the Parquet store. Returns the number of rows moved per table.
+    """
+    global _duck_observation_root
+
+    db_path = pathlib.Path(db_path)
+    if not db_path.exists():
+        raise FileNotFoundError(f"No DuckDB cache at {db_path}.")
+
+    observation_root = _observation_root(db_path)
+    moved: dict[str, int] = {}
+    conn = duckdb.connect(str(db_path))
+    try:
+        with _duck_write_lock:
+            tables = [
+                r[0]
+                for r in conn.execute(
+                    "SELECT table_name FROM information_schema.tables "
+                    "WHERE table_schema = 'main' AND table_type = 'BASE TABLE'"
+                ).fetchall()
+                if r[0] not in _DUCK_SYSTEM
+            ]
+            for table_name in sorted(tables):
+                moved[table_name] = _migrate_sat_table_duck(conn, observation_root, table_name)
+            conn.execute("CHECKPOINT")
+    finally:
+        conn.close()
+
+    if _duck_conn is not None and _duck_db_path(_duck_conn) == db_path.resolve():
+        _duck_conn.execute("SET GLOBAL parquet_metadata_cache = true")
+        _duck_observation_root = observation_root
+    logger.info("AgriGEE cache: moved %d observations to %s", sum(moved.values()), observation_root)
+    return moved
+
+
 def _delete_dir_contents(directory: pathlib.Path) -> int:
     count = 0
     for f in directory.rglob("*"):
@@ -1380,22 +3804,26 @@ def _delete_dir_contents(directory: pathlib.Path) -> int:
 
 
 def _clear_sits_db(removed: list[str]) -> None:
-    global _duck_conn
     eng = get_engine()
+    if eng is not None:
+        _geometry_index(eng).invalidate()
     if eng is not None and isinstance(eng, sa.Engine):
         with eng.begin() as conn:
             conn.execute(sa.text("DROP SCHEMA public CASCADE"))
             conn.execute(sa.text("CREATE SCHEMA public"))
         removed.append("PostGIS schema (agrigeelite)")
     else:
-        if _duck_conn is not None:
-            _duck_conn.close()
-            _duck_conn = None
+        _close_duck_engine()
         db_file = DEFAULT_DB_PATH
+        observation_store = "parquet" if _duck_observation_root is not None else None
         if db_file.exists():
             db_file.unlink()
             removed.append(str(db_file))
-        init_cache(db_file)
+        observation_dir = _observation_root(db_file)
+        if observation_dir.exists():
+            shutil.rmtree(observation_dir)
+            removed.append(str(observation_dir))
+        init_cache(db_file, observation_store)
 
 
 def clear_cache(
@@ -25,6 +25,21 @@ def _env_int(name: str, default: int, minimum: int | None = None, maximum: int |
     return value
 
 
+def _env_float(name: str, default: float, minimum: float | None = None) -> float:
+    raw = os.getenv(name)
+    if raw is None:
+        value = default
+    else:
+        try:
+            value = float(raw)
+        except ValueError:
+            value = default
+
+    if minimum is not None and value < minimum:
+        value = minimum
+    return value
+
+
 def _env_bool(name: str, default: bool) -> bool:
     raw = os.getenv(name)
     if raw is None:
@@ -45,6 +60,10 @@ EE_BATCH_CONCURRENCY = _env_int("AGRIGEE_EE_BATCH_CONCURRENCY", 2, minimum=1)
 USE_UVLOOP = _env_bool("AGRIGEE_USE_UVLOOP", True)
 ASYNC_MAX_PARALLEL_DOWNLOADS = _env_int("AGRIGEE_MAX_PARALLEL_DOWNLOADS", 40, minimum=1)
 ASYNC_MAX_URL_WORKERS = _env_int("AGRIGEE_MAX_URL_WORKERS", 10, minimum=1)
+# Download URLs minted ahead of the download slots (default = max parallel downloads).
+ASYNC_URL_PREFETCH = _env_int("AGRIGEE_URL_PREFETCH", ASYNC_MAX_PARALLEL_DOWNLOADS, minimum=1)
+# Spread SITS chunks over every account in GEE_KEY_MULTIPLE_ACCOUNTS, each with its own limits.
+ASYNC_SHARD_SERVICE_ACCOUNTS = _env_bool("AGRIGEE_SHARD_SERVICE_ACCOUNTS", False)
 ASYNC_MAX_RETRIES_PER_CHUNK = _env_int("AGRIGEE_MAX_RETRIES_PER_CHUNK", 8, minimum=1)
 AIOHTTP_TIMEOUT_SECONDS = _env_int("AGRIGEE_AIOHTTP_TIMEOUT_SECONDS", 600, minimum=1)
 AIOHTTP_CONNECTOR_LIMIT = _env_int(
@@ -53,6 +72,39 @@ AIOHTTP_CONNECTOR_LIMIT = _env_int(
     minimum=1,
 )
 SITS_CHUNKSIZE = _env_int("AGRIGEE_SITS_CHUNKSIZE", 10, minimum=1)
+# Pack SITS rows by estimated GEE cost (SITS_CHUNKSIZE point-years per chunk) instead of a fixed row count.
+# Off by default: long series get far fewer rows per chunk than the fixed SITS_CHUNKSIZE.
+SITS_ADAPTIVE_CHUNKS = _env_bool("AGRIGEE_SITS_ADAPTIVE_CHUNKS", False)
+# Upper bound on rows in one adaptive chunk, however cheap the rows are.
+SITS_MAX_CHUNK_ROWS = _env_int("AGRIGEE_SITS_MAX_CHUNK_ROWS", 50, minimum=1)
+# Record SITS chunk progress in the cache so an interrupted run resumes where it stopped.
+SITS_RUN_MANIFESTS = _env_bool("AGRIGEE_SITS_RUN_MANIFESTS", True)
+# Topology-preserving simplification tolerance and coordinate grid (degrees) applied to SITS
+# geometries before upload to GEE. 0 disables either stage.
+SITS_SIMPLIFY_TOLERANCE = _env_float("AGRIGEE_SITS_SIMPLIFY_TOLERANCE", 0.0, minimum=0.0)
+SITS_COORDINATE_PRECISION = _env_float("AGRIGEE_SITS_COORDINATE_PRECISION", 0.0, minimum=0.0)
+# DuckDB observation layout: "table" (rows inside sits_cache.duckdb) or "parquet" (immutable files
+# partitioned by satellite and H3 coarse cell, next to the database).
+CACHE_OBSERVATION_STORE = os.getenv("AGRIGEE_CACHE_OBSERVATION_STORE", "table").lower()
+# Band column storage for new satellite tables: float64, float32 or int16[:scale[:offset]],
+# either for all satellites ("float32") or per satellite ("s2sr=int16,s1a=float32").
+# int16 for all satellites only covers reflectance tables; name other tables to use it there.
+# Empty keeps the backend default (DOUBLE on DuckDB, REAL on PostGIS).
+CACHE_BAND_PRECISION = os.getenv("AGRIGEE_CACHE_BAND_PRECISION", "")
+# Geometries whose cache index lookups (geometry id, covering jobs) are kept in process; 0 disables it.
+CACHE_LOOKUP_SIZE = _env_int("AGRIGEE_CACHE_LOOKUP_SIZE", 4096, minimum=0)
+# Seconds a cached lookup is trusted, which bounds staleness when another process writes the cache.
+CACHE_LOOKUP_TTL_SECONDS = _env_int("AGRIGEE_CACHE_LOOKUP_TTL_SECONDS", 300, minimum=0)
+# Budget of the SITS cache in bytes (DuckDB blocks in use plus observation files) and in observation rows;
+# 0 is unbounded. PostGIS only enforces the row budget.
+# Least recently read jobs are evicted once either is exceeded.
+CACHE_MAX_BYTES = _env_int("AGRIGEE_CACHE_MAX_BYTES", 0, minimum=0)
+CACHE_MAX_ROWS = _env_int("AGRIGEE_CACHE_MAX_ROWS", 0, minimum=0)
+# Most jobs evicted per transaction, and seconds between the API server's background eviction runs.
+CACHE_EVICTION_BATCH = _env_int("AGRIGEE_CACHE_EVICTION_BATCH", 500, minimum=1)
+CACHE_EVICTION_INTERVAL_SECONDS = _env_int("AGRIGEE_CACHE_EVICTION_INTERVAL_SECONDS", 300, minimum=1)
+# Decode chunk CSVs incrementally in a worker thread while the body is still downloading.
+STREAM_CSV_DECODE = _env_bool("AGRIGEE_STREAM_CSV_DECODE", True)
 
 # AIMD adaptive concurrency tuning.
 # Option A: slow rise — limit increments only every N successful chunks (default 5).
@@ -63,3 +115,11 @@ ASYNC_AIMD_INITIAL_DOWNLOADS = _env_int(
     ASYNC_MAX_PARALLEL_DOWNLOADS,
     minimum=1,
 )
+
+# Optional JSON file where learned per-account download concurrency is kept across restarts.
+ASYNC_CONCURRENCY_STATE_PATH = os.getenv("AGRIGEE_CONCURRENCY_STATE_PATH") or None
+
+# Concurrency limiter: "aimd" (429-driven) or "gradient" (also backs off when chunk latency climbs).
+ASYNC_CONCURRENCY_LIMITER = os.getenv("AGRIGEE_CONCURRENCY_LIMITER", "aimd").lower()
+# The gradient limiter learns its latency baseline while ramping up, so it starts low.
+ASYNC_GRADIENT_INITIAL_DOWNLOADS = _env_int("AGRIGEE_GRADIENT_INITIAL_DOWNLOADS", 4, minimum=1)
@@ -1,19 +1,32 @@
 import asyncio
 import json
 import os
-from datetime import date, datetime
+import threading
+from dataclasses import dataclass, field
 
+import aiohttp
 import ee
+import google.auth.transport.requests
 import numpy as np
 import pandas as pd
-import pyproj
-from typing import cast
-from shapely.geometry import mapping
-from shapely.ops import transform
-
-from agrigee_lite._geo_compat import GeoDataFrameLike, geometry_value_to_shapely, get_crs, normalize_geodataframe
+import polars as pl
+import shapely
+from typing import Any, cast
+
+from agrigee_lite._geo_compat import (
+    GeoDataFrameLike,
+    get_crs,
+    normalize_geodataframe,
+    reproject_geometries,
+    shapely_geometry_array,
+)
 from agrigee_lite.config import HIGH_VOLUME_ENDPOINT, USE_UVLOOP
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 def ee_map_bands_and_doy(
     ee_img: ee.Image,
@@ -187,10 +200,75 @@ def ee_gdf_to_feature_collection(
     )
 
 
-def _format_ee_feature_property(value: object) -> object:
-    if isinstance(value, (pd.Timestamp, datetime, date)):
-        return value.strftime("%Y-%m-%d")
-    return value
+def ee_gdf_to_feature_collection_value(
+    gdf: GeoDataFrameLike,
+    original_index_column_name: str,
+    start_date_column_name: str = "start_date",
+    end_date_column_name: str = "end_date",
+    crs: str | None = None,
+) -> dict[str, Any]:
+    """
+    Encode a compatible geo frame as a serialized Earth Engine FeatureCollection.
+
+    Returns the same collection as ``ee_gdf_to_feature_collection``, as a
+    Cloud API value node ready to be placed in a serialized expression. No ee
+    objects are built, and coordinates and properties are written as
+    constants rather than one node per vertex, so the node is much cheaper
+    to build and to send.
+    """
+    payload = _build_feature_collection_payload(
+        gdf,
+        original_index_column_name,
+        start_date_column_name,
+        end_date_column_name,
+        crs=crs or cast(str | None, get_crs(gdf)),
+    )
+    return {
+        "functionInvocationValue": {
+            "functionName": "Collection",
+            "arguments": {
+                "features": {
+                    "arrayValue": {"values": [_encode_feature_value(f) for f in cast(list, payload["features"])]}
+                }
+            },
+        }
+    }
+
+
+_CONSTANT_GEOMETRY_TYPES = {"Point", "MultiPoint", "LineString", "MultiLineString", "Polygon", "MultiPolygon"}
+
+
+def _encode_feature_value(feature: dict[str, Any]) -> dict[str, Any]:
+    geometry = feature["geometry"]
+    if geometry["type"] not in _CONSTANT_GEOMETRY_TYPES:
+        # Collections of geometries are rare enough to leave to the client library.
+        return cast(dict[str, Any], ee.serializer.encode(ee.Feature(feature), is_compound=False, for_cloud_api=True))
+
+    arguments = {"coordinates": {"constantValue": geometry["coordinates"]}}
+    if "geodesic" in geometry:
+        arguments["geodesic"] = {"constantValue": geometry["geodesic"]}
+    return {
+        "functionInvocationValue": {
+            "functionName": "Feature",
+            "arguments": {
+                "geometry": {
+                    "functionInvocationValue": {
+                        "functionName": f"GeometryConstructors.{geometry['type']}",
+                        "arguments": arguments,
+                    }
+                },
+                "metadata": {"constantValue": feature["properties"]},
+            },
+        }
+    }
+
+
+def _ee_feature_property(frame: pl.DataFrame, column: str, name: str) -> pl.Expr:
+    expr = pl.col(column)
+    dtype = frame.schema[column]
+    if dtype == pl.Date or isinstance(dtype, pl.Datetime):
+        expr = expr.dt.strftime("%Y-%m-%d")
+    return expr.alias(name)
 
 
 def _build_feature_collection_payload(
@@ -202,43 +280,39 @@ def _build_feature_collection_payload(
 ) -> dict[str, object]:
     """
     Build the GeoJSON-like payload consumed by ``ee.FeatureCollection``.
+
+    Geometries are encoded by ``shapely.to_geojson`` and properties by Polars,
+    column at a time; the feature strings are joined and parsed in one go,
+    by orjson when it is installed.
     """
     effective_crs = crs or cast(str | None, get_crs(gdf))
     if effective_crs is None:
         raise ValueError("Input geodataframe must define a CRS before conversion to Earth Engine features.")
 
     normalized = normalize_geodataframe(gdf, crs=effective_crs)
-
-    transformer = pyproj.Transformer.from_crs(effective_crs, "EPSG:4326", always_xy=True)
-    transform_to_wgs84 = transformer.transform
-
-    feature_frame = normalized.select([
-        "geometry",
-        original_index_column_name,
-        start_date_column_name,
-        end_date_column_name,
-    ])
-    features: list[dict[str, object]] = []
-
-    for row in feature_frame.iter_rows(named=True):
-        geometry = geometry_value_to_shapely(row["geometry"])
-        geometry_wgs84 = transform(transform_to_wgs84, geometry)
-        geometry_geojson = json.loads(json.dumps(mapping(geometry_wgs84)))
-        if geometry_geojson["type"] != "Point":
-            geometry_geojson["geodesic"] = True
-
-        properties = {
-            "0": _format_ee_feature_property(row[original_index_column_name]),
-            "s": _format_ee_feature_property(row[start_date_column_name]),
-            "e": _format_ee_feature_property(row[end_date_column_name]),
-        }
-        features.append({
-            "type": "Feature",
-            "geometry": geometry_geojson,
-            "properties": properties,
-        })
-
-    return {"type": "FeatureCollection", "features": features}
+    geometries_wgs84 = reproject_geometries(shapely_geometry_array(normalized), effective_crs)
+
+    feature_frame = normalized.select(
+        pl.Series("geometry", shapely.to_geojson(geometries_wgs84), dtype=pl.String),
+        pl.Series("is_point", shapely.get_type_id(geometries_wgs84) == shapely.GeometryType.POINT),
+        _ee_feature_property(normalized, original_index_column_name, "0"),
+        _ee_feature_property(normalized, start_date_column_name, "s"),
+        _ee_feature_property(normalized, end_date_column_name, "e"),
+    )
+    geodesic = pl.col("geometry").str.strip_suffix("}") + pl.lit(',"geodesic":true}')
+    features = feature_frame.select(
+        pl.concat_str(
+            pl.lit('{"type":"Feature","geometry":'),
+            pl.when(pl.col("is_point")).then(pl.col("geometry")).otherwise(geodesic),
+            pl.lit(',"properties":'),
+            pl.struct("0", "s", "e").struct.json_encode(),
+            pl.lit("}"),
+        )
+    ).to_series()
+    return cast(
+        dict[str, object],
+        _json_loads('{"type":"FeatureCollection","features":[' + ",".join(features) + "]}"),
+    )
 
 
 def ee_img_to_numpy(ee_img: ee.Image, ee_geometry: ee.Geometry, scale: int) -> np.ndarray:
@@ -770,6 +844,11 @@ def ee_quick_start() -> None:
             )
 
 
+def _service_account_key_paths() -> list[str]:
+    gee_key_multiple_accounts = os.environ.get("GEE_KEY_MULTIPLE_ACCOUNTS", "")
+    return [sa.strip() for sa in gee_key_multiple_accounts.split(",") if sa.strip()]
+
+
 def get_number_of_available_service_accounts() -> int:
     """
     Retrieve the number of available Earth Engine service accounts in the environment variable GEE_KEY_MULTIPLE_ACCOUNTS.
@@ -779,9 +858,7 @@ def get_number_of_available_service_accounts() -> int:
     If the environment variable is not set, the function returns 1.
     """
     if "GEE_KEY_MULTIPLE_ACCOUNTS" in os.environ:
-        gee_key_multiple_accounts = os.environ["GEE_KEY_MULTIPLE_ACCOUNTS"]
-        service_accounts = [sa.strip() for sa in gee_key_multiple_accounts.split(",") if sa.strip()]
-        return len(service_accounts)
+        return len(_service_account_key_paths())
     else:
         return 1
 
@@ -819,8 +896,7 @@ def login_with_service_account_n(n: int) -> str:
     if "GEE_KEY_MULTIPLE_ACCOUNTS" not in os.environ:
         return ""
 
-    gee_key_multiple_accounts = os.environ["GEE_KEY_MULTIPLE_ACCOUNTS"]
-    service_accounts = [sa.strip() for sa in gee_key_multiple_accounts.split(",") if sa.strip()]
+    service_accounts = _service_account_key_paths()
 
     if n < 0 or n >= len(service_accounts):
         raise IndexError(f"Service account index {n} is out of range. Available accounts: {len(service_accounts)}")  # noqa: TRY003
@@ -835,3 +911,102 @@ def login_with_service_account_n(n: int) -> str:
         key_data = json.load(f)
 
     return str(key_data.get("project_id", "unknown"))
+
+
+@dataclass
+class EEServiceAccount:
+    """Earth Engine service account that mints download URLs with its own quota.
+
+    Attributes
+    ----------
+    project : str
+        Cloud project billed for the requests.
+    credentials : google.auth.credentials.Credentials
+        OAuth2 credentials of the account. Refreshed on demand.
+    api_base_url : str
+        Earth Engine REST endpoint, the high-volume endpoint by default.
+    """
+
+    project: str
+    credentials: Any
+    api_base_url: str = HIGH_VOLUME_ENDPOINT
+    _refresh_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def access_token(self) -> str:
+        """Return a valid OAuth2 token, refreshing it first when expired (blocking)."""
+        with self._refresh_lock:
+            if not self.credentials.valid:
+                self.credentials.refresh(google.auth.transport.requests.Request())
+            return str(self.credentials.token)
+
+
+def load_service_accounts() -> list[EEServiceAccount]:
+    """
+    Load every service account listed in the GEE_KEY_MULTIPLE_ACCOUNTS environment variable.
+
+    Unlike ``login_with_service_account_n``, the global Earth Engine session is
+    left untouched: each account keeps its own credentials.
+
+    Returns
+    -------
+    list of EEServiceAccount
+        One entry per key file, empty when the variable is not set.
+    """
+    accounts: list[EEServiceAccount] = []
+    for key_path in _service_account_key_paths():
+        with open(key_path) as f:
+            key_data = json.load(f)
+        accounts.append(
+            EEServiceAccount(
+                project=str(key_data.get("project_id", "unknown")),
+                credentials=ee.ServiceAccountCredentials(key_path, key_path),
+            )
+        )
+    return accounts
+
+
+async def ee_create_table_download_url(
+    session: aiohttp.ClientSession,
+    account: EEServiceAccount,
+    expression: dict[str, Any],
+    selectors: list[str],
+    filename: str,
+) -> str:
+    """
+    Mint a CSV table download URL on behalf of a specific service account.
+
+    This is the REST call behind ``ee.FeatureCollection.getDownloadURL``, issued
+    with the account's own token so that quota is charged to its project.
+
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        Session used for the request.
+    account : EEServiceAccount
+        Account that owns the download.
+    expression : dict
+        Serialized expression, from ``ee.serializer.encode(..., for_cloud_api=True)``.
+    selectors : list of str
+        Properties to keep in the CSV.
+    filename : str
+        Name of the downloaded file.
+
+    Returns
+    -------
+    str
+        URL serving the table as CSV.
+    """
+    if account.credentials.valid:
+        token = str(account.credentials.token)
+    else:
+        token = await asyncio.to_thread(account.access_token)
+
+    async with session.post(
+        f"{account.api_base_url}/v1/projects/{account.project}/tables",
+        params={"fields": "name"},
+        json={"expression": expression, "fileFormat": "CSV", "selectors": selectors, "filename": filename},
+        headers={"Authorization": f"Bearer {token}"},
+    ) as resp:
+        resp.raise_for_status()
+        name = (await resp.json())["name"]
+    return f"{account.api_base_url}/v1/{name}:getFeatures"
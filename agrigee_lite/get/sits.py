@@ -1,66 +1,98 @@
 import asyncio
+import contextlib
 import getpass
+import io
 import json
 import logging
+import queue
 import signal
 import sys
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from collections.abc import Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
 from functools import partial
 from typing import Any, cast
 
 import aiohttp
 import ee
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 import pandera.pandas as pa
 import polars as pl
+import pyarrow.csv as pa_csv
+import shapely
 from shapely import MultiPolygon, Point, Polygon
-from tenacity import AsyncRetrying, RetryError, stop_after_attempt, wait_random_exponential
+from tenacity import AsyncRetrying, RetryError, retry_if_exception, stop_after_attempt, wait_random_exponential
 from tqdm.auto import tqdm
 
+from agrigee_lite._concurrency import get_concurrency_controller, save_concurrency_state
 from agrigee_lite._geo_compat import (
     GeoDataFrameLike,
     NormalizedGeoDataFrame,
-    geometry_value_to_shapely,
     get_crs,
     normalize_geodataframe,
+    reproject_geometries,
+    shapely_geometry_array,
+    to_geopandas_geodataframe,
     transform_geometry,
     wrap_geopolars_frame,
-    to_geopandas_geodataframe,
 )
 from agrigee_lite.cache.backend import (
     CacheEngine,
+    compute_params_hash,
+    compute_sits_run_hash,
+    create_sits_run_manifest,
+    delete_sits_run_manifest,
     fetch_sits_batch_coverage,
-    fetch_sits_by_job_ids,
+    fetch_sits_by_requests,
     fetch_sits_with_gaps,
     get_engine,
+    load_sits_run_manifest,
+    save_sits_run_progress,
+    store_sits_batch_polars,
     store_sits_polars,
 )
 from agrigee_lite.config import (
     AIOHTTP_CONNECTOR_LIMIT,
     AIOHTTP_TIMEOUT_SECONDS,
-    ASYNC_AIMD_INITIAL_DOWNLOADS,
-    ASYNC_AIMD_SUCCESS_STRIDE,
     ASYNC_MAX_PARALLEL_DOWNLOADS,
     ASYNC_MAX_RETRIES_PER_CHUNK,
     ASYNC_MAX_URL_WORKERS,
+    ASYNC_SHARD_SERVICE_ACCOUNTS,
+    ASYNC_URL_PREFETCH,
+    HIGH_VOLUME_ENDPOINT,
+    SITS_ADAPTIVE_CHUNKS,
     SITS_CHUNKSIZE,
+    SITS_COORDINATE_PRECISION,
+    SITS_MAX_CHUNK_ROWS,
+    SITS_RUN_MANIFESTS,
+    SITS_SIMPLIFY_TOLERANCE,
+    STREAM_CSV_DECODE,
 )
 from agrigee_lite.ee_utils import (
+    EEServiceAccount,
+    ee_create_table_download_url,
     ee_gdf_to_feature_collection,
+    ee_gdf_to_feature_collection_value,
     ee_get_tasks_status,
+    load_service_accounts,
 )
 from agrigee_lite.misc import (
     create_gdf_hash,
     get_reducer_names,
     h3_clustering,
     log_dict_function_call_summary,
+    simplify_gdf,
 )
 from agrigee_lite.sat.abstract_satellite import AbstractSatellite, OpticalSatellite
 from agrigee_lite.task_manager import GEETaskManager
 
 logger = logging.getLogger(__name__)
 TabularFrame = pd.DataFrame | pl.DataFrame
+_STREAM_CSV_BLOCK_BYTES = 1 << 16
+# Body chunks buffered per streaming decode before the download waits for the decoder.
+_STREAM_CSV_MAX_BUFFERED_CHUNKS = 16
 
 
 def _as_date_str(value: pd.Timestamp | str) -> str:
@@ -131,6 +163,15 @@ def build_ee_expression(
         end_date_column_name,
         crs=effective_crs,
     )
+    return _map_satellite(fc, satellite, reducers, subsampling_max_pixels)
+
+
+def _map_satellite(
+    fc: ee.FeatureCollection,
+    satellite: AbstractSatellite,
+    reducers: set[str] | None,
+    subsampling_max_pixels: float,
+) -> ee.FeatureCollection:
     return ee.FeatureCollection(
         fc.map(
             partial(
@@ -142,6 +183,97 @@ def build_ee_expression(
     ).flatten()
 
 
+# Table loaded by the template in place of a chunk's features; never fetched.
+_CHUNK_TABLE_ID = "agrigee_lite/chunk_features"
+_CHUNK_FEATURES_KEY = "features"
+_EXPRESSION_TEMPLATES_SIZE = 8
+
+
+class _ExpressionTemplate:
+    """Serialized satellite graph of ``build_ee_expression`` with a hole for the chunk's features.
+
+    The graph mapped over the features only depends on the satellite, reducers
+    and sampling, so it is built and serialized once. Template value keys get a
+    ``t`` prefix and the hole becomes a reference to ``features``, which is all
+    each chunk adds.
+    """
+
+    def __init__(self, satellite: AbstractSatellite, reducers: set[str] | None, subsampling_max_pixels: float) -> None:
+        placeholder = ee.FeatureCollection(_CHUNK_TABLE_ID)
+        hole = ee.serializer.encode(placeholder, is_compound=False, for_cloud_api=True)
+        encoded = ee.serializer.encode(
+            _map_satellite(placeholder, satellite, reducers, subsampling_max_pixels), for_cloud_api=True
+        )
+        self._holes = 0
+        self._result = f"t{encoded['result']}"
+        self._values = {f"t{key}": self._splice(value, hole) for key, value in encoded["values"].items()}
+        if self._holes == 0:
+            raise RuntimeError("Placeholder feature collection not found in the serialized satellite graph.")
+
+    def _splice(self, node: Any, hole: dict[str, Any]) -> Any:
+        if node == hole:
+            self._holes += 1
+            return {"valueReference": _CHUNK_FEATURES_KEY}
+        if isinstance(node, list):
+            return [self._splice(item, hole) for item in node]
+        if not isinstance(node, dict):
+            return node
+        out = {key: value if key == "constantValue" else self._splice(value, hole) for key, value in node.items()}
+        for key in ("valueReference", "functionReference"):
+            if isinstance(out.get(key), str):
+                out[key] = f"t{out[key]}"
+        if isinstance(node.get("body"), str) and "argumentNames" in node:
+            out["body"] = f"t{node['body']}"
+        return out
+
+    def encode(self, features: dict[str, Any]) -> dict[str, Any]:
+        return {"result": self._result, "values": {**self._values, _CHUNK_FEATURES_KEY: features}}
+
+
+_expression_templates: dict[str, _ExpressionTemplate] = {}
+_expression_templates_lock = threading.Lock()
+
+
+def _expression_template(
+    satellite: AbstractSatellite, reducers: set[str] | None, subsampling_max_pixels: float
+) -> _ExpressionTemplate:
+    key = compute_params_hash(satellite, reducers, subsampling_max_pixels)
+    with _expression_templates_lock:
+        template = _expression_templates.get(key)
+        if template is None:
+            template = _ExpressionTemplate(satellite, reducers, subsampling_max_pixels)
+            if len(_expression_templates) >= _EXPRESSION_TEMPLATES_SIZE:
+                del _expression_templates[next(iter(_expression_templates))]
+            _expression_templates[key] = template
+        return template
+
+
+def encode_ee_expression(
+    gdf: GeoDataFrameLike,
+    satellite: AbstractSatellite,
+    reducers: set[str] | None,
+    subsampling_max_pixels: float,
+    original_index_column_name: str,
+    crs: str | None = None,
+    start_date_column_name: str = "start_date",
+    end_date_column_name: str = "end_date",
+) -> dict[str, Any]:
+    """
+    Serialize ``build_ee_expression`` for the Cloud API, reusing the satellite graph.
+
+    Equivalent to ``ee.serializer.encode(build_ee_expression(...), for_cloud_api=True)``
+    but only the chunk's features are encoded per call, and those as constants.
+    """
+    features = ee_gdf_to_feature_collection_value(
+        gdf,
+        original_index_column_name,
+        start_date_column_name,
+        end_date_column_name,
+        crs=crs or get_crs(gdf),
+    )
+    return _expression_template(satellite, reducers, subsampling_max_pixels).encode(features)
+
+
 def build_selectors(satellite: AbstractSatellite, reducers: set[str] | None) -> list[str]:
     """Return the GEE column selectors that map to the output DataFrame columns.
 
@@ -186,6 +318,157 @@ def build_selectors(satellite: AbstractSatellite, reducers: set[str] | None) ->
         ]
 
 
+def build_csv_schema(satellite: AbstractSatellite, reducers: set[str] | None) -> dict[str, pl.DataType]:
+    """Return the column dtypes of a chunk CSV downloaded with ``build_selectors``.
+
+    Declaring the schema up front keeps dtypes identical across chunks
+    instead of re-inferring them from each response body.
+
+    Parameters
+    ----------
+    satellite : AbstractSatellite
+        Configured satellite whose selected bands/indices define the columns.
+    reducers : set of str or None
+        Reducers passed to ``build_selectors``.
+
+    Returns
+    -------
+    dict of str to polars.DataType
+        ``00_indexnum`` as Int64, ``01_timestamp`` as String and every
+        measurement column as Float64.
+    """
+    schema: dict[str, pl.DataType] = {}
+    for selector in build_selectors(satellite, reducers):
+        if selector == "00_indexnum":
+            schema[selector] = pl.Int64()
+        elif selector == "01_timestamp":
+            schema[selector] = pl.String()
+        else:
+            schema[selector] = pl.Float64()
+    return schema
+
+
+class _ResponseBodyPipe(io.RawIOBase):
+    """Blocking file-like view over body chunks fed from the event loop.
+
+    At most ``max_chunks`` chunks are buffered: ``feed`` waits on the loop
+    until the decoder thread has taken one, so a slow decoder throttles the
+    download instead of buffering the whole body.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_chunks: int = _STREAM_CSV_MAX_BUFFERED_CHUNKS) -> None:
+        self._loop = loop
+        # One slot on top of the data chunks for the end-of-stream sentinel.
+        self._chunks: queue.Queue[bytes | None] = queue.Queue(maxsize=max_chunks + 1)
+        self._free_slots = asyncio.Semaphore(max_chunks)
+        self._max_chunks = max_chunks
+        self._pending = memoryview(b"")
+        self._eof = False
+        self._aborted = False
+        self._closed_by_reader = False
+
+    @property
+    def closed_by_reader(self) -> bool:
+        return self._closed_by_reader
+
+    async def feed(self, data: bytes) -> None:
+        if self._closed_by_reader:
+            return
+        await self._free_slots.acquire()
+        if self._closed_by_reader:
+            self._free_slots.release()
+        else:
+            self._chunks.put_nowait(data)
+
+    def finish(self) -> None:
+        self._chunks.put_nowait(None)
+
+    def abort(self) -> None:
+        self._aborted = True
+        with contextlib.suppress(queue.Full):
+            self._chunks.put_nowait(None)
+
+    def close_reader(self) -> None:
+        """Called by the decoder thread when it stops reading, so pending feeds return."""
+        self._closed_by_reader = True
+        with contextlib.suppress(RuntimeError):
+            for _ in range(self._max_chunks):
+                self._loop.call_soon_threadsafe(self._free_slots.release)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._pending and not self._eof:
+            chunk = self._chunks.get()
+            if self._aborted:
+                raise OSError("Response body stream was aborted.")
+            if chunk is None:
+                self._eof = True
+            else:
+                self._pending = memoryview(chunk)
+                with contextlib.suppress(RuntimeError):
+                    self._loop.call_soon_threadsafe(self._free_slots.release)
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def _decode_csv_stream(pipe: _ResponseBodyPipe, schema: dict[str, pl.DataType]) -> pl.DataFrame:
+    arrow_types = dict(zip(schema, pl.DataFrame(schema=schema).to_arrow().schema.types, strict=True))
+    try:
+        reader = pa_csv.open_csv(
+            pipe,
+            read_options=pa_csv.ReadOptions(block_size=_STREAM_CSV_BLOCK_BYTES),
+            convert_options=pa_csv.ConvertOptions(column_types=arrow_types, strings_can_be_null=True),
+        )
+        return cast(pl.DataFrame, pl.from_arrow(reader.read_all()))
+    finally:
+        pipe.close_reader()
+
+
+async def read_csv_streaming(
+    resp: aiohttp.ClientResponse,
+    schema: dict[str, pl.DataType],
+    executor: Executor | None = None,
+) -> pl.DataFrame:
+    """Decode a CSV response body in a worker thread while it is still downloading.
+
+    Parameters
+    ----------
+    resp : aiohttp.ClientResponse
+        Response whose body has not been read yet.
+    schema : dict of str to polars.DataType
+        Column dtypes, usually from ``build_csv_schema``.
+    executor : concurrent.futures.Executor, optional
+        Executor running the decoder. Defaults to the loop's default executor;
+        pass a dedicated one when many responses are decoded at once, since
+        each decoder holds a thread for the whole download.
+
+    Returns
+    -------
+    polars.DataFrame
+        Decoded body.
+    """
+    loop = asyncio.get_running_loop()
+    pipe = _ResponseBodyPipe(loop)
+    decoded = loop.run_in_executor(executor, _decode_csv_stream, pipe, schema)
+    try:
+        async for data in resp.content.iter_chunked(_STREAM_CSV_BLOCK_BYTES):
+            await pipe.feed(data)
+            if pipe.closed_by_reader:
+                # The decoder gave up; its error is raised below.
+                break
+    except BaseException:
+        pipe.abort()
+        with contextlib.suppress(Exception):
+            await decoded
+        raise
+    pipe.finish()
+    return await decoded
+
+
 def prepare_output_df(
     df: TabularFrame,
     satellite: AbstractSatellite,
@@ -256,6 +539,8 @@ def sanitize_and_prepare_input_gdf(
     fine_resolution: int = 8,
     start_date_column_name: str = "start_date",
     end_date_column_name: str = "end_date",
+    simplify_tolerance: float = SITS_SIMPLIFY_TOLERANCE,
+    coordinate_precision: float = SITS_COORDINATE_PRECISION,
 ) -> NormalizedGeoDataFrame:
     """
     Sanitize and prepare input GeoDataFrame for satellite time series processing.
@@ -276,35 +561,46 @@ def sanitize_and_prepare_input_gdf(
         Name of the start date column, by default "start_date".
     end_date_column_name : str, optional
         Name of the end date column, by default "end_date".
+    simplify_tolerance : float, optional
+        Topology-preserving simplification tolerance in degrees applied before
+        upload to GEE, by default ``SITS_SIMPLIFY_TOLERANCE``. 0 disables it.
+        Geometries in a projected CRS are simplified in EPSG:4326 and
+        reprojected back.
+    coordinate_precision : float, optional
+        Grid size in degrees the coordinates are snapped to before upload to
+        GEE, by default ``SITS_COORDINATE_PRECISION``. 0 disables it.
 
     Returns
     -------
     geopolars.GeoDataFrame
         Sanitized GeoDataFrame with clustering applied and invalid data filtered.
     """
-    boundary_gdf = normalize_geodataframe(gdf, crs=crs).to_geopandas()
+    normalized = normalize_geodataframe(gdf, crs=crs)
 
     if original_index_column_name == "original_index":
-        boundary_gdf = boundary_gdf.reset_index().rename(columns={"index": original_index_column_name})
+        index = np.asarray(gdf.index) if isinstance(gdf, gpd.GeoDataFrame) else np.arange(normalized.height)
+        normalized = _wrap_normalized_geo_frame(
+            normalized.with_columns(pl.Series(original_index_column_name, index)), normalized
+        )
         logger.debug("Column '%s' created to store original index.", original_index_column_name)
 
+    # Validate a pandas view of the columns kept. Geometries stay WKB, so they
+    # are neither decoded nor re-encoded on the way through.
+    columns = ["geometry", start_date_column_name, end_date_column_name, original_index_column_name]
+    boundary_df = normalized.select([column for column in columns if column in normalized.columns]).to_pandas()
     schema = pa.DataFrameSchema(
         {
-            "geometry": pa.Column("geometry", nullable=False),
+            "geometry": pa.Column(nullable=False),
             start_date_column_name: pa.Column(pa.DateTime, nullable=False),
             end_date_column_name: pa.Column(pa.DateTime, nullable=False),
-            original_index_column_name: pa.Column(boundary_gdf[original_index_column_name].dtype),
+            original_index_column_name: pa.Column(boundary_df[original_index_column_name].dtype),
         },
         unique=[original_index_column_name],
     )
-    schema.validate(boundary_gdf, lazy=True)
+    schema.validate(boundary_df, lazy=True)
 
-    boundary_gdf = boundary_gdf[
-        ["geometry", start_date_column_name, end_date_column_name, original_index_column_name]
-    ].copy()
-    normalized = normalize_geodataframe(boundary_gdf, crs=crs)
     normalized = _wrap_normalized_geo_frame(
-        normalized.with_columns(
+        normalized.select(columns).with_columns(
             pl.col(start_date_column_name).cast(pl.Datetime, strict=False),
             pl.col(end_date_column_name).cast(pl.Datetime, strict=False),
         ),
@@ -356,6 +652,27 @@ def sanitize_and_prepare_input_gdf(
     if filtered.height == 0:
         return _wrap_normalized_geo_frame(filtered, filtered)
 
+    if simplify_tolerance > 0 or coordinate_precision > 0:
+        bytes_before = int(filtered.get_column("geometry").bin.size().sum())
+        filtered = cast(
+            NormalizedGeoDataFrame,
+            simplify_gdf(
+                filtered,
+                tol=simplify_tolerance,
+                crs=crs,
+                grid_size=coordinate_precision or None,
+                units_crs="EPSG:4326",
+            ),
+        )
+        bytes_after = int(filtered.get_column("geometry").bin.size().sum())
+        logger.info(
+            "Geometry simplification shrank the upload payload from %d to %d bytes (%.1f%% smaller, %.0f bytes/row).",
+            bytes_before,
+            bytes_after,
+            100 * (1 - bytes_after / bytes_before) if bytes_before else 0.0,
+            bytes_after / filtered.height,
+        )
+
     clustered = cast(
         NormalizedGeoDataFrame,
         h3_clustering(filtered, coarse_resolution=coarse_resolution, fine_resolution=fine_resolution, crs=crs),
@@ -452,44 +769,125 @@ def download_single_sits(
     return result
 
 
-class _AdaptiveSemaphore:
-    """AIMD concurrency limiter: +1 every `success_stride` successes, //2 on rate-limit."""
-
-    def __init__(self, initial: int, minimum: int, maximum: int, success_stride: int = 1) -> None:
-        self._limit = initial
-        self._active = 0
-        self._minimum = minimum
-        self._maximum = maximum
-        self._success_stride = success_stride
-        self._success_count = 0
-        self._cond = asyncio.Condition()
-
-    async def __aenter__(self) -> "_AdaptiveSemaphore":
-        async with self._cond:
-            while self._active >= self._limit:
-                await self._cond.wait()
-            self._active += 1
-        return self
-
-    async def __aexit__(self, *_: object) -> None:
-        async with self._cond:
-            self._active -= 1
-            self._cond.notify()
-
-    async def on_success(self) -> None:
-        async with self._cond:
-            self._success_count += 1
-            if self._success_count % self._success_stride == 0 and self._limit < self._maximum:
-                self._limit += 1
-                self._cond.notify()
-
-    async def on_rate_limit(self) -> None:
-        async with self._cond:
-            self._limit = max(self._minimum, self._limit // 2)
+# Reference request cost: one pixel sampled daily for a year. A chunk budget of ``chunksize`` units keeps the
+# fixed-size default for point-year workloads.
+_COST_REFERENCE_DAYS = 365.0
+_COST_PIXELS_PER_UNIT = 1_000.0
+_COST_VERTICES_PER_UNIT = 1_000.0
+_METERS_PER_DEGREE = 111_320.0
 
-    @property
-    def limit(self) -> int:
-        return self._limit
+
+def estimate_sits_row_costs(
+    gdf: NormalizedGeoDataFrame,
+    satellite: AbstractSatellite,
+    subsampling_max_pixels: float,
+    start_date_column_name: str = "start_date",
+    end_date_column_name: str = "end_date",
+) -> np.ndarray:
+    """
+    Estimate the relative Earth Engine cost of each SITS request row.
+
+    The cost grows with the date span, with the number of pixels reduced
+    (geometry area over ``satellite.pixelSize`` squared, after
+    ``subsampling_max_pixels``) and with the vertex count shipped in the
+    request. One unit is a single pixel sampled over a year, so with the
+    default ``SITS_CHUNKSIZE`` a chunk holds as many one-year points as a
+    fixed-size chunk would.
+
+    Parameters
+    ----------
+    gdf : NormalizedGeoDataFrame
+        Prepared request rows. Rows in a projected CRS are priced on their
+        EPSG:4326 footprint.
+    satellite : AbstractSatellite
+        Satellite configuration object.
+    subsampling_max_pixels : float
+        Maximum pixels for sampling: >1 = absolute count, ≤1 = fraction of area.
+    start_date_column_name : str, optional
+        Name of the start date column, by default "start_date".
+    end_date_column_name : str, optional
+        Name of the end date column, by default "end_date".
+
+    Returns
+    -------
+    np.ndarray
+        Float cost per row, in the order of ``gdf``.
+    """
+    geometries = reproject_geometries(shapely_geometry_array(gdf), get_crs(gdf))
+    span = pl.col(end_date_column_name).cast(pl.Date) - pl.col(start_date_column_name).cast(pl.Date)
+    days = gdf.select(span.dt.total_days().clip(lower_bound=1)).to_series().to_numpy().astype(np.float64)
+
+    latitudes = shapely.get_y(shapely.centroid(geometries))
+    meters_per_degree_sq = _METERS_PER_DEGREE**2 * np.cos(np.radians(latitudes))
+    pixel_size = max(satellite.pixelSize, 1)
+    pixels = np.maximum(shapely.area(geometries) * meters_per_degree_sq / pixel_size**2, 1.0)
+    if subsampling_max_pixels > 1:
+        pixels = np.minimum(pixels, subsampling_max_pixels)
+    else:
+        pixels = np.maximum(pixels * subsampling_max_pixels, 1.0)
+    vertices = np.maximum(shapely.get_num_coordinates(geometries), 1)
+
+    # Only pixels and vertices beyond the first add cost, so a point is exactly one unit per year.
+    return (
+        (days / _COST_REFERENCE_DAYS)
+        * (1.0 + (pixels - 1.0) / _COST_PIXELS_PER_UNIT)
+        * (1.0 + (vertices - 1) / _COST_VERTICES_PER_UNIT)
+    )
+
+
+def plan_sits_chunks(costs: np.ndarray, budget: float, max_rows: int) -> list[list[int]]:
+    """
+    Pack consecutive rows into chunks whose summed cost stays within ``budget``.
+
+    Row order is kept, so the spatial clustering from
+    ``sanitize_and_prepare_input_gdf`` carries over to the chunks. A row
+    costlier than the budget gets a chunk of its own.
+
+    Parameters
+    ----------
+    costs : np.ndarray
+        Per-row cost, e.g. from ``estimate_sits_row_costs``.
+    budget : float
+        Maximum summed cost per chunk.
+    max_rows : int
+        Maximum rows per chunk regardless of cost.
+
+    Returns
+    -------
+    list[list[int]]
+        Row positions of each chunk.
+    """
+    chunks: list[list[int]] = []
+    current: list[int] = []
+    current_cost = 0.0
+    for pos, cost in enumerate(costs.tolist()):
+        if current and (current_cost + cost > budget or len(current) >= max_rows):
+            chunks.append(current)
+            current, current_cost = [], 0.0
+        current.append(pos)
+        current_cost += cost
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class _DownloadShard:
+    """Download lane of one Earth Engine account: its own limiter, URL window and HTTP session."""
+
+    def __init__(self, account: EEServiceAccount | None, max_parallel_downloads: int, url_prefetch: int) -> None:
+        self.account = account
+        # Shared with every other download call using the same endpoint and credentials.
+        if account is None:
+            self.semaphore = get_concurrency_controller(HIGH_VOLUME_ENDPOINT, "default", max_parallel_downloads)
+        else:
+            account_id = getattr(account.credentials, "service_account_email", None) or account.project
+            self.semaphore = get_concurrency_controller(account.api_base_url, account_id, max_parallel_downloads)
+        self.url_semaphore = asyncio.Semaphore(ASYNC_MAX_URL_WORKERS)
+        self.url_queue: asyncio.Queue[tuple[int, NormalizedGeoDataFrame, str | BaseException] | None] = asyncio.Queue(
+            maxsize=url_prefetch
+        )
+        self.max_parallel_downloads = max_parallel_downloads
+        self.session: aiohttp.ClientSession | None = None
 
 
 def _is_429(exc: BaseException) -> bool:
@@ -501,6 +899,63 @@ def _is_429(exc: BaseException) -> bool:
     return False
 
 
+class _RunManifest:
+    """Buffers the chunk progress of one download run and writes it to the cache manifest in batches."""
+
+    def __init__(self, engine: CacheEngine, run_hash: str, states: dict[int, str]) -> None:
+        self.engine = engine
+        self.run_hash = run_hash
+        self.states = dict(states)
+        self._lock = threading.Lock()
+        self._pending_states: dict[int, tuple[str, str | None]] = {}
+        self._pending_row_chunks: dict[int, int] = {}
+        self._pending_row_jobs: dict[int, int] = {}
+
+    def mark(self, chunk_id: int, state: str, error: str | None = None) -> None:
+        with self._lock:
+            self.states[chunk_id] = state
+            self._pending_states[chunk_id] = (state, error)
+
+    def assign(self, chunk_id: int, positions: list[int]) -> None:
+        with self._lock:
+            self._pending_row_chunks.update(dict.fromkeys(positions, chunk_id))
+
+    def record_jobs(self, row_jobs: dict[int, int]) -> None:
+        with self._lock:
+            self._pending_row_jobs.update(row_jobs)
+
+    def flush(self) -> None:
+        with self._lock:
+            states, self._pending_states = self._pending_states, {}
+            row_chunks, self._pending_row_chunks = self._pending_row_chunks, {}
+            row_jobs, self._pending_row_jobs = self._pending_row_jobs, {}
+        try:
+            save_sits_run_progress(self.engine, self.run_hash, states, row_chunks, row_jobs)
+        except Exception:
+            # Losing progress only means re-downloading those chunks on resume.
+            logger.warning("Could not update run manifest %s.", self.run_hash, exc_info=True)
+
+    @property
+    def complete(self) -> bool:
+        return all(state in ("stored", "split") for state in self.states.values())
+
+
+_OVERSIZED_CHUNK_MESSAGES = ("memory limit exceeded", "computation timed out", "request payload size exceeds")
+
+
+class _ChunkReadTimeout(TimeoutError):
+    """The total download timeout ran out after Earth Engine accepted the connection."""
+
+
+def _is_oversized_chunk(exc: BaseException) -> bool:
+    # Connect and socket timeouts (aiohttp.ServerTimeoutError) are network
+    # stalls, so they are retried like any other transient error.
+    if isinstance(exc, _ChunkReadTimeout):
+        return True
+    msg = str(exc).lower()
+    return any(marker in msg for marker in _OVERSIZED_CHUNK_MESSAGES)
+
+
 def _store_chunk(
     engine: CacheEngine,
     chunk_pl: pl.DataFrame,
@@ -511,9 +966,9 @@ def _store_chunk(
     original_index_col: str,
     start_date_col: str,
     end_date_col: str,
-) -> None:
+) -> dict[Any, int]:
     if chunk_pl.is_empty():
-        return
+        return {}
 
     rename_map = {
         column: (
@@ -531,22 +986,21 @@ def _store_chunk(
     if original_index_col not in prepared_pl.columns:
         raise KeyError(f"Chunk is missing the expected {original_index_col!r} column.")
 
-    for original_index in prepared_pl.get_column(original_index_col).unique(maintain_order=True).to_list():
-        feat_pl = prepared_pl.filter(pl.col(original_index_col) == original_index)
-        matches = _filter_normalized_geo_frame(sub_gdf, pl.col(original_index_col) == pl.lit(original_index))
-        if matches.height == 0:
-            raise KeyError(f"Could not match chunk row for {original_index_col}={original_index!r}.")
-        row = matches.row(0, named=True)
-        store_sits_polars(
-            engine,
-            feat_pl,
-            geometry_value_to_shapely(cast(bytes | bytearray | memoryview, row["geometry"])),
-            _as_date_str(row[start_date_col]),
-            _as_date_str(row[end_date_col]),
-            satellite,
-            reducers,
-            subsampling_max_pixels,
-        )
+    features = sub_gdf.select(
+        original_index_col,
+        "geometry",
+        pl.col(start_date_col).alias("start_date"),
+        pl.col(end_date_col).alias("end_date"),
+    )
+    return store_sits_batch_polars(
+        engine,
+        prepared_pl,
+        features,
+        original_index_col,
+        satellite,
+        reducers,
+        subsampling_max_pixels,
+    )
 
 
 async def download_multiple_sits_async(  # noqa: C901
@@ -562,6 +1016,12 @@ async def download_multiple_sits_async(  # noqa: C901
     max_parallel_downloads: int = ASYNC_MAX_PARALLEL_DOWNLOADS,
     max_retries_per_chunk: int = ASYNC_MAX_RETRIES_PER_CHUNK,
     force_redownload: bool = False,
+    service_accounts: Sequence[EEServiceAccount] | None = None,
+    adaptive_chunks: bool = SITS_ADAPTIVE_CHUNKS,
+    manifest: bool = SITS_RUN_MANIFESTS,
+    retry_failed_only: bool = False,
+    simplify_tolerance: float = SITS_SIMPLIFY_TOLERANCE,
+    coordinate_precision: float = SITS_COORDINATE_PRECISION,
 ) -> pl.DataFrame:
     if len(gdf) == 0:
         return pl.DataFrame()
@@ -573,6 +1033,8 @@ async def download_multiple_sits_async(  # noqa: C901
         crs=crs,
         start_date_column_name=start_date_column_name,
         end_date_column_name=end_date_column_name,
+        simplify_tolerance=simplify_tolerance,
+        coordinate_precision=coordinate_precision,
     )
 
     if prepared_gdf.height == 0:
@@ -582,80 +1044,143 @@ async def download_multiple_sits_async(  # noqa: C901
     if _engine is None:
         raise RuntimeError("Cache not initialized. Call init_cache() before using download_multiple_sits_async.")
 
-    cached_items: list[tuple[list[int], Any, str, str]] = []
-    uncached_positions: list[int] = []
+    # Fully cached prepared_gdf rows and the jobs covering them.
+    cached_jobs: dict[int, list[int]] = {}
 
-    if not force_redownload:
-        batch_coverage = fetch_sits_batch_coverage(
-            _engine,
-            prepared_gdf,
+    run_manifest: _RunManifest | None = None
+    loaded_manifest = None
+    if manifest:
+        run_hash = compute_sits_run_hash(
+            create_gdf_hash(prepared_gdf, start_date_column_name, end_date_column_name, crs),
             satellite,
             reducers,
             subsampling_max_pixels,
-            start_date_column_name,
-            end_date_column_name,
-            crs,
+            original_index_column_name,
+        )
+        if force_redownload:
+            delete_sits_run_manifest(_engine, run_hash)
+        else:
+            loaded_manifest = load_sits_run_manifest(_engine, run_hash)
+
+    # Chunk positions index prepared_gdf rows; chunk ids are stable across resumes of the same run.
+    chunk_positions: list[list[int]]
+    if loaded_manifest is not None:
+        # Resume: rows planned as cached or stored by an earlier attempt come straight from their cache jobs,
+        # without re-running coverage resolution or chunk planning.
+        chunk_states, manifest_rows = loaded_manifest
+        stored = [cid for cid, state in chunk_states.items() if state == "stored"]
+        done_rows = (
+            manifest_rows
+            .filter(pl.col("job_id").is_not_null() & (pl.col("chunk_id").is_null() | pl.col("chunk_id").is_in(stored)))
+            .group_by("position", maintain_order=True)
+            .agg("job_id")
         )
-        for pos in range(prepared_gdf.height):
-            coverage = batch_coverage.get(pos)
-            if coverage is not None:
-                job_ids, gaps = coverage
-                if not gaps:
-                    row = prepared_gdf.row(pos, named=True)
-                    cached_items.append((
-                        job_ids,
-                        row[original_index_column_name],
-                        str(row[start_date_column_name])[:10],
-                        str(row[end_date_column_name])[:10],
-                    ))
-                    continue
-            uncached_positions.append(pos)
+        cached_jobs = dict(done_rows.iter_rows())
+        chunk_positions = [[] for _ in range(max(chunk_states, default=-1) + 1)]
+        assigned_rows = manifest_rows.filter(pl.col("chunk_id").is_not_null())
+        for pos, cid in assigned_rows.select("position", "chunk_id").iter_rows():
+            chunk_positions[cid].append(pos)
+        runnable = {"failed"} if retry_failed_only else {"pending", "minted", "downloaded", "failed"}
+        run_chunk_ids = [
+            cid for cid, state in sorted(chunk_states.items()) if state in runnable and chunk_positions[cid]
+        ]
+        run_manifest = _RunManifest(_engine, run_hash, chunk_states)
     else:
-        uncached_positions = list(range(prepared_gdf.height))
-
-    uncached_request_rows = _take_normalized_geo_rows(prepared_gdf, uncached_positions)
-
-    def _finalize_from_cache() -> pl.DataFrame:
-        if not cached_items:
-            return pl.DataFrame()
+        uncached_positions: list[int] = []
+        if not force_redownload:
+            batch_coverage = fetch_sits_batch_coverage(
+                _engine,
+                prepared_gdf,
+                satellite,
+                reducers,
+                subsampling_max_pixels,
+                start_date_column_name,
+                end_date_column_name,
+                crs,
+            )
+            for pos in range(prepared_gdf.height):
+                coverage = batch_coverage.get(pos)
+                if coverage is not None:
+                    job_ids, gaps = coverage
+                    if not gaps:
+                        cached_jobs[pos] = job_ids
+                        continue
+                uncached_positions.append(pos)
+        else:
+            uncached_positions = list(range(prepared_gdf.height))
 
-        all_job_ids = list({jid for jids, _, _, _ in cached_items for jid in jids})
-        cached_data = fetch_sits_by_job_ids(_engine, satellite, all_job_ids)
-
-        pl_frames: list[pl.DataFrame] = []
-        for job_ids, orig_idx, q_start, q_end in cached_items:
-            sub_dfs = [cached_data[jid] for jid in job_ids if jid in cached_data]
-            if not sub_dfs:
-                continue
-            combined = pl.concat(sub_dfs, rechunk=False).unique(subset=["timestamp"], maintain_order=True)
-            ts_start = pd.Timestamp(q_start).to_pydatetime()
-            ts_end = (pd.Timestamp(q_end) + pd.Timedelta(days=1)).to_pydatetime()
-            filtered = combined.filter(
-                (pl.col("timestamp") >= pl.lit(ts_start)) & (pl.col("timestamp") < pl.lit(ts_end))
+        uncached_request_rows = _take_normalized_geo_rows(prepared_gdf, uncached_positions)
+        if adaptive_chunks:
+            row_costs = estimate_sits_row_costs(
+                uncached_request_rows,
+                satellite,
+                subsampling_max_pixels,
+                start_date_column_name,
+                end_date_column_name,
             )
-            if not filtered.is_empty():
-                pl_frames.append(filtered.with_columns(pl.lit(orig_idx).alias(original_index_column_name)))
+            planned = plan_sits_chunks(row_costs, float(chunksize), max(chunksize, SITS_MAX_CHUNK_ROWS))
+        else:
+            planned = [
+                list(range(start, min(start + chunksize, uncached_request_rows.height)))
+                for start in range(0, uncached_request_rows.height, chunksize)
+            ]
+        chunk_positions = [[uncached_positions[i] for i in chunk] for chunk in planned]
+        run_chunk_ids = list(range(len(chunk_positions)))
+        if chunk_positions and (simplify_tolerance > 0 or coordinate_precision > 0):
+            row_bytes = prepared_gdf.get_column("geometry").bin.size().to_numpy()
+            chunk_bytes = [int(row_bytes[chunk].sum()) for chunk in chunk_positions]
+            logger.info(
+                "Simplified geometry payload: %.0f bytes per chunk on average, %d at most, over %d chunks.",
+                sum(chunk_bytes) / len(chunk_bytes),
+                max(chunk_bytes),
+                len(chunk_bytes),
+            )
+        if manifest and chunk_positions:
+            create_sits_run_manifest(_engine, run_hash, chunk_positions, cached_jobs)
+            run_manifest = _RunManifest(_engine, run_hash, dict.fromkeys(run_chunk_ids, "pending"))
 
-        if not pl_frames:
+    def _finalize_from_cache() -> pl.DataFrame:
+        if not cached_jobs:
             return pl.DataFrame()
 
-        return pl.concat(pl_frames, rechunk=False).sort([original_index_column_name, "timestamp"])
+        positions = pl.Series(list(cached_jobs), dtype=pl.Int64)
+        requests = pl.DataFrame([
+            prepared_gdf.get_column(col).gather(positions)
+            for col in (original_index_column_name, start_date_column_name, end_date_column_name)
+        ]).with_columns(pl.Series("job_ids", list(cached_jobs.values()), dtype=pl.List(pl.Int64)))
+        return fetch_sits_by_requests(
+            _engine,
+            satellite,
+            requests,
+            original_index_column_name,
+            start_date_column_name,
+            end_date_column_name,
+        )
 
-    if uncached_request_rows.height == 0:
+    if not run_chunk_ids:
+        if run_manifest is not None and run_manifest.complete:
+            delete_sits_run_manifest(_engine, run_manifest.run_hash)
         return _finalize_from_cache()
 
-    num_chunks = (uncached_request_rows.height + chunksize - 1) // chunksize
+    num_chunks = len(run_chunk_ids)
 
     selectors = build_selectors(satellite, reducers)
-    semaphore = _AdaptiveSemaphore(
-        initial=min(ASYNC_AIMD_INITIAL_DOWNLOADS, max_parallel_downloads),
-        minimum=1,
-        maximum=max_parallel_downloads,
-        success_stride=ASYNC_AIMD_SUCCESS_STRIDE,
-    )
-    url_semaphore = asyncio.Semaphore(ASYNC_MAX_URL_WORKERS)
+    csv_schema = build_csv_schema(satellite, reducers)
+    if service_accounts is None and ASYNC_SHARD_SERVICE_ACCOUNTS:
+        service_accounts = load_service_accounts()
+    # One shard per service account, each with its own quota; otherwise a single shard on the global EE session.
+    url_prefetch = ASYNC_URL_PREFETCH
+    shards = [_DownloadShard(account, max_parallel_downloads, url_prefetch) for account in (service_accounts or [None])]
     loop = asyncio.get_running_loop()
-    executor = ThreadPoolExecutor(max_workers=ASYNC_MAX_URL_WORKERS, thread_name_prefix="agrigee_gee")
+    executor = ThreadPoolExecutor(
+        max_workers=ASYNC_MAX_URL_WORKERS * len(shards),
+        thread_name_prefix="agrigee_gee",
+    )
+    # Each streaming decode holds a thread for its whole download; keep them off the default executor.
+    decode_executor = ThreadPoolExecutor(
+        max_workers=max_parallel_downloads * len(shards),
+        thread_name_prefix="agrigee_csv",
+    )
     _is_tty = hasattr(sys.stderr, "isatty") and sys.stderr.isatty()
     pbar = tqdm(
         total=num_chunks,
@@ -667,23 +1192,59 @@ async def download_multiple_sits_async(  # noqa: C901
     )
 
     stats: dict[str, int] = {
-        "cache": len(cached_items),
+        "cache": len(cached_jobs),
         "done": 0,
         "ok": 0,
         "err": 0,
         "retry": 0,
+        "split": 0,
     }
 
+    # Stage 1: mint download URLs ahead of the download slots, at most url_prefetch ready per shard.
+    # Shards pull chunk ids from one shared queue, so faster accounts take more of the work. Chunks split
+    # after a timeout re-enter the queue, so minters run until every chunk has finished.
+    mint_pending: asyncio.Queue[int | None] = asyncio.Queue()
+    for cid in run_chunk_ids:
+        mint_pending.put_nowait(cid)
+    num_minters = ASYNC_MAX_URL_WORKERS * len(shards)
+    unfinished = num_chunks
+    stage_wait: dict[str, float] = {"mint_blocked": 0.0, "download_starved": 0.0}
+
     def _update_postfix() -> None:
+        limits = "/".join(str(shard.semaphore.limit) for shard in shards)
+        ready = sum(shard.url_queue.qsize() for shard in shards)
         pbar.set_postfix_str(
-            f"d:{stats['done']} ok:{stats['ok']} e:{stats['err']} r:{stats['retry']} c:{stats['cache']} lim:{semaphore.limit}",
+            f"d:{stats['done']} ok:{stats['ok']} e:{stats['err']} r:{stats['retry']} s:{stats['split']} "
+            f"c:{stats['cache']} "
+            f"lim:{limits} m:{mint_pending.qsize()} u:{ready}/{url_prefetch * len(shards)}",
             refresh=False,
         )
 
     _update_postfix()
 
     _non_band_raw = {"00_indexnum", "01_timestamp", "99_validPixelsCount"}
-    store_queue: asyncio.Queue[tuple[pl.DataFrame, NormalizedGeoDataFrame] | None] = asyncio.Queue()
+    store_queue: asyncio.Queue[tuple[int, pl.DataFrame, NormalizedGeoDataFrame] | None] = asyncio.Queue()
+    if run_manifest is not None:
+        position_by_index = dict(
+            zip(prepared_gdf.get_column(original_index_column_name).to_list(), range(prepared_gdf.height), strict=True)
+        )
+
+    def store_and_record(chunk_id: int, chunk_pl: pl.DataFrame, sub_gdf: NormalizedGeoDataFrame) -> None:
+        job_ids = _store_chunk(
+            _engine,
+            chunk_pl,
+            sub_gdf,
+            satellite,
+            reducers,
+            subsampling_max_pixels,
+            original_index_column_name,
+            start_date_column_name,
+            end_date_column_name,
+        )
+        if run_manifest is not None:
+            run_manifest.record_jobs({position_by_index[key]: job_id for key, job_id in job_ids.items()})
+            run_manifest.mark(chunk_id, "stored")
+            run_manifest.flush()
 
     async def store_consumer() -> None:
         loop_ = asyncio.get_running_loop()
@@ -691,47 +1252,69 @@ async def download_multiple_sits_async(  # noqa: C901
             item = await store_queue.get()
             if item is None:
                 break
-            chunk_pl, sub_gdf = item
-            await loop_.run_in_executor(
-                None,
-                _store_chunk,
-                _engine,
-                chunk_pl,
-                sub_gdf,
-                satellite,
-                reducers,
-                subsampling_max_pixels,
-                original_index_column_name,
-                start_date_column_name,
-                end_date_column_name,
-            )
+            await loop_.run_in_executor(None, store_and_record, *item)
 
-    async def fetch_chunk(
-        session: aiohttp.ClientSession,
-        chunk_id: int,
-        sub: NormalizedGeoDataFrame,
-    ) -> pl.DataFrame:
-        def get_url() -> str:
-            expr = build_ee_expression(
-                sub,
-                satellite,
-                reducers,
-                subsampling_max_pixels,
-                original_index_column_name,
-                crs,
-                start_date_column_name,
-                end_date_column_name,
-            )
-            return expr.getDownloadURL(filetype="csv", selectors=selectors, filename=str(chunk_id))
+    def build_expression(sub: NormalizedGeoDataFrame) -> ee.FeatureCollection:
+        return build_ee_expression(
+            sub,
+            satellite,
+            reducers,
+            subsampling_max_pixels,
+            original_index_column_name,
+            crs,
+            start_date_column_name,
+            end_date_column_name,
+        )
 
-        async with url_semaphore:
-            url = await loop.run_in_executor(executor, get_url)
+    async def mint_url(shard: _DownloadShard, chunk_id: int, sub: NormalizedGeoDataFrame) -> str:
+        account = shard.account
+        async with shard.url_semaphore:
+            if account is None:
+                return await loop.run_in_executor(
+                    executor,
+                    lambda: build_expression(sub).getDownloadURL(
+                        filetype="csv", selectors=selectors, filename=str(chunk_id)
+                    ),
+                )
+
+            expression = await loop.run_in_executor(
+                executor,
+                lambda: encode_ee_expression(
+                    sub,
+                    satellite,
+                    reducers,
+                    subsampling_max_pixels,
+                    original_index_column_name,
+                    crs,
+                    start_date_column_name,
+                    end_date_column_name,
+                ),
+            )
+            assert shard.session is not None
+            return await ee_create_table_download_url(shard.session, account, expression, selectors, str(chunk_id))
 
-        async with session.get(url, timeout=aiohttp.ClientTimeout(total=AIOHTTP_TIMEOUT_SECONDS)) as resp:
-            resp.raise_for_status()
-            data = await resp.read()
+    async def fetch_chunk(session: aiohttp.ClientSession, url: str) -> pl.DataFrame:
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=AIOHTTP_TIMEOUT_SECONDS)) as resp:
+                if resp.status >= 400:
+                    # Earth Engine explains failed computations (memory, timeouts) in the body only.
+                    raise aiohttp.ClientResponseError(
+                        resp.request_info,
+                        resp.history,
+                        status=resp.status,
+                        message=(await resp.text())[:500] or (resp.reason or ""),
+                        headers=resp.headers,
+                    )
+                if STREAM_CSV_DECODE:
+                    frame = await read_csv_streaming(resp, csv_schema, decode_executor)
+                else:
+                    frame = pl.read_csv(await resp.read(), schema_overrides=csv_schema)
+        except aiohttp.ServerTimeoutError:
+            raise
+        except TimeoutError as exc:
+            # Only the total timeout is left: the table was still being computed or sent.
+            raise _ChunkReadTimeout(f"Chunk download exceeded {AIOHTTP_TIMEOUT_SECONDS}s") from exc
 
-        frame = pl.read_csv(data)
         if "geo" in frame.columns:
             frame = frame.drop("geo")
         if isinstance(satellite, OpticalSatellite):
@@ -740,42 +1323,131 @@ async def download_multiple_sits_async(  # noqa: C901
                 frame = frame.filter(~pl.all_horizontal(pl.col(c) == 0 for c in band_cols))
         return frame
 
-    async def fetch_with_retry(session: aiohttp.ClientSession, chunk_id: int) -> pl.DataFrame:
-        async with semaphore:
-            start = chunk_id * chunksize
-            positions = list(range(start, min(start + chunksize, uncached_request_rows.height)))
-            sub = _take_normalized_geo_rows(uncached_request_rows, positions)
-            chunk_df: pl.DataFrame = pl.DataFrame()
+    async def url_minter(shard: _DownloadShard) -> None:
+        while (chunk_id := await mint_pending.get()) is not None:
+            sub = _take_normalized_geo_rows(prepared_gdf, chunk_positions[chunk_id])
+            minted: str | BaseException
             try:
-                async for attempt in AsyncRetrying(
-                    stop=stop_after_attempt(max_retries_per_chunk),
-                    wait=wait_random_exponential(multiplier=2, min=4, max=60),
-                ):
-                    if attempt.retry_state.attempt_number > 1:
-                        stats["retry"] += 1
-                        prev_exc = attempt.retry_state.outcome.exception() if attempt.retry_state.outcome else None
-                        if prev_exc is not None and _is_429(prev_exc):
-                            await semaphore.on_rate_limit()
-                        _update_postfix()
-                    with attempt:
-                        chunk_df = await fetch_chunk(session, chunk_id, sub)
-                await semaphore.on_success()
-                stats["ok"] += 1
-            except RetryError:
-                stats["err"] += 1
-                logger.debug("Chunk %d failed after %d attempts.", chunk_id, max_retries_per_chunk, exc_info=True)
-                return pl.DataFrame()
-            except Exception:
-                stats["err"] += 1
-                logger.debug("Chunk %d failed with unexpected error.", chunk_id, exc_info=True)
-                return pl.DataFrame()
+                minted = await mint_url(shard, chunk_id, sub)
+            except Exception as exc:
+                minted = exc
             else:
-                await store_queue.put((chunk_df, sub))
-                return chunk_df
-            finally:
-                stats["done"] += 1
-                _update_postfix()
-                pbar.update(1)
+                if run_manifest is not None:
+                    run_manifest.mark(chunk_id, "minted")
+            t0 = loop.time()
+            await shard.url_queue.put((chunk_id, sub, minted))
+            stage_wait["mint_blocked"] += loop.time() - t0
+
+    async def url_stage(shard: _DownloadShard, num_downloaders: int) -> None:
+        try:
+            await asyncio.gather(*(url_minter(shard) for _ in range(ASYNC_MAX_URL_WORKERS)))
+        finally:
+            for _ in range(num_downloaders):
+                await shard.url_queue.put(None)
+
+    # Stage 2: download chunks whose URL is already minted; retries re-mint a fresh URL.
+    results: list[pl.DataFrame | BaseException] = [pl.DataFrame()] * len(chunk_positions)
+
+    def finish_chunk() -> None:
+        nonlocal unfinished
+        unfinished -= 1
+        if unfinished == 0:
+            for _ in range(num_minters):
+                mint_pending.put_nowait(None)
+
+    def mark_chunk(chunk_id: int, state: str, error: str | None = None) -> None:
+        if run_manifest is not None:
+            run_manifest.mark(chunk_id, state, error)
+
+    def fail_chunk(chunk_id: int, error: BaseException | None) -> None:
+        stats["err"] += 1
+        mark_chunk(chunk_id, "failed", repr(error))
+
+    def split_chunk(chunk_id: int) -> None:
+        nonlocal unfinished
+        positions = chunk_positions[chunk_id]
+        half = len(positions) // 2
+        for part in (positions[:half], positions[half:]):
+            chunk_positions.append(part)
+            results.append(pl.DataFrame())
+            new_id = len(chunk_positions) - 1
+            mark_chunk(new_id, "pending")
+            if run_manifest is not None:
+                run_manifest.assign(new_id, part)
+            mint_pending.put_nowait(new_id)
+        mark_chunk(chunk_id, "split")
+        unfinished += 2
+        stats["split"] += 1
+        # The split chunk still ticks the bar once, followed by its two halves.
+        pbar.total += 2
+
+    async def download_chunk(
+        shard: _DownloadShard,
+        chunk_id: int,
+        sub: NormalizedGeoDataFrame,
+        minted: str | BaseException,
+    ) -> None:
+        prefetched: str | BaseException | None = minted
+
+        async def next_url() -> str:
+            nonlocal prefetched
+            url_or_exc, prefetched = prefetched, None
+            if isinstance(url_or_exc, BaseException):
+                raise url_or_exc
+            return url_or_exc if url_or_exc is not None else await mint_url(shard, chunk_id, sub)
+
+        # Re-sending an oversized chunk only times out again; halve it instead.
+        splittable = sub.height > 1
+        chunk_df: pl.DataFrame = pl.DataFrame()
+        try:
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(max_retries_per_chunk),
+                wait=wait_random_exponential(multiplier=2, min=4, max=60),
+                retry=retry_if_exception(lambda exc: not (splittable and _is_oversized_chunk(exc))),
+            ):
+                if attempt.retry_state.attempt_number > 1:
+                    stats["retry"] += 1
+                    prev_exc = attempt.retry_state.outcome.exception() if attempt.retry_state.outcome else None
+                    if prev_exc is not None and _is_429(prev_exc):
+                        await shard.semaphore.on_rate_limit()
+                    _update_postfix()
+                with attempt:
+                    assert shard.session is not None
+                    url = await next_url()
+                    t0 = loop.time()
+                    chunk_df = await fetch_chunk(shard.session, url)
+            await shard.semaphore.on_success(loop.time() - t0)
+            stats["ok"] += 1
+        except RetryError as exc:
+            fail_chunk(chunk_id, exc.last_attempt.exception())
+            logger.debug("Chunk %d failed after %d attempts.", chunk_id, max_retries_per_chunk, exc_info=True)
+        except Exception as exc:
+            if splittable and _is_oversized_chunk(exc):
+                logger.debug("Chunk %d (%d rows) is too heavy, splitting it: %s", chunk_id, sub.height, exc)
+                split_chunk(chunk_id)
+            else:
+                fail_chunk(chunk_id, exc)
+                logger.debug("Chunk %d failed with unexpected error.", chunk_id, exc_info=True)
+        else:
+            mark_chunk(chunk_id, "downloaded")
+            await store_queue.put((chunk_id, chunk_df, sub))
+            results[chunk_id] = chunk_df
+        finally:
+            stats["done"] += 1
+            _update_postfix()
+            pbar.update(1)
+            finish_chunk()
+
+    async def downloader(shard: _DownloadShard) -> None:
+        while True:
+            t0 = loop.time()
+            item = await shard.url_queue.get()
+            stage_wait["download_starved"] += loop.time() - t0
+            if item is None:
+                return
+            # Take a slot only once there is work: the budget is shared with other download calls.
+            async with shard.semaphore:
+                await download_chunk(shard, *item)
 
     def _cancel_all() -> None:
         logger.warning("Download interrupted. Exiting.")
@@ -789,19 +1461,47 @@ async def download_multiple_sits_async(  # noqa: C901
     except (NotImplementedError, ValueError, RuntimeError):
         pass
 
-    connector = aiohttp.TCPConnector(limit=max(max_parallel_downloads, AIOHTTP_CONNECTOR_LIMIT))
     consumer_task = asyncio.create_task(store_consumer())
-    results: list[pl.DataFrame | BaseException] = []
+    num_downloaders = min(max_parallel_downloads, num_chunks)
     try:
-        async with aiohttp.ClientSession(connector=connector) as session:
-            tasks = [asyncio.create_task(fetch_with_retry(session, cid)) for cid in range(num_chunks)]
-            results = cast(list[pl.DataFrame | BaseException], await asyncio.gather(*tasks, return_exceptions=True))
+        async with contextlib.AsyncExitStack() as stack:
+            for shard in shards:
+                connector = aiohttp.TCPConnector(limit=max(max_parallel_downloads, AIOHTTP_CONNECTOR_LIMIT))
+                shard.session = await stack.enter_async_context(aiohttp.ClientSession(connector=connector))
+            await asyncio.gather(
+                *(
+                    stage
+                    for shard in shards
+                    for stage in (
+                        url_stage(shard, num_downloaders),
+                        *(downloader(shard) for _ in range(num_downloaders)),
+                    )
+                )
+            )
     finally:
+        logger.debug(
+            "SITS pipeline: URL minters blocked on a full prefetch window for %.1fs; "
+            "download slots waited %.1fs for a minted URL.",
+            stage_wait["mint_blocked"],
+            stage_wait["download_starved"],
+        )
         await store_queue.put(None)
         try:
             await consumer_task
         finally:
+            if run_manifest is not None:
+                await loop.run_in_executor(None, run_manifest.flush)
+                if run_manifest.complete:
+                    delete_sits_run_manifest(_engine, run_manifest.run_hash)
+                else:
+                    logger.info(
+                        "Run manifest %s kept for resuming: %d chunk(s) not stored.",
+                        run_manifest.run_hash,
+                        sum(state not in ("stored", "split") for state in run_manifest.states.values()),
+                    )
+            save_concurrency_state()
             executor.shutdown(wait=False, cancel_futures=True)
+            decode_executor.shutdown(wait=False, cancel_futures=True)
             if _signals_registered:
                 loop.remove_signal_handler(signal.SIGINT)
                 loop.remove_signal_handler(signal.SIGTERM)
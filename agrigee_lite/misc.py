@@ -5,10 +5,11 @@ from pathlib import Path
 from typing import cast
 
 import geopandas as gpd
-import h3
 import numpy as np
 import pandas as pd
 import polars as pl
+import shapely
+from h3.api import basic_int as h3_int
 from shapely.geometry import MultiPolygon, Point, Polygon
 from tqdm.auto import tqdm
 
@@ -17,12 +18,20 @@ from agrigee_lite._geo_compat import (
     get_crs,
     iter_shapely_geometries,
     normalize_geodataframe,
+    reproject_geometries,
     restore_geodataframe_type,
+    shapely_geometry_array,
     wrap_geopolars_frame,
 )
 
 
-def simplify_gdf(gdf: GeoDataFrameLike, tol: float = 0.001, crs: str | None = None) -> GeoDataFrameLike:
+def simplify_gdf(
+    gdf: GeoDataFrameLike,
+    tol: float = 0.001,
+    crs: str | None = None,
+    grid_size: float | None = None,
+    units_crs: str | None = None,
+) -> GeoDataFrameLike:
     """
     Simplify geometries in a compatible geo frame.
 
@@ -31,21 +40,123 @@ def simplify_gdf(gdf: GeoDataFrameLike, tol: float = 0.001, crs: str | None = No
     gdf : geopandas.GeoDataFrame or geopolars.GeoDataFrame
         GeoDataFrame containing geometries (Polygon, MultiPolygon, or Point).
     tol : float, optional
-        Tolerance for simplification (default is 0.001).
+        Tolerance for simplification, in CRS units (default is 0.001).
+        Non-positive values skip simplification.
+    grid_size : float, optional
+        Precision grid the coordinates are snapped to after simplification,
+        in CRS units. ``None`` keeps full precision.
+    units_crs : str, optional
+        CRS whose units ``tol`` and ``grid_size`` are given in, e.g.
+        ``"EPSG:4326"`` for degrees. Geometries are simplified there and
+        reprojected back to the frame's CRS. ``None`` uses the frame's CRS.
 
     Returns
     -------
     geopandas.GeoDataFrame or geopolars.GeoDataFrame
-        GeoDataFrame with unchanged geometries for now.
+        GeoDataFrame with simplified geometries.
 
     Notes
     -----
-    TODO: reintroduce geometry simplification here once GeoPolars exposes a
-    stable native simplify API.
+    Simplification preserves topology, so polygons stay valid and keep their
+    holes. A geometry that would collapse to empty on the precision grid is
+    kept as it was.
     """
-    _ = tol
     normalized = normalize_geodataframe(gdf, crs=crs)
-    return restore_geodataframe_type(gdf, normalized, preserve_index=True)
+    geometries = shapely_geometry_array(normalized)
+    if not tol > 0 and not grid_size:
+        return restore_geodataframe_type(gdf, normalized, preserve_index=True)
+
+    source_crs = get_crs(normalized)
+    simplified = geometries
+    if units_crs is not None:
+        simplified = reproject_geometries(simplified, source_crs, units_crs)
+    if tol > 0:
+        simplified = shapely.simplify(simplified, tol, preserve_topology=True)
+    if grid_size:
+        simplified = shapely.set_precision(simplified, grid_size)
+    if units_crs is not None and source_crs is not None:
+        simplified = reproject_geometries(simplified, units_crs, str(source_crs))
+
+    simplified = np.where(shapely.is_empty(simplified) & ~shapely.is_empty(geometries), geometries, simplified)
+    out = wrap_geopolars_frame(
+        normalized.with_columns(pl.Series("geometry", shapely.to_wkb(simplified), dtype=pl.Binary)),
+        crs=get_crs(normalized),
+    )
+    return restore_geodataframe_type(gdf, out, preserve_index=True)
+
+
+def _h3_parent_cells(cells: np.ndarray, resolution: int) -> np.ndarray:
+    """Return the parents of integer H3 cells at ``resolution`` using bit arithmetic."""
+    # Digits below the parent resolution are set to 7 (unused) and the 4-bit
+    # resolution field (bits 52-55) is replaced, exactly as h3.cell_to_parent does.
+    unused_digits = np.uint64((1 << ((15 - resolution) * 3)) - 1)
+    resolution_bits = np.uint64(0xF << 52)
+    return ((cells | unused_digits) & ~resolution_bits) | np.uint64(resolution << 52)
+
+
+def compute_h3_cells(
+    x: np.ndarray,
+    y: np.ndarray,
+    coarse_resolution: int = 5,
+    fine_resolution: int = 8,
+) -> tuple[pl.Series, pl.Series]:
+    """
+    Map longitude/latitude arrays to coarse and fine H3 cells.
+
+    Duplicated coordinates are indexed once, and coarse parents are derived
+    from the fine cells with NumPy bit operations instead of one
+    ``h3.cell_to_parent`` call per row.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Longitudes (EPSG:4326).
+    y : numpy.ndarray
+        Latitudes (EPSG:4326).
+    coarse_resolution : int, optional
+        H3 resolution of the coarse cells (default 5).
+    fine_resolution : int, optional
+        H3 resolution of the fine cells (default 8).
+
+    Returns
+    -------
+    tuple of (polars.Series, polars.Series)
+        Coarse and fine H3 cell strings, aligned with the input arrays.
+
+    Raises
+    ------
+    ValueError
+        If either resolution is outside 0..15 or ``coarse_resolution`` is finer
+        than ``fine_resolution``.
+    """
+    if not 0 <= coarse_resolution <= fine_resolution <= 15:
+        raise ValueError(  # noqa: TRY003
+            "H3 resolutions must satisfy 0 <= coarse_resolution <= fine_resolution <= 15, "
+            f"got coarse_resolution={coarse_resolution}, fine_resolution={fine_resolution}"
+        )
+    coords = pl.DataFrame({"x": np.asarray(x, dtype=np.float64), "y": np.asarray(y, dtype=np.float64)})
+    inverse: pl.Series | None = None
+    if coords.n_unique() < coords.height:
+        unique_coords = coords.unique(maintain_order=True).with_row_index("_cell_idx")
+        inverse = coords.join(unique_coords, on=["x", "y"], how="left", maintain_order="left").get_column("_cell_idx")
+        coords = unique_coords
+
+    fine_cells = np.fromiter(
+        (
+            h3_int.latlng_to_cell(lat, lng, fine_resolution)
+            for lng, lat in zip(coords.get_column("x").to_list(), coords.get_column("y").to_list(), strict=True)
+        ),
+        dtype=np.uint64,
+        count=coords.height,
+    )
+    coarse_cells = _h3_parent_cells(fine_cells, coarse_resolution)
+
+    fine = pl.Series("h3_fine", [format(cell, "x") for cell in fine_cells.tolist()], dtype=pl.String)
+    coarse = pl.Series("h3_coarse", [format(cell, "x") for cell in coarse_cells.tolist()], dtype=pl.String)
+    if inverse is not None:
+        fine = fine.gather(inverse)
+        coarse = coarse.gather(inverse)
+    return coarse, fine
 
 
 def h3_clustering(
@@ -83,34 +194,17 @@ def h3_clustering(
         for now.
     """
     normalized = normalize_geodataframe(gdf, crs=crs)
-    geometries = iter_shapely_geometries(normalized)
-
-    fine_cells: list[str] = []
-    coarse_cells: list[str] = []
-
-    for geometry in tqdm(geometries, desc="H3 cells", leave=True):
-        centroid = cast(Point, geometry if geometry.geom_type == "Point" else geometry.centroid)
-        fine_cell = h3.latlng_to_cell(centroid.y, centroid.x, fine_resolution)
-        fine_cells.append(fine_cell)
-        coarse_cells.append(h3.cell_to_parent(fine_cell, coarse_resolution))
+    centroids = shapely.centroid(shapely_geometry_array(normalized))
+    coarse_cells, fine_cells = compute_h3_cells(
+        shapely.get_x(centroids), shapely.get_y(centroids), coarse_resolution, fine_resolution
+    )
 
     frame = normalized.with_row_index("_row_idx")
-    frame = frame.with_columns(
-        pl.Series("_h3_fine", fine_cells),
-        pl.Series("_h3_coarse", coarse_cells),
-    )
+    frame = frame.with_columns(fine_cells.alias("_h3_fine"), coarse_cells.alias("_h3_coarse"))
     frame = frame.sort(["_h3_coarse", "_h3_fine", "_row_idx"])
-
-    cluster_ids: list[int] = []
-    cluster_by_cell: dict[str, int] = {}
-    for coarse_cell in frame.get_column("_h3_coarse").to_list():
-        cluster_ids.append(cluster_by_cell.setdefault(str(coarse_cell), len(cluster_by_cell)))
-
-    frame = frame.with_columns(pl.Series("cluster_id", cluster_ids))
+    frame = frame.with_columns((pl.col("_h3_coarse").rank("dense") - 1).cast(pl.Int64).alias("cluster_id"))
     frame = frame.rename({"_h3_coarse": "h3_coarse", "_h3_fine": "h3_fine"}).drop("_row_idx")
 
-    # TODO: reintroduce geometry simplification here once GeoPolars exposes a
-    # stable native simplify API.
     clustered = wrap_geopolars_frame(frame, crs=get_crs(normalized))
     return restore_geodataframe_type(gdf, clustered)
 
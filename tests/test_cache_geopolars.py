@@ -1,17 +1,41 @@
+import importlib
+import threading
+import uuid
 from datetime import datetime
+from types import SimpleNamespace
 
 import duckdb
 import geopandas as gpd
 import geopolars as gpl
 import pandas as pd
 import polars as pl
+import pytest
 from shapely.geometry import Point, Polygon
 
 from agrigee_lite.cache.backend import (
+    _compute_gaps,
+    _compute_geom_hash,
+    _configured_band_storage,
+    _copy_rows_pg,
     _ensure_sat_table_duck,
     _ensure_schema_duck,
     _get_band_columns,
+    _parse_band_storage,
+    _pg_env_set,
+    compact_cache,
+    create_sits_run_manifest,
+    delete_sits_run_manifest,
+    evict_cache,
     fetch_sits_batch_coverage,
+    fetch_sits_by_job_ids,
+    fetch_sits_by_requests,
+    fetch_sits_with_gaps,
+    geometry_index_stats,
+    init_cache,
+    load_sits_run_manifest,
+    migrate_observations_to_parquet,
+    save_sits_run_progress,
+    store_sits_batch_polars,
     store_sits_polars,
 )
 from agrigee_lite.get.sits import sanitize_and_prepare_input_gdf
@@ -83,3 +107,699 @@ def test_fetch_sits_batch_coverage_accepts_geopolars_polygons(tmp_path) -> None:
 
     _assert_expected_coverage(conn, prepared, geometry)
     conn.close()
+
+
+def test_fetch_sits_batch_coverage_merges_overlapping_jobs(tmp_path) -> None:
+    conn = _make_duckdb_conn(tmp_path)
+    satellite = Sentinel2(bands={"red"})
+    point = Point(-46.6, -23.55)
+    polygon = Polygon([(-46.61, -23.56), (-46.59, -23.56), (-46.59, -23.54), (-46.61, -23.54)])
+    windows = {
+        "point": [("2024-01-01", "2024-01-10"), ("2024-01-08", "2024-01-15"), ("2024-02-01", "2024-02-10")],
+        "polygon": [("2024-01-05", "2024-01-20"), ("2024-01-21", "2024-01-31")],
+    }
+    job_ids = {
+        (name, window): store_sits_polars(
+            conn,
+            pl.DataFrame({"timestamp": [datetime.fromisoformat(window[0])], "red": [0.25]}),
+            geometry,
+            *window,
+            satellite,
+            None,
+            1_000,
+        )
+        for name, geometry in (("point", point), ("polygon", polygon))
+        for window in windows[name]
+    }
+    requests = [
+        ("point", point, "2023-12-25", "2024-02-20"),
+        ("point", point, "2024-01-11", "2024-01-12"),
+        ("polygon", polygon, "2024-01-01", "2024-01-31"),
+        ("polygon", polygon, "2024-03-01", "2024-03-31"),
+        ("other", Point(-40.0, -20.0), "2024-01-01", "2024-01-31"),
+    ]
+    gdf = gpd.GeoDataFrame(
+        {
+            "start_date": pd.to_datetime([start for _, _, start, _ in requests]),
+            "end_date": pd.to_datetime([end for _, _, _, end in requests]),
+        },
+        geometry=[geometry for _, geometry, _, _ in requests],
+        crs="EPSG:4326",
+    )
+    prepared = sanitize_and_prepare_input_gdf(gdf, satellite, "original_index", crs="EPSG:4326")
+
+    coverage = fetch_sits_batch_coverage(conn, prepared, satellite, None, 1_000, "start_date", "end_date", "EPSG:4326")
+
+    expected = {}
+    for pos, original_index in enumerate(prepared.get_column("original_index").to_list()):
+        name, _, start, end = requests[original_index]
+        overlapping = [window for window in windows.get(name, []) if window[0] <= end and window[1] >= start]
+        if overlapping:
+            expected[pos] = (
+                sorted(job_ids[name, window] for window in overlapping),
+                _compute_gaps(start, end, overlapping),
+            )
+    assert coverage == expected
+    assert sorted(len(gaps) for _, gaps in coverage.values()) == [0, 1, 3]
+    conn.close()
+
+
+def test_store_sits_batch_polars_matches_per_feature_store(tmp_path) -> None:
+    satellite = Sentinel2(bands={"red"})
+    point = Point(-46.6, -23.55)
+    polygon = Polygon([(-46.61, -23.56), (-46.59, -23.56), (-46.59, -23.54), (-46.61, -23.54)])
+    features = pl.DataFrame({
+        "original_index": [0, 1, 2, 3],
+        "geometry": [point.wkb, polygon.wkb, point.wkb, polygon.wkb],
+        "start_date": ["2024-01-01", "2024-01-01", "2024-01-01", "2024-02-01"],
+        "end_date": ["2024-01-10", "2024-01-10", "2024-01-10", "2024-02-10"],
+    })
+    observations = pl.DataFrame({
+        "original_index": [0, 0, 1, 2, 3],
+        "timestamp": [
+            datetime(2024, 1, 2),
+            datetime(2024, 1, 7),
+            datetime(2024, 1, 5),
+            datetime(2024, 1, 3),
+            datetime(2024, 2, 5),
+        ],
+        "red": [0.1, 0.2, 0.3, 0.4, 0.5],
+    })
+
+    conn = _make_duckdb_conn(tmp_path)
+    job_ids = store_sits_batch_polars(conn, observations, features, "original_index", satellite, None, 1_000)
+
+    # Rows 0 and 2 share geometry and dates, so the first one fills the job.
+    assert job_ids[0] == job_ids[2]
+    assert len(set(job_ids.values())) == 3
+    stored = fetch_sits_by_job_ids(conn, satellite, list(job_ids.values()))
+    assert stored[job_ids[0]].get_column("red").to_list() == [0.1, 0.2]
+    assert stored[job_ids[1]].get_column("red").to_list() == [0.3]
+    assert stored[job_ids[3]].get_column("red").to_list() == [0.5]
+
+    geom_rows = conn.execute("SELECT geom_hash, geom_type FROM geometries ORDER BY id").fetchall()
+    assert geom_rows == [(_compute_geom_hash(point), "point"), (_compute_geom_hash(polygon), "polygon")]
+
+    single_job_id = store_sits_polars(
+        conn,
+        observations.filter(pl.col("original_index") == 1).drop("original_index"),
+        polygon,
+        "2024-01-01",
+        "2024-01-10",
+        satellite,
+        None,
+        1_000,
+    )
+    assert single_job_id == job_ids[1]
+    assert store_sits_batch_polars(conn, observations, features, "original_index", satellite, None, 1_000) == job_ids
+    assert conn.execute(f'SELECT COUNT(*) FROM "{satellite.shortName}"').fetchone() == (4,)
+    conn.close()
+
+
+def test_sits_run_manifest_roundtrip(tmp_path) -> None:
+    conn = _make_duckdb_conn(tmp_path)
+    assert load_sits_run_manifest(conn, "run") is None
+
+    create_sits_run_manifest(conn, "run", [[1, 2], [4]], {0: [10, 11], 3: [12]})
+    save_sits_run_progress(conn, "run", {0: ("stored", None), 1: ("failed", "HTTP 500")}, {}, {1: 20, 2: 21})
+    # A split chunk hands its rows to new chunk ids.
+    save_sits_run_progress(conn, "run", {1: ("split", None), 2: ("pending", None)}, {4: 2}, {})
+
+    states, rows = load_sits_run_manifest(conn, "run")
+    assert states == {0: "stored", 1: "split", 2: "pending"}
+    assert rows.sort(["position", "job_id"]).rows() == [
+        (0, None, 10),
+        (0, None, 11),
+        (1, 0, 20),
+        (2, 0, 21),
+        (3, None, 12),
+        (4, 2, None),
+    ]
+
+    delete_sits_run_manifest(conn, "run")
+    assert load_sits_run_manifest(conn, "run") is None
+    conn.close()
+
+
+def test_fetch_sits_by_requests_dedupes_and_windows_in_one_query(tmp_path) -> None:
+    conn = _make_duckdb_conn(tmp_path)
+    satellite = Sentinel2(bands={"red"})
+    point = Point(-46.6, -23.55)
+    first = store_sits_polars(
+        conn,
+        pl.DataFrame({
+            "timestamp": [datetime(2024, 1, 2), datetime(2024, 1, 6), datetime(2024, 1, 10, 23)],
+            "red": [0.1, 0.2, 0.3],
+        }),
+        point,
+        "2024-01-01",
+        "2024-01-10",
+        satellite,
+        None,
+        1_000,
+    )
+    second = store_sits_polars(
+        conn,
+        pl.DataFrame({"timestamp": [datetime(2024, 1, 6), datetime(2024, 1, 12)], "red": [0.9, 0.4]}),
+        point,
+        "2024-01-05",
+        "2024-01-15",
+        satellite,
+        None,
+        1_000,
+    )
+    requests = pl.DataFrame({
+        "original_index": [7, 3],
+        "start_date": [datetime(2024, 1, 2), datetime(2024, 1, 3)],
+        "end_date": [datetime(2024, 1, 12), datetime(2024, 1, 10)],
+        "job_ids": [[second, first], [first]],
+    })
+
+    result = fetch_sits_by_requests(conn, satellite, requests, "original_index")
+
+    # Row 7 takes the overlapping 2024-01-06 value from its first listed job; row 3 keeps its end date inclusive.
+    assert result.columns[0] == "timestamp"
+    assert result.columns[-1] == "original_index"
+    assert result.select("original_index", pl.col("timestamp").dt.day(), "red").rows() == [
+        (3, 6, 0.2),
+        (3, 10, 0.3),
+        (7, 2, 0.1),
+        (7, 6, 0.9),
+        (7, 10, 0.3),
+        (7, 12, 0.4),
+    ]
+    assert fetch_sits_by_requests(conn, satellite, requests.clear(), "original_index").is_empty()
+    conn.close()
+
+
+def test_migrate_observations_to_parquet_keeps_reads_and_takes_new_writes(tmp_path, monkeypatch) -> None:
+    backend = importlib.import_module("agrigee_lite.cache.backend")
+    conn = _make_duckdb_conn(tmp_path)
+    monkeypatch.setattr(backend, "_duck_conn", conn)
+    monkeypatch.setattr(backend, "_duck_observation_root", None)
+    satellite = Sentinel2(bands={"red"})
+    point = Point(-46.6, -23.55)
+    first = store_sits_polars(
+        conn,
+        pl.DataFrame({"timestamp": [datetime(2024, 1, 2), datetime(2024, 1, 6)], "red": [0.1, 0.2]}),
+        point,
+        "2024-01-01",
+        "2024-01-10",
+        satellite,
+        None,
+        1_000,
+    )
+    requests = pl.DataFrame({
+        "original_index": [0],
+        "start_date": [datetime(2024, 1, 1)],
+        "end_date": [datetime(2024, 1, 20)],
+        "job_ids": [[first]],
+    })
+    before = fetch_sits_by_requests(conn, satellite, requests, "original_index")
+
+    assert migrate_observations_to_parquet(tmp_path / "cache.duckdb") == {satellite.shortName: 2}
+
+    sat_dir = tmp_path / "cache_observations" / satellite.shortName
+    assert len(list(sat_dir.glob("h3_coarse=8*/part-*.parquet"))) == 1
+    kind = conn.execute(
+        "SELECT table_type FROM information_schema.tables WHERE table_name = ?", [satellite.shortName]
+    ).fetchone()
+    assert kind == ("VIEW",)
+    assert fetch_sits_by_requests(conn, satellite, requests, "original_index").equals(before)
+
+    # New jobs land as fresh files; storing the same job again adds nothing.
+    second = store_sits_polars(
+        conn,
+        pl.DataFrame({"timestamp": [datetime(2024, 1, 12)], "red": [0.4]}),
+        point,
+        "2024-01-11",
+        "2024-01-20",
+        satellite,
+        None,
+        1_000,
+    )
+    store_sits_polars(
+        conn,
+        pl.DataFrame({"timestamp": [datetime(2024, 1, 12)], "red": [0.4]}),
+        point,
+        "2024-01-11",
+        "2024-01-20",
+        satellite,
+        None,
+        1_000,
+    )
+    assert len(list(sat_dir.glob("h3_coarse=8*/part-*.parquet"))) == 2
+
+    result = fetch_sits_by_requests(
+        conn, satellite, requests.with_columns(job_ids=pl.Series([[first, second]])), "original_index"
+    )
+    assert result.select(pl.col("timestamp").dt.day(), "red").rows() == [(2, 0.1), (6, 0.2), (12, 0.4)]
+    conn.close()
+
+
+def test_parquet_store_never_commits_jobs_without_their_files(tmp_path, monkeypatch) -> None:
+    backend = importlib.import_module("agrigee_lite.cache.backend")
+    conn = _make_duckdb_conn(tmp_path)
+    monkeypatch.setattr(backend, "_duck_conn", conn)
+    monkeypatch.setattr(backend, "_duck_observation_root", None)
+    satellite = Sentinel2(bands={"red"})
+    point = Point(-46.6, -23.55)
+    store_sits_polars(
+        conn,
+        pl.DataFrame({"timestamp": [datetime(2024, 1, 2)], "red": [0.1]}),
+        point,
+        "2024-01-01",
+        "2024-01-10",
+        satellite,
+        None,
+        1_000,
+    )
+    # Files of an interrupted migration are dropped rather than staged twice.
+    sat_dir = tmp_path / "cache_observations" / satellite.shortName
+    (sat_dir / "h3_coarse=1").mkdir(parents=True)
+    (sat_dir / "h3_coarse=1" / "part-1-1-interrupted.parquet").write_bytes(b"")
+    migrate_observations_to_parquet(tmp_path / "cache.duckdb")
+    files = sorted(sat_dir.glob("h3_coarse=*/part-*.parquet"))
+    assert len(files) == 1
+
+    def fail_write(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(backend, "_write_observations_parquet", fail_write)
+    with pytest.raises(OSError, match="disk full"):
+        store_sits_polars(
+            conn,
+            pl.DataFrame({"timestamp": [datetime(2024, 1, 12)], "red": [0.4]}),
+            point,
+            "2024-01-11",
+            "2024-01-20",
+            satellite,
+            None,
+            1_000,
+        )
+    assert conn.execute("SELECT COUNT(*) FROM sits_jobs").fetchone() == (1,)
+
+    # A store killed before its commit leaves files past the last committed job.
+    orphan = files[0].with_name("part-99-99-killed.parquet")
+    orphan.write_bytes(files[0].read_bytes())
+    assert backend._discard_orphaned_observations_duck(conn, tmp_path / "cache_observations") == 1
+    assert sorted(sat_dir.glob("h3_coarse=*/part-*.parquet")) == files
+    conn.close()
+
+
+def test_int16_band_storage_roundtrips_through_store_and_fetch(tmp_path) -> None:
+    conn = duckdb.connect(str(tmp_path / "cache.duckdb"))
+    _ensure_schema_duck(conn)
+    satellite = Sentinel2(bands={"red"})
+    band_cols = _get_band_columns(satellite)
+    _ensure_sat_table_duck(conn, satellite.shortName, band_cols, storage=_parse_band_storage("int16"))
+    # An existing table keeps the storage it was created with.
+    _ensure_sat_table_duck(conn, satellite.shortName, band_cols, storage=_parse_band_storage("float32"))
+    column_type = conn.execute(
+        "SELECT data_type FROM information_schema.columns WHERE table_name = ? AND column_name = 'red'",
+        [satellite.shortName],
+    ).fetchone()
+    assert column_type == ("SMALLINT",)
+
+    # A value the int16 scale cannot hold fails the store instead of being clipped.
+    with pytest.raises(ValueError, match="int16 storage range"):
+        store_sits_polars(
+            conn,
+            pl.DataFrame({"timestamp": [datetime(2024, 1, 8)], "red": [9.0]}),
+            Point(-46.6, -23.55),
+            "2024-01-01",
+            "2024-01-10",
+            satellite,
+            None,
+            1_000,
+        )
+    job_id = store_sits_polars(
+        conn,
+        pl.DataFrame({
+            "timestamp": [datetime(2024, 1, 2), datetime(2024, 1, 6), datetime(2024, 1, 8)],
+            "red": [0.12346, None, 3.2767],
+        }),
+        Point(-46.6, -23.55),
+        "2024-01-01",
+        "2024-01-10",
+        satellite,
+        None,
+        1_000,
+    )
+    requests = pl.DataFrame({
+        "original_index": [0],
+        "start_date": [datetime(2024, 1, 1)],
+        "end_date": [datetime(2024, 1, 10)],
+        "job_ids": [[job_id]],
+    })
+
+    result = fetch_sits_by_requests(conn, satellite, requests, "original_index")
+
+    assert result.schema["red"] == pl.Float64
+    red = result.get_column("red").to_list()
+    assert abs(red[0] - 0.1235) < 1e-9
+    assert red[1] is None
+    assert abs(red[2] - 3.2767) < 1e-9
+    conn.close()
+
+
+def test_global_int16_band_storage_only_covers_reflectance_tables() -> None:
+    assert _configured_band_storage("s2sr", "int16", reflectance=True) == _parse_band_storage("int16")
+    assert _configured_band_storage("s1a", "int16") is None
+    assert _configured_band_storage("copdem", "float32") == _parse_band_storage("float32")
+    # Naming a table is an explicit choice and applies whatever the table holds.
+    assert _configured_band_storage("copdem", "int16,copdem=int16:0.1") == _parse_band_storage("int16:0.1")
+
+
+def test_duck_writer_serializes_writes_without_blocking_reads(tmp_path, monkeypatch) -> None:
+    backend = importlib.import_module("agrigee_lite.cache.backend")
+    conn = _make_duckdb_conn(tmp_path)
+    writer = backend._DuckWriter(conn)
+    monkeypatch.setattr(backend, "_duck_writer", writer)
+    satellite = Sentinel2(bands={"red"})
+
+    def store(lon: float, red: float) -> int | None:
+        return store_sits_polars(
+            conn,
+            pl.DataFrame({"timestamp": [datetime(2024, 1, 2)], "red": [red]}),
+            Point(lon, -23.55),
+            "2024-01-01",
+            "2024-01-10",
+            satellite,
+            None,
+            1_000,
+        )
+
+    first = store(-46.6, 0.1)
+    assert first is not None
+
+    started, release = threading.Event(), threading.Event()
+
+    def slow_write(cursor: duckdb.DuckDBPyConnection) -> None:
+        started.set()
+        release.wait(10)
+
+    blocker = threading.Thread(target=backend._duck_write, args=(conn, slow_write))
+    blocker.start()
+    assert started.wait(10)
+
+    # Reads run on their own cursors while the writer is busy.
+    assert fetch_sits_by_job_ids(conn, satellite, [first])[first]["red"].to_list() == [0.1]
+
+    stored: dict[int, int | None] = {}
+    threads = [
+        threading.Thread(target=lambda i=i: stored.__setitem__(i, store(-46.6 + i / 100, i / 10))) for i in range(1, 4)
+    ]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in [blocker, *threads]:
+        thread.join(timeout=10)
+
+    with pytest.raises(duckdb.CatalogException):
+        backend._duck_write(conn, lambda cursor: cursor.execute("SELECT * FROM missing_table"))
+    writer.close()
+
+    job_ids = {i: job_id for i, job_id in stored.items() if job_id is not None}
+    assert sorted(job_ids) == [1, 2, 3]
+    assert len({first, *job_ids.values()}) == 4
+    fetched = fetch_sits_by_job_ids(conn, satellite, list(job_ids.values()))
+    assert {i: fetched[job_id]["red"].to_list() for i, job_id in job_ids.items()} == {1: [0.1], 2: [0.2], 3: [0.3]}
+    conn.close()
+
+
+class _RecordingCopyCursor:
+    def __init__(self, copies: list[tuple[str, bytes]]) -> None:
+        self.copies = copies
+
+    def copy_expert(self, sql: str, buffer) -> None:
+        self.copies.append((sql, buffer.read()))
+
+    def close(self) -> None:
+        pass
+
+
+def test_copy_rows_pg_streams_one_csv_payload() -> None:
+    copies: list[tuple[str, bytes]] = []
+    driver = SimpleNamespace(cursor=lambda: _RecordingCopyCursor(copies))
+    conn = SimpleNamespace(connection=SimpleNamespace(driver_connection=driver))
+    frame = pl.DataFrame({
+        "job_id": [7, 7, 8],
+        "timestamp": ["2024-01-02 00:00:00", None, "2024-01-06 00:00:00"],
+        "red": [0.1, float("nan"), 1e-7],
+        "note": ["a,b", "", None],
+    })
+
+    _copy_rows_pg(conn, '"s2sr"', frame)
+    _copy_rows_pg(conn, '"s2sr"', frame.clear())
+
+    assert len(copies) == 1
+    sql, payload = copies[0]
+    assert sql == 'COPY "s2sr" ("job_id", "timestamp", "red", "note") FROM STDIN WITH (FORMAT csv)'
+    # Postgres reads an unquoted empty field as NULL and a quoted one as an empty string.
+    assert payload.decode().splitlines() == [
+        '7,2024-01-02 00:00:00,0.1,"a,b"',
+        '7,,,""',
+        "8,2024-01-06 00:00:00,1e-7,",
+    ]
+
+
+def test_store_sits_polars_reuses_geometry_and_job_rows(tmp_path) -> None:
+    conn = _make_duckdb_conn(tmp_path)
+    satellite = Sentinel2(bands={"red"})
+    df = pl.DataFrame({"timestamp": [datetime(2024, 1, 2)], "red": [0.1]})
+    point = Point(-46.6, -23.55)
+
+    first = store_sits_polars(conn, df, point, "2024-01-01", "2024-01-10", satellite, None, 1_000)
+    again = store_sits_polars(conn, df, point, "2024-01-01", "2024-01-10", satellite, None, 1_000)
+    other_window = store_sits_polars(conn, df, point, "2024-01-11", "2024-01-20", satellite, None, 1_000)
+
+    assert again == first
+    assert other_window not in {None, first}
+    counts = conn.execute(
+        f'SELECT (SELECT COUNT(*) FROM geometries), (SELECT COUNT(*) FROM sits_jobs), (SELECT COUNT(*) FROM "{satellite.shortName}")'  # noqa: S608
+    ).fetchone()
+    assert counts == (1, 2, 2)
+    conn.close()
+
+
+def test_fetch_sits_with_gaps_serves_repeated_lookups_from_geometry_index(tmp_path) -> None:
+    conn = _make_duckdb_conn(tmp_path)
+    satellite = Sentinel2(bands={"red"})
+    point = Point(-46.6, -23.55)
+
+    def fetch() -> list[tuple[str, str]]:
+        return fetch_sits_with_gaps(conn, point, "2024-01-01", "2024-01-20", satellite, None, 1_000)[1]
+
+    assert fetch() == [("2024-01-01", "2024-01-20")]
+    store_sits_polars(
+        conn,
+        pl.DataFrame({"timestamp": [datetime(2024, 1, 2)], "red": [0.1]}),
+        point,
+        "2024-01-01",
+        "2024-01-10",
+        satellite,
+        None,
+        1_000,
+    )
+    assert fetch() == [("2024-01-11", "2024-01-20")]
+    assert fetch() == [("2024-01-11", "2024-01-20")]
+    assert geometry_index_stats(conn) == {"hits": 1, "misses": 2, "entries": 1}
+
+    # A store for the same geometry drops its entry, so the next read sees the new job.
+    store_sits_polars(
+        conn,
+        pl.DataFrame({"timestamp": [datetime(2024, 1, 12)], "red": [0.2]}),
+        point,
+        "2024-01-11",
+        "2024-01-20",
+        satellite,
+        None,
+        1_000,
+    )
+    df, gaps = fetch_sits_with_gaps(conn, point, "2024-01-01", "2024-01-20", satellite, None, 1_000)
+    assert gaps == []
+    assert df["red"].to_list() == [0.1, 0.2]
+    assert geometry_index_stats(conn) == {"hits": 1, "misses": 3, "entries": 1}
+    conn.close()
+
+
+def test_compact_cache_merges_overlapping_jobs_and_dedupes_timestamps(tmp_path) -> None:
+    conn = _make_duckdb_conn(tmp_path)
+    satellite = Sentinel2(bands={"red"})
+    point = Point(-46.6, -23.55)
+    other = Point(-47.0, -22.9)
+
+    def store(geometry: Point, start: str, end: str, days: list[int], red: float) -> int:
+        job_id = store_sits_polars(
+            conn,
+            pl.DataFrame({"timestamp": [datetime(2024, 1, d) for d in days], "red": [red] * len(days)}),
+            geometry,
+            start,
+            end,
+            satellite,
+            None,
+            1_000,
+        )
+        assert job_id is not None
+        return job_id
+
+    first = store(point, "2024-01-01", "2024-01-10", [2, 10], 0.1)
+    overlapping = store(point, "2024-01-08", "2024-01-15", [10, 12], 0.2)
+    adjacent = store(point, "2024-01-16", "2024-01-20", [18], 0.3)
+    apart = store(point, "2024-01-25", "2024-01-28", [26], 0.4)
+    spanning = store(other, "2024-01-01", "2024-01-20", [5], 0.5)
+    inner = store(other, "2024-01-03", "2024-01-08", [5, 7], 0.6)
+    create_sits_run_manifest(conn, "run", [[2]], {0: [first, overlapping, adjacent], 1: [spanning, inner]})
+
+    stats = compact_cache(conn)
+
+    assert stats["jobs_merged"] == 4
+    assert stats["jobs_created"] == 1
+    assert stats["observations_removed"] == 2
+    jobs = conn.execute("SELECT id, start_date, end_date FROM sits_jobs ORDER BY id").fetchall()
+    merged = jobs[-1][0]
+    assert jobs == [
+        (apart, "2024-01-25", "2024-01-28"),
+        (spanning, "2024-01-01", "2024-01-20"),
+        (merged, "2024-01-01", "2024-01-20"),
+    ]
+
+    df, gaps = fetch_sits_with_gaps(conn, point, "2024-01-01", "2024-01-28", satellite, None, 1_000)
+    assert gaps == [("2024-01-21", "2024-01-24")]
+    expected = [(2, 0.1), (10, 0.1), (12, 0.2), (18, 0.3), (26, 0.4)]
+    assert df.select(pl.col("timestamp").dt.day(), "red").rows() == expected
+    # The job that already spanned the interval keeps its id and its own rows.
+    df, _ = fetch_sits_with_gaps(conn, other, "2024-01-01", "2024-01-20", satellite, None, 1_000)
+    assert df.select(pl.col("timestamp").dt.day(), "red").rows() == [(5, 0.5), (7, 0.6)]
+
+    manifest = load_sits_run_manifest(conn, "run")
+    assert manifest is not None
+    assert manifest[1].filter(pl.col("chunk_id").is_null()).sort("position").rows() == [
+        (0, None, merged),
+        (1, None, spanning),
+    ]
+    assert compact_cache(conn)["jobs_merged"] == 0
+    conn.close()
+
+
+def test_evict_cache_drops_least_recently_read_jobs(tmp_path) -> None:
+    conn = _make_duckdb_conn(tmp_path)
+    satellite = Sentinel2(bands={"red"})
+    points = [Point(-46.6, -23.55), Point(-47.0, -22.9), Point(-48.1, -21.3)]
+    job_ids = []
+    for i, point in enumerate(points):
+        job_ids.append(
+            store_sits_polars(
+                conn,
+                pl.DataFrame({"timestamp": [datetime(2024, 1, d) for d in (2, 5, 9)], "red": [0.1 * i] * 3}),
+                point,
+                "2024-01-01",
+                "2024-01-10",
+                satellite,
+                None,
+                1_000,
+            )
+        )
+    create_sits_run_manifest(conn, "run", [[1]], {0: [job_ids[1]]})
+    for point in (points[0], points[2]):
+        fetch_sits_with_gaps(conn, point, "2024-01-01", "2024-01-10", satellite, None, 1_000)
+
+    assert evict_cache(conn, max_rows=9)["jobs_evicted"] == 0
+    stats = evict_cache(conn, max_rows=7)
+
+    # The job never read goes first, down to 90% of the row budget.
+    assert stats["jobs_evicted"] == 1
+    assert stats["observations_evicted"] == 3
+    assert stats["geometries_evicted"] == 1
+    assert stats["rows"] == 6
+    reads = conn.execute("SELECT id, read_count FROM sits_jobs ORDER BY id").fetchall()
+    assert reads == [(job_ids[0], 1), (job_ids[2], 1)]
+    assert load_sits_run_manifest(conn, "run") is None
+    df, gaps = fetch_sits_with_gaps(conn, points[1], "2024-01-01", "2024-01-10", satellite, None, 1_000)
+    assert df.is_empty()
+    assert gaps == [("2024-01-01", "2024-01-10")]
+
+    # Among jobs that were read, the one read longest ago goes next.
+    fetch_sits_with_gaps(conn, points[0], "2024-01-01", "2024-01-10", satellite, None, 1_000)
+    assert evict_cache(conn, max_rows=4)["jobs_evicted"] == 1
+    assert conn.execute("SELECT id FROM sits_jobs").fetchall() == [(job_ids[0],)]
+    conn.close()
+
+
+def test_evict_cache_deletes_in_batches_and_rewrites_each_table_once(tmp_path, monkeypatch) -> None:
+    backend = importlib.import_module("agrigee_lite.cache.backend")
+    conn = _make_duckdb_conn(tmp_path)
+    satellite = Sentinel2(bands={"red"})
+    for i, point in enumerate([Point(-46.6, -23.55), Point(-47.0, -22.9), Point(-48.1, -21.3)]):
+        store_sits_polars(
+            conn,
+            pl.DataFrame({"timestamp": [datetime(2024, 1, d) for d in (2, 5, 9)], "red": [0.1 * i] * 3}),
+            point,
+            "2024-01-01",
+            "2024-01-10",
+            satellite,
+            None,
+            1_000,
+        )
+    rebuilt = []
+    rebuild = backend._rebuild_sat_table_duck
+
+    def count_rebuild(cursor, table_name, band_cols):
+        rebuilt.append(table_name)
+        rebuild(cursor, table_name, band_cols)
+
+    monkeypatch.setattr(backend, "_rebuild_sat_table_duck", count_rebuild)
+
+    stats = evict_cache(conn, max_rows=4, max_jobs=1)
+
+    assert stats["jobs_evicted"] == 2
+    assert stats["observations_evicted"] == 6
+    assert stats["rows"] == 3
+    assert rebuilt == [satellite.shortName]
+    conn.close()
+
+
+@pytest.mark.postgis
+@pytest.mark.skipif(not _pg_env_set(), reason="needs AGRIGEE_PG_HOST, AGRIGEE_PG_USER and AGRIGEE_PG_PASSWORD")
+def test_store_sits_pg_resolves_geometry_and_job_in_one_statement() -> None:
+    import sqlalchemy as sa
+
+    engine = init_cache()
+    satellite = Sentinel2(bands={"red"})
+    # A point of its own, so the shared database never already holds it.
+    point = Point(-46.6 + uuid.uuid4().int % 100_000 * 1e-7, -23.55)
+    frame = pl.DataFrame({"timestamp": [datetime(2024, 1, 2), datetime(2024, 1, 6)], "red": [0.1, float("nan")]})
+
+    first = store_sits_polars(engine, frame, point, "2024-01-01", "2024-01-10", satellite, None, 1_000)
+    again = store_sits_polars(engine, frame, point, "2024-01-01", "2024-01-10", satellite, None, 1_000)
+    other = store_sits_polars(engine, frame.head(1), point, "2024-01-01", "2024-01-20", satellite, None, 1_000)
+
+    with engine.begin() as conn:
+        try:
+            jobs = conn.execute(
+                sa.text("SELECT id, geometry_id FROM sits_jobs WHERE id IN (:a, :b) ORDER BY id"),
+                {"a": first, "b": other},
+            ).fetchall()
+            observations = conn.execute(
+                sa.text(f'SELECT job_id, red FROM "{satellite.shortName}" WHERE job_id IN (:a, :b) ORDER BY id'),
+                {"a": first, "b": other},
+            ).fetchall()
+        finally:
+            conn.execute(
+                sa.text(f'DELETE FROM "{satellite.shortName}" WHERE job_id IN (:a, :b)'), {"a": first, "b": other}
+            )
+            geometry_ids = [
+                row[0]
+                for row in conn.execute(
+                    sa.text("DELETE FROM sits_jobs WHERE id IN (:a, :b) RETURNING geometry_id"),
+                    {"a": first, "b": other},
+                ).fetchall()
+            ]
+            conn.execute(sa.text("DELETE FROM geometries WHERE id = ANY(:ids)"), {"ids": geometry_ids})
+
+    # Storing the same job again resolves to the existing row and adds no observations.
+    assert again == first
+    assert other != first
+    assert jobs[0][1] == jobs[1][1]
+    assert [(job_id, red) for job_id, red in observations] == [(first, 0.1), (first, None), (other, 0.1)]
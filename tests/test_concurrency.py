@@ -0,0 +1,164 @@
+import asyncio
+import threading
+import time
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import agrigee_lite._concurrency as concurrency
+from agrigee_lite._concurrency import (
+    AdaptiveConcurrencyController,
+    AIMDLimit,
+    GradientLimit,
+    LimitAlgorithm,
+    get_concurrency_controller,
+    reset_concurrency_controllers,
+    save_concurrency_state,
+)
+
+
+def test_concurrency_controller_is_shared_and_persisted(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(concurrency, "ASYNC_CONCURRENCY_STATE_PATH", str(tmp_path / "limits.json"))
+    reset_concurrency_controllers()
+
+    async def throttle() -> None:
+        controller = get_concurrency_controller("https://ee.test", "sa@test", 16)
+        async with controller:
+            await controller.on_rate_limit()
+        await controller.on_success(2.0)
+
+    asyncio.run(throttle())
+    controller = get_concurrency_controller("https://ee.test", "sa@test", 16)
+    # A second call on a fresh event loop picks up the learned limit instead of starting over.
+    asyncio.run(throttle())
+    assert get_concurrency_controller("https://ee.test", "sa@test", 16) is controller
+    assert controller.limit == 8
+    assert controller.recent_rate_limits() == 2
+    assert get_concurrency_controller("https://ee.test", "other@test", 16).limit == 16
+
+    save_concurrency_state()
+    reset_concurrency_controllers()
+    restored = get_concurrency_controller("https://ee.test", "sa@test", 16)
+
+    assert restored is not controller
+    assert restored.limit == 8
+    assert restored.latency_ewma == controller.latency_ewma
+    assert restored.recent_rate_limits() == 2
+    reset_concurrency_controllers()
+
+
+def test_limit_algorithm_without_on_success_fails_at_construction() -> None:
+    class Incomplete(LimitAlgorithm):
+        name = "incomplete"
+
+    with pytest.raises(TypeError, match="on_success"):
+        Incomplete()
+
+
+def test_concurrency_controller_budget_spans_event_loops() -> None:
+    reset_concurrency_controllers()
+    controller = get_concurrency_controller("https://ee.test", "shared@test", 3)
+    peak = 0
+    lock = threading.Lock()
+
+    async def job() -> None:
+        nonlocal peak
+
+        async def work() -> None:
+            nonlocal peak
+            async with controller:
+                with lock:
+                    peak = max(peak, controller.active)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(work() for _ in range(10)))
+
+    threads = [threading.Thread(target=asyncio.run, args=(job(),)) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert peak == 3
+    assert controller.active == 0
+    reset_concurrency_controllers()
+
+
+async def _simulate_downloads(
+    controller: AdaptiveConcurrencyController,
+    requests: int = 300,
+    workers: int = 32,
+    base_latency: float = 0.02,
+    capacity: int = 4,
+    quota: int = 24,
+) -> tuple[float, float, int]:
+    """Drive ``controller`` against a fake endpoint that slows down past ``capacity`` and 429s past ``quota``.
+
+    Returns throughput (requests/s), p95 latency (s) and the number of 429s.
+    """
+    inflight = 0
+
+    async def handler(request: web.Request) -> web.Response:
+        nonlocal inflight
+        inflight += 1
+        try:
+            if inflight > quota:
+                return web.Response(status=429)
+            await asyncio.sleep(base_latency * max(1.0, inflight / capacity))
+            return web.Response(text="ok")
+        finally:
+            inflight -= 1
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    pending: asyncio.Queue[int] = asyncio.Queue()
+    for i in range(requests):
+        pending.put_nowait(i)
+    latencies: list[float] = []
+    throttled = 0
+
+    async with (
+        TestServer(app) as server,
+        aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0)) as session,
+    ):
+        url = server.make_url("/")
+
+        async def worker() -> None:
+            nonlocal throttled
+            while not pending.empty():
+                item = pending.get_nowait()
+                async with controller:
+                    t0 = time.perf_counter()
+                    async with session.get(url) as resp:
+                        await resp.read()
+                    latency = time.perf_counter() - t0
+                    if resp.status == 429:
+                        throttled += 1
+                        await controller.on_rate_limit()
+                        pending.put_nowait(item)
+                    else:
+                        latencies.append(latency)
+                        await controller.on_success(latency)
+                if resp.status == 429:
+                    await asyncio.sleep(0.05)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return requests / elapsed, latencies[int(0.95 * len(latencies))], throttled
+
+
+def test_gradient_limiter_keeps_latency_below_aimd_without_losing_throughput() -> None:
+    aimd = asyncio.run(_simulate_downloads(AdaptiveConcurrencyController("aimd", 32, 1, 32, AIMDLimit(5))))
+    gradient = asyncio.run(_simulate_downloads(AdaptiveConcurrencyController("gradient", 4, 1, 32, GradientLimit())))
+
+    aimd_throughput, aimd_p95, aimd_throttled = aimd
+    gradient_throughput, gradient_p95, gradient_throttled = gradient
+    assert gradient_throughput >= 0.8 * aimd_throughput
+    assert gradient_p95 < aimd_p95
+    assert gradient_throttled < aimd_throttled
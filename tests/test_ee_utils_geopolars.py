@@ -1,7 +1,10 @@
+from datetime import date
+
 import geopandas as gpd
 import pandas as pd
+import polars as pl
 import pytest
-from shapely.geometry import Point, Polygon
+from shapely.geometry import MultiPolygon, Point, Polygon
 
 from agrigee_lite._geo_compat import normalize_geodataframe
 from agrigee_lite.ee_utils import _build_feature_collection_payload
@@ -61,3 +64,23 @@ def test_build_feature_collection_payload_from_geopolars_reprojects_to_wgs84() -
     assert coords[0] == pytest.approx(-46.6, abs=1e-4)
     assert coords[1] == pytest.approx(-23.55, abs=1e-4)
     assert features[0]["properties"] == {"0": 1, "s": "2024-03-01", "e": "2024-03-05"}
+
+
+def test_build_feature_collection_payload_formats_polars_columns() -> None:
+    polygon = Polygon([(-46.61, -23.56), (-46.59, -23.56), (-46.59, -23.54), (-46.61, -23.54)])
+    frame = pl.DataFrame({
+        "geometry": [MultiPolygon([polygon]).wkb, Point(-46.6, -23.55).wkb],
+        "original_index": ["a", 'b"1'],
+        "start_date": [date(2024, 1, 1), date(2024, 2, 1)],
+        "end_date": ["2024-01-10", None],
+    })
+
+    payload = _build_feature_collection_payload(frame, "original_index", crs="EPSG:4326")
+
+    features = payload["features"]
+    assert isinstance(features, list)
+    assert features[0]["geometry"]["type"] == "MultiPolygon"
+    assert features[0]["geometry"]["geodesic"] is True
+    assert features[0]["properties"] == {"0": "a", "s": "2024-01-01", "e": "2024-01-10"}
+    assert features[1]["geometry"] == {"type": "Point", "coordinates": [-46.6, -23.55]}
+    assert features[1]["properties"] == {"0": 'b"1', "s": "2024-02-01", "e": None}
@@ -1,5 +1,8 @@
 import geopandas as gpd
 import geopolars as gpl
+import numpy as np
+import polars as pl
+import pytest
 from shapely.geometry import Point
 
 from agrigee_lite._geo_compat import (
@@ -9,8 +12,11 @@ from agrigee_lite._geo_compat import (
     hash_geometry_row,
     iter_shapely_geometries,
     normalize_geodataframe,
+    reproject_geometries,
+    shapely_geometry_array,
     to_geojson_features,
     to_geopandas_geodataframe,
+    transform_geometry,
 )
 
 
@@ -38,10 +44,37 @@ def test_normalize_geodataframe_from_geopolars() -> None:
     normalized = normalize_geodataframe(geopolars_gdf)
 
     assert isinstance(normalized, gpl.GeoDataFrame)
-    assert normalized is not geopolars_gdf
+    assert normalized is geopolars_gdf
+    assert normalize_geodataframe(geopolars_gdf, crs="EPSG:4326") is geopolars_gdf
     assert get_crs(normalized) == "EPSG:4326"
 
 
+def test_normalize_geodataframe_reuses_reprojection_of_same_frame() -> None:
+    geopolars_gdf = normalize_geodataframe(_sample_geopandas())
+
+    projected = normalize_geodataframe(geopolars_gdf, crs="EPSG:3857")
+
+    assert get_crs(projected) == "EPSG:3857"
+    assert iter_shapely_geometries(projected)[1].x == pytest.approx(111_319.49, abs=0.01)
+    assert normalize_geodataframe(geopolars_gdf, crs="EPSG:3857") is projected
+    assert normalize_geodataframe(geopolars_gdf.head(1), crs="EPSG:3857").height == 1
+
+
+def test_normalize_geodataframe_reprojects_again_after_in_place_change() -> None:
+    utm = normalize_geodataframe(
+        gpd.GeoDataFrame({"name": ["a"]}, geometry=[Point(500_000, 8_000_000)], crs="EPSG:31983")
+    )
+    first = normalize_geodataframe(utm, crs="EPSG:4326")
+
+    utm.replace_column(utm.get_column_index("geometry"), pl.Series("geometry", [Point(400_000, 7_000_000).wkb]))
+    second = normalize_geodataframe(utm, crs="EPSG:4326")
+
+    expected = transform_geometry(Point(400_000, 7_000_000), "EPSG:31983", "EPSG:4326")
+    assert second is not first
+    assert iter_shapely_geometries(second)[0].equals_exact(expected, tolerance=1e-9)
+    assert not iter_shapely_geometries(first)[0].equals_exact(expected, tolerance=1e-3)
+
+
 def test_to_geopandas_geodataframe_restores_crs() -> None:
     normalized = normalize_geodataframe(_sample_geopandas())
 
@@ -70,3 +103,37 @@ def test_geojson_helpers_and_row_hash_are_backend_neutral() -> None:
     assert geometry_to_geojson(geopandas_gdf.geometry.iloc[0]) == {"type": "Point", "coordinates": (0.0, 0.0)}
     assert to_geojson_features(geopandas_gdf) == to_geojson_features(geopolars_gdf)
     assert hash_geometry_row(geopandas_gdf, 0) == hash_geometry_row(geopolars_gdf, 0)
+
+
+def test_reproject_geometries_matches_per_geometry_transform() -> None:
+    utm = gpd.GeoDataFrame(
+        {"name": ["a", "b"]},
+        geometry=[Point(333_000, 7_394_000), Point(333_000, 7_394_000).buffer(50)],
+        crs="EPSG:31983",
+    )
+    expected = utm.to_crs("EPSG:4326").geometry.to_list()
+
+    projected = reproject_geometries(shapely_geometry_array(utm), "EPSG:31983")
+    normalized = normalize_geodataframe(normalize_geodataframe(utm), crs="EPSG:4326")
+
+    for geometry, reference in zip(projected, expected, strict=True):
+        assert geometry.equals_exact(reference, tolerance=1e-9)
+    for geometry, reference in zip(iter_shapely_geometries(normalized), expected, strict=True):
+        assert geometry.equals_exact(reference, tolerance=1e-9)
+    assert transform_geometry(expected[0], "EPSG:4326", "EPSG:31983").equals_exact(
+        Point(333_000, 7_394_000), tolerance=1e-6
+    )
+
+
+def test_reproject_geometries_keeps_z_coordinates() -> None:
+    geometries = np.asarray([Point(333_000, 7_394_000, 12.5), Point(333_000, 7_394_000)], dtype=object)
+
+    projected = reproject_geometries(geometries, "EPSG:31983")
+
+    assert projected[0].has_z
+    assert projected[0].z == pytest.approx(12.5)
+    assert not projected[1].has_z
+    assert projected[0].equals_exact(Point(projected[1].x, projected[1].y, 12.5), tolerance=1e-9)
+    restored = transform_geometry(Point(500_000, 8_000_000, 12.5), "EPSG:31983", "EPSG:4326")
+    assert restored.has_z
+    assert restored.z == pytest.approx(12.5)
@@ -1,11 +1,14 @@
 import geopandas as gpd
 import geopolars as gpl
 import h3
+import numpy as np
 import pandas as pd
+import pytest
+import shapely
 from shapely.geometry import MultiPolygon, Point, Polygon
 
 from agrigee_lite._geo_compat import to_geopandas_geodataframe
-from agrigee_lite.misc import create_gdf_hash, h3_clustering, simplify_gdf
+from agrigee_lite.misc import compute_h3_cells, create_gdf_hash, h3_clustering, simplify_gdf
 
 
 def _point_gdf() -> gpd.GeoDataFrame:
@@ -77,6 +80,28 @@ def test_simplify_gdf_preserves_duplicate_geometries() -> None:
     assert simplified.geometry.nunique() == 1
 
 
+def test_simplify_gdf_drops_vertices_and_quantizes_coordinates() -> None:
+    angles = np.linspace(0, 2 * np.pi, 2000, endpoint=False)
+    ring = np.column_stack([-46.6 + 0.01 * np.cos(angles), -23.55 + 0.01 * np.sin(angles)])
+    hole = np.column_stack([-46.6 + 0.002 * np.cos(angles), -23.55 + 0.002 * np.sin(angles)])
+    gdf = gpd.GeoDataFrame(
+        {"name": ["field", "well"]},
+        geometry=[Polygon(ring, [hole]), Point(-46.612345678, -23.551234567)],
+        crs="EPSG:4326",
+    )
+
+    simplified = simplify_gdf(gdf, tol=1e-5, grid_size=1e-6)
+    polygon, point = simplified.geometry
+
+    assert shapely.get_num_coordinates(polygon) < shapely.get_num_coordinates(gdf.geometry.iloc[0])
+    assert polygon.is_valid
+    assert len(polygon.interiors) == 1
+    assert abs(polygon.area - gdf.geometry.iloc[0].area) / gdf.geometry.iloc[0].area < 0.01
+    coords = shapely.get_coordinates([polygon, point])
+    np.testing.assert_allclose(coords, np.round(coords, 6), rtol=0, atol=1e-12)
+    assert (point.x, point.y) == (-46.612346, -23.551235)
+
+
 def test_h3_clustering_sorts_rows_and_assigns_cluster_ids() -> None:
     gdf = _point_gdf()
 
@@ -102,6 +127,37 @@ def test_h3_clustering_sorts_rows_and_assigns_cluster_ids() -> None:
     assert list(clustered_gdf.geometry.to_wkt()) == [item[3] for item in expected]
 
 
+def test_compute_h3_cells_matches_scalar_h3_api() -> None:
+    rng = np.random.default_rng(42)
+    x = rng.uniform(-75.0, -34.0, 500)
+    y = rng.uniform(-34.0, 5.0, 500)
+    x[10:20] = x[0]
+    y[10:20] = y[0]
+
+    coarse, fine = compute_h3_cells(x, y, coarse_resolution=5, fine_resolution=8)
+
+    expected_fine = [h3.latlng_to_cell(lat, lng, 8) for lng, lat in zip(x, y, strict=True)]
+    assert fine.to_list() == expected_fine
+    assert coarse.to_list() == [h3.cell_to_parent(cell, 5) for cell in expected_fine]
+
+
+@pytest.mark.parametrize(("coarse_resolution", "fine_resolution"), [(9, 8), (-1, 8), (5, 16)])
+def test_compute_h3_cells_rejects_invalid_resolutions(coarse_resolution: int, fine_resolution: int) -> None:
+    with pytest.raises(ValueError, match="H3 resolutions"):
+        compute_h3_cells(np.array([-46.6]), np.array([-23.55]), coarse_resolution, fine_resolution)
+
+
+def test_h3_clustering_polygon_uses_centroid_cell() -> None:
+    gdf = _polygon_gdf()
+
+    clustered = to_geopandas_geodataframe(h3_clustering(gdf, coarse_resolution=4, fine_resolution=9))
+
+    centroid = gdf.geometry.iloc[0].centroid
+    assert clustered["h3_fine"].iloc[0] == h3.latlng_to_cell(centroid.y, centroid.x, 9)
+    assert clustered["h3_coarse"].iloc[0] == h3.latlng_to_cell(centroid.y, centroid.x, 4)
+    assert list(clustered["cluster_id"]) == [0]
+
+
 def test_h3_clustering_accepts_geopolars_input() -> None:
     geopandas_gdf = _point_gdf()
     geopolars_gdf = gpl.from_geopandas(geopandas_gdf)
@@ -125,3 +181,21 @@ def test_create_gdf_hash_matches_between_backends() -> None:
     geopolars_hash = create_gdf_hash(geopolars_gdf, "start_date", "end_date")
 
     assert geopandas_hash == geopolars_hash
+
+
+def test_simplify_gdf_applies_degree_tolerance_to_projected_geometries() -> None:
+    angles = np.linspace(0, 2 * np.pi, 2000, endpoint=False)
+    ring = np.column_stack([-46.6 + 0.01 * np.cos(angles), -23.55 + 0.01 * np.sin(angles)])
+    geographic = gpd.GeoDataFrame({"name": ["field"]}, geometry=[Polygon(ring)], crs="EPSG:4326")
+    projected = geographic.to_crs("EPSG:32723")
+
+    in_degrees = simplify_gdf(projected, tol=1e-4, units_crs="EPSG:4326")
+    in_metres = simplify_gdf(projected, tol=1e-4)
+
+    polygon = in_degrees.geometry.iloc[0]
+    assert in_degrees.crs == projected.crs
+    assert shapely.get_num_coordinates(polygon) == shapely.get_num_coordinates(
+        simplify_gdf(geographic, tol=1e-4).geometry.iloc[0]
+    )
+    assert shapely.get_num_coordinates(polygon) < shapely.get_num_coordinates(in_metres.geometry.iloc[0])
+    assert abs(polygon.area - projected.geometry.iloc[0].area) / projected.geometry.iloc[0].area < 0.01
@@ -1,11 +1,37 @@
+import asyncio
+import importlib
+
+import aiohttp
+import duckdb
+import ee
 import geopandas as gpd
 import geopolars as gpl
+import numpy as np
 import pandas as pd
-from shapely.geometry import Point
+import polars as pl
+import pytest
+import shapely
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from polars.testing import assert_frame_equal
+from shapely.geometry import Point, box
 
-from agrigee_lite.get.sits import sanitize_and_prepare_input_gdf
+import agrigee_lite.cache.backend as cache_backend
+from agrigee_lite.cache.backend import _ensure_sat_table_duck, _ensure_schema_duck, _get_band_columns
+from agrigee_lite.ee_utils import EEServiceAccount
+from agrigee_lite.get.sits import (
+    build_csv_schema,
+    download_multiple_sits_async,
+    estimate_sits_row_costs,
+    plan_sits_chunks,
+    read_csv_streaming,
+    sanitize_and_prepare_input_gdf,
+)
 from agrigee_lite.sat.sentinel2 import Sentinel2
 
+# ``agrigee_lite.get`` re-exports a function named ``sits`` that shadows the submodule attribute.
+sits_module = importlib.import_module("agrigee_lite.get.sits")
+
 
 def test_sanitize_and_prepare_input_gdf_accepts_geopandas_input() -> None:
     satellite = Sentinel2()
@@ -61,3 +87,456 @@ def test_sanitize_and_prepare_input_gdf_accepts_geopolars_input() -> None:
         "h3_fine",
         "cluster_id",
     }
+
+
+def test_sanitize_and_prepare_input_gdf_simplifies_geometries_on_request() -> None:
+    satellite = Sentinel2()
+    field = Point(-46.6, -23.55).buffer(0.01, quad_segs=256)
+    gdf = gpd.GeoDataFrame(
+        {
+            "start_date": pd.to_datetime(["2024-01-01"]),
+            "end_date": pd.to_datetime(["2024-01-10"]),
+        },
+        geometry=[field],
+        crs="EPSG:4326",
+    )
+
+    untouched = sanitize_and_prepare_input_gdf(gdf, satellite, "original_index")
+    simplified = sanitize_and_prepare_input_gdf(
+        gdf, satellite, "original_index", simplify_tolerance=1e-5, coordinate_precision=1e-6
+    )
+
+    assert untouched.get_column("geometry").to_list() == [field.wkb]
+    simplified_field = shapely.from_wkb(simplified.get_column("geometry").item())
+    assert simplified_field.is_valid
+    assert shapely.get_num_coordinates(simplified_field) < shapely.get_num_coordinates(field)
+    assert simplified.get_column("geometry").bin.size().item() < len(field.wkb)
+    assert simplified.get_column("h3_fine").to_list() == untouched.get_column("h3_fine").to_list()
+
+
+def test_read_csv_streaming_matches_buffered_read() -> None:
+    satellite = Sentinel2(bands={"red", "nir"})
+    schema = build_csv_schema(satellite, None)
+    header = ",".join(schema)
+    rows = [f"{i // 3},2024-01-{i % 28 + 1:02d},{i * 10},{i * 20 + 1},{i % 7}" for i in range(2_000)]
+    rows[5] = "1,2024-01-06,,0.5,3"
+    body = "\n".join([header, *rows]).encode()
+
+    async def handler(request: web.Request) -> web.StreamResponse:
+        resp = web.StreamResponse()
+        await resp.prepare(request)
+        for start in range(0, len(body), 997):
+            await resp.write(body[start : start + 997])
+        await resp.write_eof()
+        return resp
+
+    async def run() -> pl.DataFrame:
+        app = web.Application()
+        app.router.add_get("/", handler)
+        async with (
+            TestServer(app) as server,
+            aiohttp.ClientSession() as session,
+            session.get(server.make_url("/")) as resp,
+        ):
+            return await read_csv_streaming(resp, schema)
+
+    streamed = asyncio.run(run())
+
+    assert streamed.schema == pl.Schema(schema)
+    assert_frame_equal(streamed, pl.read_csv(body, schema_overrides=schema))
+    assert streamed.get_column(list(schema)[2])[5] is None
+
+
+def test_response_body_pipe_bounds_buffered_chunks() -> None:
+    async def run() -> bytes:
+        pipe = sits_module._ResponseBodyPipe(asyncio.get_running_loop(), max_chunks=2)
+        await pipe.feed(b"ab")
+        await pipe.feed(b"cd")
+        blocked = asyncio.ensure_future(pipe.feed(b"ef"))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+
+        body = asyncio.get_running_loop().run_in_executor(None, pipe.read)
+        await asyncio.wait_for(blocked, 1)
+        pipe.finish()
+        return await body
+
+    assert asyncio.run(run()) == b"abcdef"
+
+
+def test_download_multiple_sits_async_pipelines_minted_urls(tmp_path, monkeypatch) -> None:
+    satellite = Sentinel2(bands={"red"})
+    conn = duckdb.connect(str(tmp_path / "cache.duckdb"))
+    _ensure_schema_duck(conn)
+    _ensure_sat_table_duck(conn, satellite.shortName, _get_band_columns(satellite))
+    monkeypatch.setattr(cache_backend, "_duck_conn", conn)
+
+    minted: list[str] = []
+
+    class _FakeExpression:
+        def __init__(self, indexes: list[int]) -> None:
+            self.indexes = indexes
+
+        def getDownloadURL(self, filetype: str, selectors: list[str], filename: str) -> str:
+            minted.append(filename)
+            return f"{base_url}/{filename}?ids={','.join(map(str, self.indexes))}"
+
+    def fake_build_ee_expression(gdf, *args, **kwargs) -> _FakeExpression:
+        return _FakeExpression(gdf.get_column("original_index").to_list())
+
+    monkeypatch.setattr(sits_module, "build_ee_expression", fake_build_ee_expression)
+
+    async def handler(request: web.Request) -> web.Response:
+        ids = [int(i) for i in request.query["ids"].split(",")]
+        lines = ["00_indexnum,01_timestamp,10_red,99_validPixelsCount"]
+        lines += [f"{i},2024-01-0{day},{i + day / 10},4" for i in ids for day in (2, 5)]
+        return web.Response(text="\n".join(lines))
+
+    gdf = gpd.GeoDataFrame(
+        {
+            "start_date": pd.to_datetime(["2024-01-01"] * 7),
+            "end_date": pd.to_datetime(["2024-01-10"] * 7),
+        },
+        geometry=[Point(-46.6 + i / 100, -23.55) for i in range(7)],
+        crs="EPSG:4326",
+    )
+
+    async def run() -> pl.DataFrame:
+        nonlocal base_url
+        app = web.Application()
+        app.router.add_get("/{chunk}", handler)
+        async with TestServer(app) as server:
+            base_url = str(server.make_url("")).rstrip("/")
+            return await download_multiple_sits_async(
+                gdf, satellite, crs="EPSG:4326", chunksize=2, max_parallel_downloads=2, adaptive_chunks=False
+            )
+
+    base_url = ""
+    result = asyncio.run(run())
+
+    assert sorted(minted) == ["0", "1", "2", "3"]
+    assert result.height == 14
+    assert sorted(set(result.get_column("original_index").to_list())) == list(range(7))
+    assert conn.execute("SELECT COUNT(*) FROM sits_jobs").fetchone() == (7,)
+    conn.close()
+
+
+def test_download_multiple_sits_async_shards_across_service_accounts(tmp_path, monkeypatch) -> None:
+    satellite = Sentinel2(bands={"red"})
+    conn = duckdb.connect(str(tmp_path / "cache.duckdb"))
+    _ensure_schema_duck(conn)
+    _ensure_sat_table_duck(conn, satellite.shortName, _get_band_columns(satellite))
+    monkeypatch.setattr(cache_backend, "_duck_conn", conn)
+
+    def fake_encode_ee_expression(gdf, *args, **kwargs) -> dict:
+        return {"result": "0", "values": {"0": {"constantValue": {"ids": gdf.get_column("original_index").to_list()}}}}
+
+    monkeypatch.setattr(sits_module, "encode_ee_expression", fake_encode_ee_expression)
+    # One minter per account so neither shard can drain the shared chunk queue on its own.
+    monkeypatch.setattr(sits_module, "ASYNC_MAX_URL_WORKERS", 1)
+
+    class _FakeCredentials:
+        valid = True
+
+        def __init__(self, token: str) -> None:
+            self.token = token
+
+    minted_by: dict[str, list[str]] = {}
+
+    async def create_table(request: web.Request) -> web.Response:
+        body = await request.json()
+        ids = ",".join(map(str, body["expression"]["values"]["0"]["constantValue"]["ids"]))
+        minted_by.setdefault(request.headers["Authorization"], []).append(body["filename"])
+        return web.json_response({"name": f"projects/{request.match_info['project']}/tables/{ids}"})
+
+    async def get_features(request: web.Request) -> web.Response:
+        ids = [int(i) for i in request.match_info["table"].split(",")]
+        lines = ["00_indexnum,01_timestamp,10_red,99_validPixelsCount"]
+        lines += [f"{i},2024-01-0{day},{i + day / 10},4" for i in ids for day in (2, 5)]
+        return web.Response(text="\n".join(lines))
+
+    gdf = gpd.GeoDataFrame(
+        {
+            "start_date": pd.to_datetime(["2024-01-01"] * 9),
+            "end_date": pd.to_datetime(["2024-01-10"] * 9),
+        },
+        geometry=[Point(-46.6 + i / 100, -23.55) for i in range(9)],
+        crs="EPSG:4326",
+    )
+
+    async def run() -> pl.DataFrame:
+        app = web.Application()
+        app.router.add_post("/v1/projects/{project}/tables", create_table)
+        app.router.add_get("/v1/projects/{project}/tables/{table}:getFeatures", get_features)
+        async with TestServer(app) as server:
+            base_url = str(server.make_url("")).rstrip("/")
+            accounts = [
+                EEServiceAccount("proj-a", _FakeCredentials("tok-a"), api_base_url=base_url),
+                EEServiceAccount("proj-b", _FakeCredentials("tok-b"), api_base_url=base_url),
+            ]
+            return await download_multiple_sits_async(
+                gdf,
+                satellite,
+                crs="EPSG:4326",
+                chunksize=1,
+                max_parallel_downloads=2,
+                service_accounts=accounts,
+                adaptive_chunks=False,
+            )
+
+    result = asyncio.run(run())
+
+    assert set(minted_by) == {"Bearer tok-a", "Bearer tok-b"}
+    assert sorted(int(f) for filenames in minted_by.values() for f in filenames) == list(range(9))
+    assert result.height == 18
+    assert sorted(set(result.get_column("original_index").to_list())) == list(range(9))
+    conn.close()
+
+
+def test_plan_sits_chunks_packs_rows_by_estimated_cost() -> None:
+    satellite = Sentinel2()
+    requests = gpl.from_geopandas(
+        gpd.GeoDataFrame(
+            {
+                "start_date": pd.to_datetime(["2024-01-01", "2024-01-01", "2014-01-01", "2024-01-01"]),
+                "end_date": pd.to_datetime(["2024-03-31", "2024-03-31", "2023-12-31", "2024-03-31"]),
+            },
+            geometry=[
+                Point(-46.6, -23.55),
+                Point(-46.7, -23.55),
+                box(-46.7, -23.6, -46.6, -23.5),
+                Point(-46.8, -23.55),
+            ],
+            crs="EPSG:4326",
+        )
+    )
+
+    costs = estimate_sits_row_costs(requests, satellite, 1_000)
+
+    # A point over one quarter is a quarter unit; a sampled polygon over ten years is far heavier.
+    assert costs[0] == costs[1]
+    assert 0.2 < costs[0] < 0.3
+    assert costs[2] > 10
+    assert plan_sits_chunks(costs, budget=10, max_rows=50) == [[0, 1], [2], [3]]
+    assert plan_sits_chunks(costs, budget=10, max_rows=1) == [[0], [1], [2], [3]]
+    assert estimate_sits_row_costs(requests, satellite, 0.0001)[2] < costs[2]
+
+
+def test_estimate_sits_row_costs_prices_projected_rows_on_their_geographic_footprint() -> None:
+    satellite = Sentinel2()
+    fields = gpd.GeoDataFrame(
+        {
+            "start_date": pd.to_datetime(["2024-01-01"] * 20),
+            "end_date": pd.to_datetime(["2024-12-31"] * 20),
+        },
+        geometry=[Point(330_000 + 500 * i, 7_395_000).buffer(100) for i in range(20)],
+        crs="EPSG:31983",
+    )
+    geographic = fields.to_crs("EPSG:4326")
+
+    projected_costs = estimate_sits_row_costs(
+        sanitize_and_prepare_input_gdf(fields, satellite, "original_index"), satellite, 1_000
+    )
+    geographic_costs = estimate_sits_row_costs(
+        sanitize_and_prepare_input_gdf(geographic, satellite, "original_index"), satellite, 1_000
+    )
+
+    np.testing.assert_allclose(np.sort(projected_costs), np.sort(geographic_costs), rtol=1e-6)
+    assert projected_costs.max() < 2
+    assert plan_sits_chunks(projected_costs, budget=10, max_rows=50) == plan_sits_chunks(
+        geographic_costs, budget=10, max_rows=50
+    )
+
+
+def test_estimate_sits_row_costs_fits_sits_chunksize_one_year_points_per_chunk() -> None:
+    satellite = Sentinel2()
+    points = gpd.GeoDataFrame(
+        {
+            "start_date": pd.to_datetime(["2023-01-01"] * 20),
+            "end_date": pd.to_datetime(["2024-01-01"] * 20),
+        },
+        geometry=[Point(-46.6 + 0.01 * i, -23.55) for i in range(20)],
+        crs="EPSG:4326",
+    )
+
+    costs = estimate_sits_row_costs(gpl.from_geopandas(points), satellite, 1_000)
+
+    assert plan_sits_chunks(costs, budget=10, max_rows=50) == [list(range(10)), list(range(10, 20))]
+
+
+def test_download_multiple_sits_async_splits_chunks_that_exceed_gee_limits(tmp_path, monkeypatch) -> None:
+    satellite = Sentinel2(bands={"red"})
+    conn = duckdb.connect(str(tmp_path / "cache.duckdb"))
+    _ensure_schema_duck(conn)
+    _ensure_sat_table_duck(conn, satellite.shortName, _get_band_columns(satellite))
+    monkeypatch.setattr(cache_backend, "_duck_conn", conn)
+
+    requested: list[list[int]] = []
+
+    class _FakeExpression:
+        def __init__(self, indexes: list[int]) -> None:
+            self.indexes = indexes
+
+        def getDownloadURL(self, filetype: str, selectors: list[str], filename: str) -> str:
+            return f"{base_url}/{filename}?ids={','.join(map(str, self.indexes))}"
+
+    def fake_build_ee_expression(gdf, *args, **kwargs) -> _FakeExpression:
+        return _FakeExpression(gdf.get_column("original_index").to_list())
+
+    monkeypatch.setattr(sits_module, "build_ee_expression", fake_build_ee_expression)
+
+    async def handler(request: web.Request) -> web.Response:
+        ids = [int(i) for i in request.query["ids"].split(",")]
+        requested.append(ids)
+        if len(ids) > 2:
+            return web.Response(status=400, text='{"error": {"message": "User memory limit exceeded."}}')
+        lines = ["00_indexnum,01_timestamp,10_red,99_validPixelsCount"]
+        lines += [f"{i},2024-01-02,{i / 10 + 0.1},4" for i in ids]
+        return web.Response(text="\n".join(lines))
+
+    gdf = gpd.GeoDataFrame(
+        {
+            "start_date": pd.to_datetime(["2024-01-01"] * 6),
+            "end_date": pd.to_datetime(["2024-01-10"] * 6),
+        },
+        geometry=[Point(-46.6 + i / 100, -23.55) for i in range(6)],
+        crs="EPSG:4326",
+    )
+
+    async def run() -> pl.DataFrame:
+        nonlocal base_url
+        app = web.Application()
+        app.router.add_get("/{chunk}", handler)
+        async with TestServer(app) as server:
+            base_url = str(server.make_url("")).rstrip("/")
+            return await download_multiple_sits_async(gdf, satellite, crs="EPSG:4326", max_parallel_downloads=2)
+
+    base_url = ""
+    result = asyncio.run(run())
+
+    # Six cheap rows fit one chunk; each rejection halves it instead of re-sending the same request.
+    assert sorted(map(len, requested)) == [1, 1, 2, 2, 3, 3, 6]
+    assert sorted(result.get_column("original_index").to_list()) == list(range(6))
+    conn.close()
+
+
+def test_only_computation_timeouts_mark_a_chunk_as_oversized() -> None:
+    assert sits_module._is_oversized_chunk(sits_module._ChunkReadTimeout("Chunk download exceeded 300s"))
+    assert sits_module._is_oversized_chunk(RuntimeError("Computation timed out."))
+    # Network stalls go back to the retry loop instead of splitting the chunk.
+    assert not sits_module._is_oversized_chunk(aiohttp.ConnectionTimeoutError("Connection timeout to host"))
+    assert not sits_module._is_oversized_chunk(aiohttp.SocketTimeoutError("Timeout on reading data from socket"))
+    assert not sits_module._is_oversized_chunk(TimeoutError())
+
+
+def test_download_multiple_sits_async_resumes_failed_chunks(tmp_path, monkeypatch) -> None:
+    satellite = Sentinel2(bands={"red"})
+    conn = duckdb.connect(str(tmp_path / "cache.duckdb"))
+    _ensure_schema_duck(conn)
+    _ensure_sat_table_duck(conn, satellite.shortName, _get_band_columns(satellite))
+    monkeypatch.setattr(cache_backend, "_duck_conn", conn)
+
+    requested: list[list[int]] = []
+    broken = {2}
+
+    class _FakeExpression:
+        def __init__(self, indexes: list[int]) -> None:
+            self.indexes = indexes
+
+        def getDownloadURL(self, filetype: str, selectors: list[str], filename: str) -> str:
+            return f"{base_url}/{filename}?ids={','.join(map(str, self.indexes))}"
+
+    def fake_build_ee_expression(gdf, *args, **kwargs) -> _FakeExpression:
+        return _FakeExpression(gdf.get_column("original_index").to_list())
+
+    monkeypatch.setattr(sits_module, "build_ee_expression", fake_build_ee_expression)
+
+    async def handler(request: web.Request) -> web.Response:
+        ids = [int(i) for i in request.query["ids"].split(",")]
+        requested.append(ids)
+        if broken.intersection(ids):
+            return web.Response(status=500, text="Internal error.")
+        lines = ["00_indexnum,01_timestamp,10_red,99_validPixelsCount"]
+        lines += [f"{i},2024-01-02,{i / 10 + 0.1},4" for i in ids]
+        return web.Response(text="\n".join(lines))
+
+    gdf = gpd.GeoDataFrame(
+        {
+            "start_date": pd.to_datetime(["2024-01-01"] * 6),
+            "end_date": pd.to_datetime(["2024-01-10"] * 6),
+        },
+        geometry=[Point(-46.6 + i / 100, -23.55) for i in range(6)],
+        crs="EPSG:4326",
+    )
+
+    async def run(**kwargs) -> pl.DataFrame:
+        nonlocal base_url
+        app = web.Application()
+        app.router.add_get("/{chunk}", handler)
+        async with TestServer(app) as server:
+            base_url = str(server.make_url("")).rstrip("/")
+            return await download_multiple_sits_async(
+                gdf,
+                satellite,
+                crs="EPSG:4326",
+                chunksize=2,
+                max_retries_per_chunk=1,
+                adaptive_chunks=False,
+                **kwargs,
+            )
+
+    base_url = ""
+    first = asyncio.run(run())
+    failed_chunk = next(ids for ids in requested if 2 in ids)
+    assert sorted(first.get_column("original_index").to_list()) == sorted(set(range(6)) - set(failed_chunk))
+    states = conn.execute("SELECT state FROM sits_run_chunks").fetchall()
+    assert sorted(states) == [("failed",), ("stored",), ("stored",)]
+
+    broken.clear()
+    requested.clear()
+    resumed = asyncio.run(run(retry_failed_only=True))
+
+    # Only the failed chunk goes back to GEE; the stored ones are read from the cache via the manifest.
+    assert requested == [failed_chunk]
+    assert sorted(resumed.get_column("original_index").to_list()) == list(range(6))
+    assert conn.execute("SELECT COUNT(*) FROM sits_run_chunks").fetchone() == (0,)
+    assert conn.execute("SELECT COUNT(*) FROM sits_run_rows").fetchone() == (0,)
+    conn.close()
+
+
+def test_encode_ee_expression_matches_client_serialization(monkeypatch) -> None:
+    # The algorithm list shipped with earthengine-api lets the graph be built offline;
+    # a live session is left alone, as the client is reset afterwards.
+    from ee import apitestcase
+
+    if ee.data.is_initialized():
+        pytest.skip("Earth Engine is initialized for the live tests")
+    monkeypatch.setattr(ee.data, "_install_cloud_api_resource", lambda: None)
+    monkeypatch.setattr(ee.data, "getAlgorithms", apitestcase.GetAlgorithms)
+    monkeypatch.setattr(ee.deprecation, "_FetchDataCatalogStac", dict)
+    ee.Reset()
+    ee.Initialize(None, "", project="test-project")
+    try:
+        satellite = Sentinel2(bands={"red", "nir"})
+        gdf = gpd.GeoDataFrame(
+            {
+                "original_index": [3, 8],
+                "start_date": pd.to_datetime(["2024-01-01", "2024-02-01"]),
+                "end_date": pd.to_datetime(["2024-01-10", "2024-02-10"]),
+            },
+            geometry=[Point(-46.6, -23.55), box(-46.61, -23.56, -46.59, -23.54)],
+            crs="EPSG:4326",
+        )
+        args = (satellite, {"median"}, 0.5, "original_index")
+
+        expected = ee.serializer.encode(sits_module.build_ee_expression(gdf, *args), for_cloud_api=True)
+        encoded = sits_module.encode_ee_expression(gdf, *args)
+
+        assert ee.serializer.encode(ee.deserializer.decodeCloudApi(encoded), for_cloud_api=True) == expected
+        # The satellite graph is serialized once and shared by later chunks.
+        again = sits_module.encode_ee_expression(gdf.iloc[:1], *args)
+        assert {k: v for k, v in again["values"].items() if k != "features"} == {
+            k: v for k, v in encoded["values"].items() if k != "features"
+        }
+    finally:
+        ee.Reset()